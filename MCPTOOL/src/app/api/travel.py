@@ -1,14 +1,32 @@
 """여행 관련 API 엔드포인트"""
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
-from app.mcp.tourism_tool import search_tourism_keyword, format_tourism_item
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from app.mcp.tourism_tool import (
+    TourismAPIError,
+    fetch_tourism_details,
+    search_tourism_keyword,
+    search_tourism_multi,
+    search_tourism_nearby,
+    format_tourism_item,
+)
 from app.utils.filter import filter_tourism_items, extract_filters_from_query
-from app.llm.rag import get_rag
+from app.utils.query_parser import parse_query
+from app.utils.ranking import rank_items
+from app.utils.resilience import CircuitOpenError
+from app.utils.metrics import begin_request_timing, stage, timings_ms
+from app.utils.startup import startup_state
+from app.utils.route import plan_route, order_course
+from app.utils.config import settings
+from app.llm.rag import get_async_rag
 from app.llm.chain import get_course_generator
-from fastapi.responses import ORJSONResponse
+from app.llm.context import build_course_context, estimate_tokens
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 import asyncio
+import json
+import logging
+import time
 
 
 router = APIRouter(prefix="/travel", tags=["travel"])
@@ -19,6 +37,9 @@ class SearchRequest(BaseModel):
     region: Optional[str] = Field(None, description="지역명 (예: 부산, 서울)")
     keyword: Optional[str] = Field(None, description="검색 키워드")
     num_of_rows: int = Field(10, description="반환 개수")
+    max_distance_km: Optional[float] = Field(None, description="기준점으로부터 최대 이동 거리 (km)")
+    mapx: Optional[float] = Field(None, description="기준점 경도 (없으면 검색 결과 좌표의 중앙값)")
+    mapy: Optional[float] = Field(None, description="기준점 위도")
 
 
 class SearchResponse(BaseModel):
@@ -46,6 +67,24 @@ async def search_tourism(request: SearchRequest):
     MCP Tool을 사용하여 공공데이터포털에서 여행지 정보를 검색합니다.
     """
     try:
+        center = None
+        if request.mapx is not None and request.mapy is not None:
+            center = (request.mapx, request.mapy)
+        
+        # 기준점 반경 검색: 카탈로그에 수집된 지역이면 공간 인덱스로 전체 아이템에서 가까운 순 조회
+        if request.max_distance_km is not None and center is not None:
+            nearby = await search_tourism_nearby(
+                center[0], center[1], request.max_distance_km,
+                region=request.region,
+                keyword=request.keyword,
+                num_of_rows=request.num_of_rows
+            )
+            if nearby is not None:
+                return SearchResponse(
+                    total_count=nearby.get("total_count", 0),
+                    items=[format_tourism_item(item) for item in nearby.get("items", [])]
+                )
+        
         # MCP Tool 호출
         result = await search_tourism_keyword(
             region=request.region,
@@ -56,8 +95,18 @@ async def search_tourism(request: SearchRequest):
         # 아이템 포맷팅
         items = [format_tourism_item(item) for item in result.get("items", [])]
         
+        # 이동 거리 필터링 (카탈로그 밖 지역은 받아온 페이지 안에서만)
+        total_count = result.get("total_count", 0)
+        if request.max_distance_km is not None:
+            items = filter_tourism_items(
+                items,
+                max_distance_km=request.max_distance_km,
+                center=center
+            )
+            total_count = len(items)
+        
         return SearchResponse(
-            total_count=result.get("total_count", 0),
+            total_count=total_count,
             items=items
         )
     
@@ -65,232 +114,220 @@ async def search_tourism(request: SearchRequest):
         raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
 
 
-@router.post("/recommend", response_model=RecommendResponse)
-async def recommend_course(request: RecommendRequest):
+def _plan_searches(parsed: Dict[str, Any]) -> List[Tuple[Optional[str], str]]:
     """
-    AI 여행 코스 추천 API
+    쿼리 해석 결과로 동시 검색할 (지역, 키워드) 조합 생성 (우선순위 순)
     
-    사용자의 자연어 쿼리를 기반으로:
-    1. MCP Tool로 여행지 검색
-    2. 필터링
-    3. RAG 기반 컨텍스트 생성
-    4. LangChain + LLM으로 코스 생성
+    키워드 그룹 → 세부 지역명 순으로 지역마다 조합하고, 매칭된 키워드가 없으면 '관광'으로 검색합니다.
     """
+    regions = parsed["regions"][:settings.tourism_fanout_max_regions]
+    keywords = list(parsed["keywords"][:settings.tourism_fanout_max_keywords])
+    if parsed["sub_area"]:
+        keywords.append(parsed["sub_area"])
+    if not keywords:
+        keywords = ["관광"]
+    
+    return [(region, keyword) for region in regions for keyword in keywords]
+
+
+async def _search_items(parsed: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    추천용 여행지 검색 (지역/키워드 조합 동시 검색 후 병합)
+    
+    키워드 검색 결과가 모두 비었을 때만 지역별 '관광' 검색을 한 번 더 보냅니다.
+    """
+    items = []
+    region = parsed["region"]
+    keyword = parsed["keyword"] or parsed["sub_area"] or "관광"
+    
     try:
-        # 1. 쿼리에서 필터 조건 추출
-        filters = extract_filters_from_query(request.query)
-        
-        #2. 쿼리에서 지역과 키워드 추출 (간단한 휴리스틱)
-        region = None
-        keyword = None
+        if region:
+            searches = _plan_searches(parsed)
+            search_result = await search_tourism_multi(searches, num_of_rows=20)
+            items = search_result.get("items", [])
+            
+            fallback = [(area, "관광") for area in dict.fromkeys(area for area, _ in searches)]
+            if not items and fallback != searches:
+                search_result = await search_tourism_multi(fallback, num_of_rows=20)
+                items = search_result.get("items", [])
         
-        # 지역 추출 (세부 지역 우선 매칭)
-        areas = {
-            # 서울 세부
-            "강남": "서울", "강북": "서울", "홍대": "서울", "이태원": "서울", "명동": "서울",
-            "종로": "서울", "잠실": "서울", "여의도": "서울", "신촌": "서울", "건대": "서울",
-            # 부산 세부
-            "해운대": "부산", "광안리": "부산", "남포동": "부산", "서면": "부산", "태종대": "부산",
-            "기장": "부산", "영도": "부산", "다대포": "부산", "송도": "부산", "용호동": "부산",
-            # 제주 세부
-            "제주시": "제주", "서귀포": "제주", "애월": "제주", "성산": "제주", "중문": "제주",
-            "우도": "제주", "한림": "제주", "표선": "제주",
-            # 경기 세부
-            "수원": "경기", "성남": "경기", "고양": "경기", "용인": "경기", "부천": "경기",
-            "안산": "경기", "남양주": "경기", "안양": "경기", "평택": "경기", "시흥": "경기",
-            "파주": "경기", "의정부": "경기", "김포": "경기", "광명": "경기", "광주": "경기",
-            "군포": "경기", "하남": "경기", "오산": "경기", "양주": "경기", "이천": "경기",
-            "구리": "경기", "안성": "경기", "포천": "경기", "의왕": "경기", "양평": "경기",
-            "가평": "경기", "여주": "경기", "연천": "경기",
-            # 강원 세부
-            "춘천": "강원", "원주": "강원", "강릉": "강원", "동해": "강원", "속초": "강원",
-            "삼척": "강원", "태백": "강원", "평창": "강원", "정선": "강원", "양양": "강원",
-            "고성": "강원", "인제": "강원", "홍천": "강원", "횡성": "강원", "영월": "강원",
-            # 경남 세부
-            "창원": "경남", "김해": "경남", "진주": "경남", "양산": "경남", "거제": "경남",
-            "통영": "경남", "사천": "경남", "밀양": "경남", "함안": "경남", "거창": "경남",
-            "남해": "경남", "하동": "경남", "산청": "경남", "함양": "경남", "고성": "경남",
-            # 경북 세부
-            "포항": "경북", "경주": "경북", "구미": "경북", "안동": "경북", "영주": "경북",
-            "영천": "경북", "상주": "경북", "문경": "경북", "김천": "경북", "경산": "경북",
-            "울진": "경북", "울릉도": "경북", "청송": "경북", "영양": "경북",
-            # 전남 세부
-            "여수": "전남", "순천": "전남", "목포": "전남", "나주": "전남", "광양": "전남",
-            "담양": "전남", "곡성": "전남", "구례": "전남", "보성": "전남", "고흥": "전남",
-            "완도": "전남", "진도": "전남", "신안": "전남", "강진": "전남", "해남": "전남",
-            # 전북 세부
-            "전주": "전북", "익산": "전북", "군산": "전북", "정읍": "전북", "남원": "전북",
-            "김제": "전북", "완주": "전북", "고창": "전북", "부안": "전북", "무주": "전북",
-            # 충남 세부
-            "천안": "충남", "아산": "충남", "서산": "충남", "논산": "충남", "계룡": "충남",
-            "당진": "충남", "공주": "충남", "보령": "충남", "금산": "충남", "태안": "충남",
-            # 충북 세부
-            "청주": "충북", "충주": "충북", "제천": "충북", "단양": "충북", "음성": "충북",
-            "진천": "충북", "괴산": "충북", "증평": "충북",
-        }
-
-        # 광역시
-        main_cities = ["서울", "부산", "제주", "인천", "대전", "대구", "광주", "울산",
-                      "경기", "강원", "충북", "충남", "경북", "경남", "전북", "전남"]
-
-        # 세부 지역 우선 검색
-        for sub_area, main_area in areas.items():
-            if sub_area in request.query:
-                region = main_area
-                keyword = sub_area if sub_area != main_area else keyword
-                break
-
-        # 세부 지역이 없으면 광역 지역 검색
-        if not region:
-            for area in main_cities:
-                if area in request.query:
-                    region = area
-                    break
+        if not items:
+            raise HTTPException(
+                status_code=404,
+                detail=f"'{region or '선택한 지역'}'에서 '{keyword}' 관련 여행지 검색 결과가 없습니다. 다른 지역이나 키워드로 시도해주세요."
+            )
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_msg = str(e)
+        # 에러 로깅 (디버깅용)
+        logging.error(f"여행지 검색 오류: {error_msg}")
         
-        # 키워드 추출 (일반적인 여행 키워드)
-        query_lower = request.query.lower()
-        keyword_candidates = {
-            # 자연/풍경
-            "바다": ["바다", "해수욕장", "해변", "해안", "비치", "오션뷰", "일몰", "낚시"],
-            "산": ["산", "등산", "하이킹", "트레킹", "계곡", "폭포", "숲", "자연"],
-            "공원": ["공원", "정원", "수목원", "식물원", "공원"],
-            "호수": ["호수", "저수지", "강", "물"],
-            # 액티비티
-            "체험": ["체험", "액티비티", "놀이", "테마파크", "워터파크"],
-            "캠핑": ["캠핑", "글램핑", "차박", "오토캠핑"],
-            "스포츠": ["스포츠", "골프", "수영", "서핑", "스키", "보드"],
-            "자전거": ["자전거", "사이클", "자전거길"],
-            # 문화/예술
-            "문화": ["문화", "박물관", "미술관", "갤러리", "전시", "공연"],
-            "역사": ["역사", "유적", "사적", "전통", "한옥", "고택", "사찰", "절"],
-            "예술": ["예술", "공연", "음악", "연극", "영화"],
-            # 음식/카페
-            "맛집": ["맛집", "음식", "레스토랑", "식당", "요리", "미식"],
-            "카페": ["카페", "커피", "디저트", "베이커리", "브런치"],
-            "술": ["술", "바", "와인", "맥주", "포차", "전통주"],
-            # 쇼핑/도심
-            "쇼핑": ["쇼핑", "마켓", "시장", "아울렛", "백화점", "거리"],
-            "야경": ["야경", "야시장", "밤", "나이트", "루프탑"],
-            "도심": ["도심", "시내", "번화가", "중심가"],
-            # 목적별
-            "데이트": ["데이트", "연인", "커플", "로맨틱"],
-            "가족": ["가족", "아이", "어린이", "키즈"],
-            "힐링": ["힐링", "휴양", "쉼", "휴식", "조용한"],
-            "사진": ["사진", "포토존", "인스타", "갬성", "감성"],
-            "드라이브": ["드라이브", "드라이빙", "자동차"],
-            # 계절/시간
-            "봄": ["봄", "벚꽃", "꽃"],
-            "여름": ["여름", "피서", "시원한"],
-            "가을": ["가을", "단풍", "억새"],
-            "겨울": ["겨울", "눈", "스키"],
-            # 숙박/여행 스타일
-            "펜션": ["펜션", "리조트", "호텔", "숙박"],
-            "당일": ["당일", "일일", "하루"],
-            "1박2일": ["1박", "숙박", "여행"],
-        }
-
-        # 키워드 우선순위 매칭 (구체적인 것 우선)
-        matched_keyword = None
-        for key, values in keyword_candidates.items():
-            if any(v in query_lower for v in values):
-                matched_keyword = key
-                # 더 긴 매칭을 찾기 위해 계속 검색
-                if len(values[0]) > 3:  # 구체적인 키워드 우선
-                    keyword = matched_keyword
-                    break
-
-        if not matched_keyword:
-            matched_keyword = keyword
+        # 더 친화적인 에러 메시지 제공 (서킷 open / 일시적 장애는 503)
+        if isinstance(e, CircuitOpenError) or (
+            isinstance(e, TourismAPIError)
+            and (e.retryable or (e.status_code is not None and e.status_code >= 500))
+        ):
+            raise HTTPException(
+                status_code=503,
+                detail=f"공공데이터 API 서버에 일시적인 문제가 발생했습니다. 잠시 후 다시 시도해주세요. (상세: {error_msg[:200]})"
+            )
         else:
-            keyword = matched_keyword
-        
-        # 키워드가 없으면 기본값 사용
-        if not keyword:
-            keyword = "관광"
-        
-        # 3. MCP Tool로 여행지 검색
-        items = []
-        
+            raise HTTPException(
+                status_code=500,
+                detail=f"여행지 검색 중 오류가 발생했습니다: {error_msg}"
+            )
+    
+    return items
+
+
+async def _rank_candidates(
+    items: List[Dict[str, Any]],
+    parsed: Dict[str, Any],
+    query: str
+) -> List[Dict[str, Any]]:
+    """
+    후보 관련도 랭킹 후 상위 settings.rank_top_k개 선택
+    
+    후보가 top_k보다 많을 때만 임베딩 유사도를 계산하고, 임베딩 실패 시 키워드/테마/인기도 점수만 사용합니다.
+    """
+    query_vector = None
+    item_vectors = None
+    if settings.rank_use_embeddings and len(items) > settings.rank_top_k:
+        rag = get_async_rag()
         try:
-            # 지역과 키워드로 검색 시도
-            if region:
-                search_result = await search_tourism_keyword(
-                    region=region,
-                    keyword=keyword,
-                    num_of_rows=20
-                )
-                items = search_result.get("items", [])
-                
-                # 결과가 없으면 키워드 없이 재시도 (지역만으로)
-                if not items:
-                    try:
-                        search_result = await search_tourism_keyword(
-                            region=region,
-                            keyword="관광",
-                            num_of_rows=20
-                        )
-                        items = search_result.get("items", [])
-                    except:
-                        pass
-            
-            if not items:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"'{region or '선택한 지역'}'에서 '{keyword}' 관련 여행지 검색 결과가 없습니다. 다른 지역이나 키워드로 시도해주세요."
-                )
-                
-        except HTTPException:
-            raise
+            query_vector, item_vectors = await asyncio.gather(
+                rag.embed_query(query),
+                rag.embed_items(items)
+            )
         except Exception as e:
-            error_msg = str(e)
-            # 에러 로깅 (디버깅용)
-            import logging
-            logging.error(f"여행지 검색 오류: {error_msg}")
-            
-            # 더 친화적인 에러 메시지 제공
-            if "500" in error_msg or "Internal Server Error" in error_msg:
-                raise HTTPException(
-                    status_code=503,
-                    detail=f"공공데이터 API 서버에 일시적인 문제가 발생했습니다. 잠시 후 다시 시도해주세요. (상세: {error_msg[:200]})"
-                )
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"여행지 검색 중 오류가 발생했습니다: {error_msg}"
-                )
-        
-        # 4. 필터링 적용
+            logging.warning(f"후보 임베딩 실패, 키워드 점수로 랭킹: {str(e)}")
+            query_vector, item_vectors = None, None
+    
+    return rank_items(items, parsed, query_vector=query_vector, item_vectors=item_vectors)
+
+
+async def _select_items(
+    items: List[Dict[str, Any]],
+    filters: Dict[str, Any],
+    parsed: Dict[str, Any],
+    query: str
+) -> List[Dict[str, Any]]:
+    """
+    필터링 후 관련도 상위 후보 선택 (필터링 결과가 없으면 원본 사용)
+    
+    선택된 후보는 동선 순서로 정렬하고, 시간 예산(max_time)을 넘는 곳은 제외합니다.
+    """
+    with stage("filter"):
+        # max_time은 코스 전체 시간 예산이므로 여행지별 체류 시간 필터가 아니라 동선 계획에만 사용
         filtered_items = filter_tourism_items(
             items,
             theme=filters.get("theme"),
-            indoor_outdoor=filters.get("indoor_outdoor"),
-            max_time=filters.get("max_time")
+            indoor_outdoor=filters.get("indoor_outdoor")
         )
+    
+    with stage("rank"):
+        selected = await _rank_candidates(filtered_items or items, parsed, query)
+    with stage("route"):
+        return plan_route(selected, max_time=filters.get("max_time"), min_stops=3)["items"]
+
+
+async def _enrich_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    detailCommon2 개요(overview)를 붙인 아이템 목록 (RAG 문서 및 후보 컨텍스트용)
+    
+    settings.tourism_detail_deadline 안에 조회된 여행지만 보강하고, 조회 실패 시 원본을 그대로 사용합니다.
+    """
+    if not settings.tourism_detail_enabled or not items:
+        return items
+    try:
+        details = await fetch_tourism_details([item.get("contentid") for item in items])
+    except Exception as e:
+        logging.warning(f"상세정보 보강 실패, 기본 문서 사용: {str(e)}")
+        return items
+    
+    enriched = []
+    for item in items:
+        detail = details.get(str(item.get("contentid", "")))
+        if detail and detail.get("overview"):
+            item = {**item, "overview": detail["overview"]}
+        enriched.append(item)
+    return enriched
+
+
+async def _build_context(items: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
+    """
+    RAG 문서 추가 + 코스 생성용 컨텍스트 구성
+    
+    후보 여행지와 RAG 검색 문서를 contentid 기준으로 합치고 settings.context_token_budget 안으로 자릅니다.
+    반환값은 build_course_context 결과에 최종 프롬프트 추정 토큰 수(prompt_tokens)를 더한 딕셔너리입니다.
+    """
+    # 상세 개요로 RAG 문서 보강 (마감 시간 안에 조회된 것만)
+    with stage("enrich"):
+        documents = await _enrich_items(items)
+    
+    # RAG 시스템에 문서 추가 (임베딩은 스레드 풀에서 실행)
+    rag = get_async_rag()
+    with stage("rag_upsert"):
+        await rag.add_tourism_documents(documents)
+    
+    # 쿼리 관련 문서 검색 후 후보와 중복 제거
+    with stage("rag_query"):
+        relevant_docs = await rag.search_relevant_documents(query, n_results=3)
+    with stage("context"):
+        # 후보 블록에도 보강된 개요를 넣음 (겹치는 RAG 문서는 중복으로 제외되므로)
+        built = build_course_context(documents, relevant_docs)
+        prompt = get_course_generator().build_prompt(query, built["context"])
+        built["prompt_tokens"] = estimate_tokens(prompt)
+    logging.info(
+        f"코스 프롬프트 구성: 약 {built['prompt_tokens']}토큰 "
+        f"(컨텍스트 {built['tokens']}토큰, 후보 {built['items']}개, 참고 문서 {built['documents']}개, 제외 {built['dropped']}개)"
+    )
+    return built
+
+
+@router.post("/recommend", response_model=RecommendResponse)
+async def recommend_course(request: RecommendRequest):
+    """
+    AI 여행 코스 추천 API
+    
+    사용자의 자연어 쿼리를 기반으로:
+    1. MCP Tool로 여행지 검색
+    2. 필터링
+    3. RAG 기반 컨텍스트 생성
+    4. LangChain + LLM으로 코스 생성
+    """
+    # 요청 전체 마감 시각 (남은 시간이 LLM 호출 마감으로 전달됨)
+    deadline = asyncio.get_running_loop().time() + settings.recommend_deadline
+    
+    try:
+        # 1. 쿼리 해석 (컴파일된 사전으로 지역/키워드/필터를 한 번에 추출)
+        with stage("parse"):
+            parsed = parse_query(request.query)
+            filters = extract_filters_from_query(request.query, parsed=parsed)
         
-        # 필터링 결과가 없으면 원본 사용
-        if not filtered_items:
-            filtered_items = items[:10]
-        else:
-            filtered_items = filtered_items[:10]
-        
-        # 5. RAG 시스템에 문서 추가
-        rag = get_rag()
-        rag.add_tourism_documents(filtered_items)
+        # 2~3. MCP Tool로 여행지 검색 (지역/키워드 조합 동시 검색)
+        with stage("search"):
+            items = await _search_items(parsed)
         
-        # 6. RAG로 컨텍스트 생성
-        context = rag.get_context_for_course(filtered_items, request.query)
+        # 4. 필터링 + 관련도 랭킹
+        filtered_items = await _select_items(items, filters, parsed, request.query)
         
-        # 여행지 정보도 컨텍스트에 포함
-        course_generator = get_course_generator()
-        items_context = course_generator.format_tourism_items_for_context(filtered_items)
-        full_context = f"{context}\n\n{items_context}"
+        # 5~6. RAG 문서 추가 및 컨텍스트 생성
+        built = await _build_context(filtered_items, request.query)
         
         # 7. LangChain + LLM으로 코스 생성
-        course_result = await course_generator.generate_course(
-            query=request.query,
-            context=full_context,
-            tourism_items=filtered_items
-        )
+        with stage("llm"):
+            course_result = await get_course_generator().generate_course(
+                query=request.query,
+                context=built["context"],
+                tourism_items=filtered_items,
+                deadline=deadline
+            )
+        
+        # 8. 최종 코스를 실제 좌표 기준 동선 순서로 재정렬
+        course_result["course"] = order_course(course_result.get("course", []), filtered_items)
 
         return RecommendResponse(**course_result)
     
@@ -299,3 +336,73 @@ async def recommend_course(request: RecommendRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"코스 추천 중 오류 발생: {str(e)}")
 
+
+def _sse(event: str, data: Any) -> str:
+    """Server-Sent Events 프레임 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/recommend/stream")
+async def recommend_course_stream(request: RecommendRequest):
+    """
+    AI 여행 코스 추천 API (Server-Sent Events 스트리밍)
+    
+    이벤트 종류:
+    - stage: 파이프라인 단계 진행 ({"stage": "parse" | "search" | "filter" | "context" | "generate"})
+    - item: 생성된 코스 아이템 (생성되는 즉시 하나씩)
+    - done: 최종 결과 ({"course": [...], "summary": "...", "timings": {단계: ms}})
+    - error: 오류 ({"status": 코드, "detail": 메시지})
+    """
+    async def event_stream() -> AsyncIterator[str]:
+        deadline = asyncio.get_running_loop().time() + settings.recommend_deadline
+        # 스트리밍 응답은 헤더가 먼저 나가므로 단계별 시간은 done 이벤트에 담아 보냄
+        timings = begin_request_timing()
+        try:
+            yield _sse("stage", {"stage": "parse"})
+            with stage("parse"):
+                parsed = parse_query(request.query)
+                filters = extract_filters_from_query(request.query, parsed=parsed)
+            yield _sse("stage", {
+                "stage": "search",
+                "region": parsed["region"],
+                "keywords": parsed["keywords"]
+            })
+            with stage("search"):
+                items = await _search_items(parsed)
+            
+            yield _sse("stage", {"stage": "filter", "count": len(items)})
+            filtered_items = await _select_items(items, filters, parsed, request.query)
+            
+            yield _sse("stage", {"stage": "context", "count": len(filtered_items)})
+            built = await _build_context(filtered_items, request.query)
+            
+            yield _sse("stage", {"stage": "generate", "prompt_tokens": built["prompt_tokens"]})
+            generate_started = time.perf_counter()
+            async for event in get_course_generator().generate_course_stream(
+                query=request.query,
+                context=built["context"],
+                tourism_items=filtered_items,
+                deadline=deadline
+            ):
+                if event["type"] == "item":
+                    yield _sse("item", event["item"])
+                elif event["type"] == "done":
+                    result = dict(event["result"])
+                    result["course"] = order_course(result.get("course", []), filtered_items)
+                    timings.append(("llm", time.perf_counter() - generate_started))
+                    result["timings"] = timings_ms(timings)
+                    yield _sse("done", result)
+                    startup_state.record_first_success("/travel/recommend/stream")
+                else:
+                    yield _sse("error", {"status": 500, "detail": event["detail"]})
+        
+        except HTTPException as e:
+            yield _sse("error", {"status": e.status_code, "detail": e.detail})
+        except Exception as e:
+            yield _sse("error", {"status": 500, "detail": f"코스 추천 중 오류 발생: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
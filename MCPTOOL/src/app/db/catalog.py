@@ -0,0 +1,247 @@
+"""오프라인 관광지 카탈로그 (SQLite + FTS5)
+
+areaBasedList2로 수집한 관광지 목록을 로컬에 저장하고,
+searchKeyword2와 같은 형태의 결과를 로컬 인덱스에서 바로 반환합니다.
+
+- 3글자 이상 키워드: FTS5 trigram 인덱스(title, addr)로 부분 문자열 검색
+- 2글자 이하 키워드(예: "바다") 또는 trigram 미지원 SQLite: areacode 인덱스 + LIKE 검색
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.utils.config import settings
+from app.utils.geo import GeoIndex
+
+
+_ITEM_COLUMNS = [
+    "contentid", "contenttypeid", "areacode", "sigungucode", "title", "addr1", "addr2",
+    "tel", "mapx", "mapy", "firstimage", "firstimage2", "modifiedtime",
+]
+
+
+class TourismCatalog:
+    """로컬 관광지 카탈로그"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.tourism_catalog_path
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self.fts_enabled = False
+        # 지역 -> (확인 시각, (아이템 수, 최신 modifiedtime), 공간 인덱스)
+        self._geo_indexes: Dict[str, Tuple[float, Tuple[int, Optional[str]], GeoIndex]] = {}
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                " contentid TEXT PRIMARY KEY,"
+                " contenttypeid TEXT, areacode TEXT, sigungucode TEXT,"
+                " title TEXT, addr1 TEXT, addr2 TEXT, tel TEXT,"
+                " mapx TEXT, mapy TEXT, firstimage TEXT, firstimage2 TEXT,"
+                " modifiedtime TEXT, raw TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_area ON items(areacode)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            try:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+                    " contentid UNINDEXED, title, addr, tokenize='trigram')"
+                )
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                # FTS5/trigram 미지원 SQLite 빌드: LIKE 검색으로 대체
+                self.fts_enabled = False
+            self._conn.commit()
+
+    # ==========================
+    # 저장
+    # ==========================
+    def upsert_items(self, items: Iterable[Dict[str, Any]], area_code: Optional[str] = None) -> int:
+        """아이템 저장 (contentid 기준 갱신), 저장한 개수 반환"""
+        rows = []
+        for item in items:
+            contentid = str(item.get("contentid", "") or "")
+            if not contentid:
+                continue
+            values = [str(item.get(col, "") or "") for col in _ITEM_COLUMNS]
+            values[0] = contentid
+            if area_code and not values[2]:
+                values[2] = area_code
+            rows.append(values + [json.dumps(item, ensure_ascii=False)])
+
+        if not rows:
+            return 0
+
+        placeholders = ", ".join("?" for _ in range(len(_ITEM_COLUMNS) + 1))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO items ({', '.join(_ITEM_COLUMNS)}, raw) VALUES ({placeholders})",
+                rows
+            )
+            if self.fts_enabled:
+                ids = [(row[0],) for row in rows]
+                self._conn.executemany("DELETE FROM items_fts WHERE contentid = ?", ids)
+                self._conn.executemany(
+                    "INSERT INTO items_fts (contentid, title, addr) VALUES (?, ?, ?)",
+                    [(row[0], row[4], f"{row[5]} {row[6]}".strip()) for row in rows]
+                )
+            self._conn.commit()
+            self._geo_indexes.clear()
+        return len(rows)
+
+    def get_watermark(self, area_code: str) -> Optional[str]:
+        """지역별 마지막 수집 modifiedtime"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (f"modifiedtime:{area_code}",)
+            ).fetchone()
+        return row["value"] if row else None
+
+    def set_watermark(self, area_code: str, modifiedtime: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (f"modifiedtime:{area_code}", modifiedtime)
+            )
+            self._conn.commit()
+
+    # ==========================
+    # 조회
+    # ==========================
+    def has_area(self, area_code: Optional[str]) -> bool:
+        """해당 지역(없으면 전체) 데이터가 수집되어 있는지 여부"""
+        with self._lock:
+            if area_code:
+                row = self._conn.execute(
+                    "SELECT 1 FROM items WHERE areacode = ? LIMIT 1", (area_code,)
+                ).fetchone()
+            else:
+                row = self._conn.execute("SELECT 1 FROM items LIMIT 1").fetchone()
+        return row is not None
+
+    def search(
+        self,
+        keyword: Optional[str] = None,
+        area_code: Optional[str] = None,
+        num_of_rows: int = 10,
+        page_no: int = 1
+    ) -> Dict[str, Any]:
+        """searchKeyword2와 같은 형태의 결과 반환 (title/주소 부분 일치)"""
+        where = []
+        params: List[Any] = []
+        join = ""
+
+        if keyword:
+            if self.fts_enabled and len(keyword) >= 3:
+                join = "JOIN items_fts f ON f.contentid = i.contentid"
+                where.append("items_fts MATCH ?")
+                params.append('"' + keyword.replace('"', '""') + '"')
+            else:
+                pattern = "%" + keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                where.append("(i.title LIKE ? ESCAPE '\\' OR i.addr1 LIKE ? ESCAPE '\\')")
+                params.extend([pattern, pattern])
+        if area_code:
+            where.append("i.areacode = ?")
+            params.append(area_code)
+
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        offset = max(page_no - 1, 0) * num_of_rows
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM items i {join} {where_sql}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT i.raw FROM items i {join} {where_sql} ORDER BY i.title LIMIT ? OFFSET ?",
+                params + [num_of_rows, offset]
+            ).fetchall()
+
+        return {
+            "total_count": total,
+            "page_no": page_no,
+            "num_of_rows": num_of_rows,
+            "items": [json.loads(row["raw"]) for row in rows]
+        }
+
+    def geo_index(self, area_code: Optional[str] = None) -> GeoIndex:
+        """
+        수집된 아이템 좌표로 만든 공간 인덱스 (지역별로 메모리에 보관)
+
+        수집은 별도 프로세스(app.mcp.ingest)에서 이뤄지므로, settings.tourism_catalog_area_ttl마다
+        지역의 (아이템 수, 최신 modifiedtime)을 다시 확인해 바뀌었으면 인덱스를 다시 만듭니다.
+        """
+        key = area_code or ""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._geo_indexes.get(key)
+            if cached is not None and now - cached[0] < settings.tourism_catalog_area_ttl:
+                return cached[2]
+
+            where, params = ("WHERE areacode = ?", (area_code,)) if area_code else ("", ())
+            count, latest = self._conn.execute(
+                f"SELECT COUNT(*), MAX(modifiedtime) FROM items {where}", params
+            ).fetchone()
+            version = (count, latest)
+            if cached is not None and cached[1] == version:
+                index = cached[2]
+            else:
+                rows = self._conn.execute(f"SELECT raw FROM items {where}", params).fetchall()
+                index = GeoIndex([json.loads(row["raw"]) for row in rows])
+            self._geo_indexes[key] = (now, version, index)
+        return index
+
+    def nearby(
+        self,
+        lon: float,
+        lat: float,
+        radius_km: float,
+        keyword: Optional[str] = None,
+        area_code: Optional[str] = None,
+        num_of_rows: int = 10
+    ) -> Dict[str, Any]:
+        """기준점에서 radius_km 이내 아이템을 가까운 순으로 반환 (keyword는 title/주소 부분 일치)"""
+        index = self.geo_index(area_code)
+        found = index.radius(lon, lat, radius_km)
+        if keyword:
+            needle = keyword.lower()
+            found = [
+                (idx, distance) for idx, distance in found
+                if needle in f"{index.items[idx].get('title', '')} {index.items[idx].get('addr1', '')}".lower()
+            ]
+        return {
+            "total_count": len(found),
+            "page_no": 1,
+            "num_of_rows": num_of_rows,
+            "items": [index.items[idx] for idx, _ in found[:num_of_rows]]
+        }
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_catalog: Optional[TourismCatalog] = None
+
+
+def get_catalog() -> TourismCatalog:
+    """카탈로그 싱글톤 반환"""
+    global _catalog
+    if _catalog is None:
+        _catalog = TourismCatalog()
+    return _catalog
@@ -1,9 +1,21 @@
 """LangChain 기반 여행 코스 생성 체인"""
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from app.utils.config import settings
+from app.utils.resilience import HedgeStats, LatencyWindow, hedged_call
+from app.utils.metrics import (
+    COURSE_SOURCES,
+    LLM_ERRORS,
+    LLM_REQUESTS,
+    LLM_SECONDS,
+    record_llm_usage,
+)
+from app.utils.route import estimate_stay_minutes
+from app.llm.course_cache import CourseCache
+from app.llm.context import format_item_block
+import asyncio
 import json
-import google.generativeai as genai
+import time
 
 
 # ==========================
@@ -22,15 +34,247 @@ class TravelCourse(BaseModel):
     summary: str = Field(description="전체 코스에 대한 간단한 설명")
 
 
+def parse_course_content(content: Optional[str]) -> Dict[str, Any]:
+    """LLM 응답 텍스트(JSON, 코드블럭 포함 가능)를 검증된 TravelCourse 딕셔너리로 변환"""
+    # None 방지
+    if not content:
+        raise ValueError("모델 응답이 비어 있습니다.")
+
+    content = str(content).strip()
+
+    # 코드블럭 제거
+    if "```" in content:
+        part = content.split("```")
+        if len(part) > 1:
+            content = part[1].replace("json", "").strip()
+
+    # JSON 파싱
+    data = json.loads(content)
+
+    # 리스트가 직접 반환된 경우 처리
+    if isinstance(data, list):
+        data = {"course": data, "summary": "여행 코스가 생성되었습니다."}
+
+    # summary 필드가 없는 경우 기본값 추가
+    if "summary" not in data:
+        course_count = len(data.get("course", []))
+        data["summary"] = f"총 {course_count}개의 장소를 둘러보는 여행 코스입니다."
+
+    # Pydantic 검증
+    validated = TravelCourse(**data)
+    return validated.model_dump()
+
+
+class CourseItemStreamParser:
+    """
+    부분 JSON 스트림에서 "course" 배열의 아이템을 완성되는 즉시 꺼내는 증분 파서
+
+    문자열/이스케이프를 추적하며 괄호 깊이를 계산하므로, 청크가 어디서 잘려도 안전합니다.
+    최상위 객체의 "course" 키만 코스 배열로 인정하고(값 문자열이나 중첩 객체 안의 "course"는 무시),
+    parse_course_content처럼 최상위가 배열이면 그 배열 자체를 코스로 봅니다.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0  # 다음에 검사할 위치
+        self._stage = "root"  # root(최상위 시작 전) -> object(최상위 객체) -> course -> done
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string = ""  # 최상위 객체에서 마지막으로 닫힌 문자열 (키 후보)
+        self._expect_course = False  # "course": 다음 값을 기다리는 중
+        self._item_start = -1
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """새 청크를 추가하고 이번에 완성된 아이템 목록 반환"""
+        items: List[Dict[str, Any]] = []
+        if self._stage == "done":
+            return items
+        self._buffer += text
+
+        buffer = self._buffer
+        idx = self._pos
+        while idx < len(buffer) and self._stage != "done":
+            ch = buffer[idx]
+            if self._stage == "root":
+                # 코드블럭 표시 등 최상위 값 앞의 내용은 건너뜀
+                if ch == "{":
+                    self._stage = "object"
+                    self._depth = 1
+                elif ch == "[":
+                    self._stage = "course"
+                    self._depth = 0
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._stage == "object" and self._depth == 1:
+                        self._last_string = buffer[self._string_start:idx + 1]
+            elif self._stage == "object":
+                self._scan_object(ch, idx)
+            else:
+                self._scan_course(ch, idx, items)
+            idx += 1
+
+        self._pos = idx
+        return items
+
+    def _scan_object(self, ch: str, idx: int):
+        """최상위 객체에서 "course" 키의 배열 시작 찾기 (문자열 밖의 문자만 전달됨)"""
+        if ch.isspace():
+            return
+        if self._expect_course:
+            self._expect_course = False
+            if ch == "[" and self._depth == 1:
+                self._stage = "course"
+                self._depth = 0
+                return
+        if ch == '"':
+            self._in_string = True
+            self._string_start = idx
+        elif ch == ":" and self._depth == 1:
+            try:
+                self._expect_course = json.loads(self._last_string) == "course"
+            except json.JSONDecodeError:
+                self._expect_course = False
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                # 최상위 객체가 끝났는데 course 배열이 없음
+                self._stage = "done"
+
+    def _scan_course(self, ch: str, idx: int, items: List[Dict[str, Any]]):
+        """course 배열 안에서 완성된 아이템 객체 추출 (문자열 밖의 문자만 전달됨)"""
+        if ch == '"':
+            self._in_string = True
+        elif ch == "{":
+            if self._depth == 0:
+                self._item_start = idx
+            self._depth += 1
+        elif ch == "}":
+            self._depth -= 1
+            if self._depth == 0 and self._item_start >= 0:
+                try:
+                    item = json.loads(self._buffer[self._item_start:idx + 1])
+                    if isinstance(item, dict):
+                        items.append(item)
+                except json.JSONDecodeError:
+                    pass
+                self._item_start = -1
+        elif ch == "]" and self._depth == 0:
+            # course 배열 종료: 이후 내용은 무시
+            self._stage = "done"
+
+
+# 콘텐츠 타입 코드 -> 장소 유형 (LLM 없이 만드는 대체 코스용)
+CONTENT_TYPE_NAMES: Dict[str, str] = {
+    "12": "관광지",
+    "14": "문화시설",
+    "15": "축제/공연/행사",
+    "25": "여행코스",
+    "28": "레포츠",
+    "32": "숙박",
+    "38": "쇼핑",
+    "39": "음식점",
+}
+
+
+def _format_minutes(minutes: int) -> str:
+    hours, rest = divmod(int(minutes), 60)
+    if hours and rest:
+        return f"{hours}시간 {rest}분"
+    if hours:
+        return f"{hours}시간"
+    return f"{rest}분"
+
+
+def build_fallback_course(items: List[Dict[str, Any]], max_stops: int = 5) -> Dict[str, Any]:
+    """
+    LLM 없이 후보 여행지(랭킹/동선 순서)로 만드는 결정적 코스
+
+    LLM 호출이 마감 시간 안에 끝나지 않거나 실패했을 때 사용합니다. 숙박 시설은 제외합니다.
+    """
+    course = []
+    for item in items:
+        contenttypeid = str(item.get("contenttypeid", "") or "")
+        if contenttypeid == "32":
+            continue
+        type_name = CONTENT_TYPE_NAMES.get(contenttypeid, "관광지")
+        course.append({
+            "name": item.get("title", "") or "이름 없음",
+            "description": f"추천 후보 {type_name}입니다.",
+            "address": item.get("addr1") or item.get("addr2") or "",
+            "type": type_name,
+            "time": _format_minutes(estimate_stay_minutes(item) or 30),
+        })
+        if len(course) >= max_stops:
+            break
+
+    if not course:
+        return {
+            "course": [],
+            "summary": "추천할 수 있는 여행지를 찾지 못했습니다."
+        }
+    return {
+        "course": course,
+        "summary": f"검색된 여행지 중 관련도가 높은 {len(course)}곳을 동선 순서로 둘러보는 코스입니다."
+    }
+
+
+async def _embed_query(text: str):
+    """코스 캐시 의미 유사도 비교용 쿼리 임베딩 (RAG 임베딩 모델 재사용)"""
+    from app.llm.rag import get_async_rag
+    return await get_async_rag().embed_query(text)
+
+
+def _create_model(model_name: str):
+    """settings.llm_backend에 따른 모델 생성 ("fake"면 부하 테스트용 가짜 모델)"""
+    if settings.llm_backend == "fake":
+        from app.llm.fake import FakeGenerativeModel
+        return FakeGenerativeModel(model_name)
+    # google.generativeai는 grpc/protobuf까지 불러오므로 생성기를 만들 때만 import
+    import google.generativeai as genai
+    return genai.GenerativeModel(model_name)
+
+
 # ==========================
 # 코스 생성기
 # ==========================
 class CourseGenerator:
     def __init__(self):
         # Google Gemini 클라이언트 초기화
-        genai.configure(api_key=settings.google_api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        if settings.llm_backend != "fake":
+            import google.generativeai as genai
+            genai.configure(api_key=settings.google_api_key)
+        self.model_name = 'gemini-2.5-flash'
+        self.model = _create_model(self.model_name)
         self.temperature = settings.temperature
+        # SDK 타입(genai.types.GenerationConfig) 대신 같은 필드의 딕셔너리 전달
+        self.generation_config = {"temperature": self.temperature}
+
+        # 마감 시간 내 주 모델이 실패하면 사용할 저렴한 모델 (비어 있으면 바로 결정적 코스)
+        self.fallback_model_name = settings.llm_fallback_model
+        self.fallback_model = (
+            _create_model(self.fallback_model_name) if self.fallback_model_name else None
+        )
+
+        # 헤지 요청 지연 계산용 최근 호출 지연 시간
+        self.latency = LatencyWindow(size=settings.llm_latency_window)
+        self.hedge_stats = HedgeStats()
+
+        # 생성 결과 캐시 (같은 쿼리 + 같은 후보 집합이면 LLM 호출 생략)
+        self.cache = CourseCache(
+            max_size=settings.course_cache_size,
+            ttl=settings.course_cache_ttl,
+            similarity_threshold=settings.course_cache_similarity,
+            embed_fn=_embed_query,
+        )
 
         # 프롬프트 템플릿
         self.prompt_template = """
@@ -45,6 +289,7 @@ class CourseGenerator:
 5. 전체 코스의 총 소요시간은 5시간 내외로 구성
 6. 반드시 course와 summary 필드를 모두 포함해야 함
 7. JSON만 출력 (추가 설명 금지)
+8. 여행지 정보는 이동 동선 순서로 정렬되어 있으므로 가능하면 그 순서대로 방문
 
 출력 형식:
 {{
@@ -69,6 +314,107 @@ class CourseGenerator:
 JSON만 반환하세요.
 """
 
+    def build_prompt(self, query: str, context: str) -> str:
+        """쿼리 + 컨텍스트로 최종 프롬프트 생성"""
+        return self.prompt_template.format(
+            query=query,
+            context=context
+        )
+
+    # ==========================
+    # 여행 코스 생성
+    # ==========================
+    def _hedge_delay(self) -> Optional[float]:
+        """헤지 요청 지연: 최근 호출 지연 시간의 백분위수 (샘플이 적으면 초기값, 0이면 헤지 안 함)"""
+        if settings.llm_hedge_percentile <= 0:
+            return None
+        if len(self.latency) < 20:
+            return settings.llm_hedge_initial_delay
+        return self.latency.percentile(settings.llm_hedge_percentile)
+
+    def _remaining(self, deadline: Optional[float]) -> float:
+        """마감 시각(이벤트 루프 시간)까지 남은 초"""
+        loop = asyncio.get_running_loop()
+        if deadline is None:
+            deadline = loop.time() + settings.llm_deadline
+        return deadline - loop.time()
+
+    async def _call_model(self, model, model_name: str, prompt: str) -> Dict[str, Any]:
+        """모델 1회 호출 + 응답 검증 (성공한 호출의 지연 시간 기록)"""
+        LLM_REQUESTS.inc(model_name, "unary")
+        started = time.perf_counter()
+        try:
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=self.generation_config
+            )
+            record_llm_usage(model_name, response)
+            result = parse_course_content(response.text)
+        except Exception:
+            LLM_ERRORS.inc(model_name, "unary")
+            raise
+        elapsed = time.perf_counter() - started
+        LLM_SECONDS.observe(elapsed, model_name, "unary")
+        if model is self.model:
+            self.latency.observe(elapsed)
+        return result
+
+    async def _generate_within_deadline(
+        self,
+        prompt: str,
+        tourism_items: List[Dict[str, Any]],
+        deadline: Optional[float]
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        마감 시간 안에서 코스 생성
+
+        1. 주 모델 (헤지 요청 포함, 대체 모델 몫 settings.llm_fallback_reserve초를 남긴 시간까지)
+        2. 대체 모델 (남은 시간까지)
+        3. 후보 여행지로 만든 결정적 코스
+
+        Returns:
+            (결과, 생성 경로: "primary" | "fallback_model" | "deterministic")
+        """
+        reserve = settings.llm_fallback_reserve if self.fallback_model is not None else 0.0
+        budget = self._remaining(deadline) - reserve
+        if budget > 0:
+            try:
+                result = await hedged_call(
+                    lambda: self._call_model(self.model, self.model_name, prompt),
+                    hedge_delay=self._hedge_delay(),
+                    timeout=budget,
+                    stats=self.hedge_stats
+                )
+                return result, "primary"
+            except asyncio.TimeoutError:
+                print(f"코스 생성 마감 시간 초과 ({self.model_name}, {budget:.1f}초)")
+            except Exception as e:
+                print(f"코스 생성 오류 ({self.model_name}): {str(e)}")
+
+        return await self._generate_fallback(prompt, tourism_items, deadline)
+
+    async def _generate_fallback(
+        self,
+        prompt: str,
+        tourism_items: List[Dict[str, Any]],
+        deadline: Optional[float]
+    ) -> Tuple[Dict[str, Any], str]:
+        """주 모델 실패 후: 남은 시간 안에 대체 모델, 그래도 안 되면 결정적 코스"""
+        if self.fallback_model is not None:
+            budget = self._remaining(deadline)
+            if budget > 0:
+                try:
+                    result = await asyncio.wait_for(
+                        self._call_model(self.fallback_model, self.fallback_model_name, prompt), timeout=budget
+                    )
+                    return result, "fallback_model"
+                except asyncio.TimeoutError:
+                    print(f"대체 모델 마감 시간 초과 ({self.fallback_model_name})")
+                except Exception as e:
+                    print(f"대체 모델 오류 ({self.fallback_model_name}): {str(e)}")
+
+        return build_fallback_course(tourism_items), "deterministic"
+
     # ==========================
     # 여행 코스 생성
     # ==========================
@@ -76,88 +422,128 @@ JSON만 반환하세요.
         self,
         query: str,
         context: str,
-        tourism_items: List[Dict[str, Any]]
+        tourism_items: List[Dict[str, Any]],
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
+        """
+        코스 생성
 
-        try:
-            # 프롬프트 생성
-            prompt = self.prompt_template.format(
-                query=query,
-                context=context
-            )
+        Args:
+            deadline: 마감 시각 (asyncio 이벤트 루프 시간, 없으면 지금부터 settings.llm_deadline초)
+        """
+        contentids = [str(item.get("contentid", "")) for item in tourism_items]
+        cached = await self.cache.get(query, contentids, self.model_name, self.temperature)
+        if cached is not None:
+            COURSE_SOURCES.inc("cache")
+            return cached
 
-            # Gemini 호출
-            response = await self.model.generate_content_async(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=self.temperature,
-                )
-            )
-            content = response.text
+        # 프롬프트 생성
+        prompt = self.build_prompt(query, context)
 
-            # None 방지
-            if not content:
-                raise ValueError("모델 응답이 비어 있습니다.")
+        result, source = await self._generate_within_deadline(prompt, tourism_items, deadline)
+        COURSE_SOURCES.inc(source)
 
-            content = str(content).strip()
+        # 결정적 대체 코스는 캐시하지 않음 (다음 요청에서 LLM 재시도)
+        if source != "deterministic":
+            await self.cache.set(query, contentids, self.model_name, self.temperature, result)
+        return result
 
-            # 코드블럭 제거
-            if "```" in content:
-                part = content.split("```")
-                if len(part) > 1:
-                    content = part[1].replace("json", "").strip()
+    # ==========================
+    # 여행 코스 스트리밍 생성
+    # ==========================
+    async def generate_course_stream(
+        self,
+        query: str,
+        context: str,
+        tourism_items: List[Dict[str, Any]],
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        코스 아이템을 생성되는 대로 내보내는 스트리밍 버전
 
-            # JSON 파싱
-            data = json.loads(content)
+        첫 응답과 각 청크는 마감 시간(deadline) 안에 도착해야 하며, 아이템을 하나도 내보내기 전에
+        실패하거나 시간이 초과되면 대체 모델/결정적 코스로 대신합니다.
 
-            # 리스트가 직접 반환된 경우 처리
-            if isinstance(data, list):
-                data = {"course": data, "summary": "여행 코스가 생성되었습니다."}
+        Yields:
+            {"type": "item", "item": {...}}  (완성된 코스 아이템마다)
+            {"type": "done", "result": {"course": [...], "summary": "..."}}
+            {"type": "error", "detail": "..."}
+        """
+        contentids = [str(item.get("contentid", "")) for item in tourism_items]
+        cached = await self.cache.get(query, contentids, self.model_name, self.temperature)
+        if cached is not None:
+            COURSE_SOURCES.inc("cache")
+            for course_item in cached.get("course", []):
+                yield {"type": "item", "item": course_item}
+            yield {"type": "done", "result": cached}
+            return
 
-            # summary 필드가 없는 경우 기본값 추가
-            if "summary" not in data:
-                course_count = len(data.get("course", []))
-                data["summary"] = f"총 {course_count}개의 장소를 둘러보는 여행 코스입니다."
+        prompt = self.build_prompt(query, context)
+        emitted = 0
+        started = time.perf_counter()
+        LLM_REQUESTS.inc(self.model_name, "stream")
+        try:
+            response = await asyncio.wait_for(
+                self.model.generate_content_async(
+                    prompt,
+                    generation_config=self.generation_config,
+                    stream=True
+                ),
+                timeout=max(self._remaining(deadline), 0.0)
+            )
+
+            parser = CourseItemStreamParser()
+            chunks = []
+            stream = response.__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        stream.__anext__(), timeout=max(self._remaining(deadline), 0.0)
+                    )
+                except StopAsyncIteration:
+                    break
+                text = getattr(chunk, "text", "") or ""
+                if not text:
+                    continue
+                chunks.append(text)
+                for raw_item in parser.feed(text):
+                    try:
+                        course_item = CourseItem(**raw_item).model_dump()
+                    except Exception:
+                        # 필드가 빠진 아이템은 최종 결과에서만 검증
+                        continue
+                    emitted += 1
+                    yield {"type": "item", "item": course_item}
 
-            # Pydantic 검증
-            validated = TravelCourse(**data)
-            return validated.model_dump()
+            record_llm_usage(self.model_name, response)
+            LLM_SECONDS.observe(time.perf_counter() - started, self.model_name, "stream")
+            result = parse_course_content("".join(chunks))
+            await self.cache.set(query, contentids, self.model_name, self.temperature, result)
+            COURSE_SOURCES.inc("primary")
+            yield {"type": "done", "result": result}
 
         except Exception as e:
-            import traceback
-            error_msg = str(e)
-            print(f"오류 발생: {error_msg}")
-            print(traceback.format_exc())
-            return {
-                "course": [
-                    {
-                        "name": "오류",
-                        "description": f"코스 생성에 실패했습니다: {error_msg}",
-                        "time": "0분"
-                    }
-                ]
-            }
+            LLM_ERRORS.inc(self.model_name, "stream")
+            detail = "마감 시간 초과" if isinstance(e, asyncio.TimeoutError) else str(e)
+            print(f"스트리밍 코스 생성 오류: {detail}")
+            if emitted:
+                # 이미 일부 아이템을 보냈으면 대체 코스로 바꾸지 않음
+                yield {"type": "error", "detail": f"코스 생성에 실패했습니다: {detail}"}
+                return
+
+            result, source = await self._generate_fallback(prompt, tourism_items, deadline)
+            COURSE_SOURCES.inc(source)
+            for course_item in result.get("course", []):
+                yield {"type": "item", "item": course_item}
+            yield {"type": "done", "result": result}
 
     # ==========================
     # 여행지 정보 포맷팅
     # ==========================
     def format_tourism_items_for_context(self, items: List[Dict[str, Any]]) -> str:
-        formatted = []
-
-        for idx, item in enumerate(items[:10], 1):
-            title = item.get("title", "이름 없음") or ""
-            addr = item.get("addr1") or item.get("addr2") or ""
-            tel = item.get("tel", "") or ""
-            ctype = item.get("contenttypeid", "") or ""
-
-            formatted.append(
-                f"{idx}. {title}\n"
-                f"   주소: {addr}\n"
-                f"   전화: {tel}\n"
-                f"   유형: {ctype}"
-            )
-
-        return "\n\n".join(formatted)
+        return "\n\n".join(
+            format_item_block(idx, item) for idx, item in enumerate(items[:10], 1)
+        )
 
 
 # ==========================
@@ -166,6 +552,16 @@ JSON만 반환하세요.
 _course_generator: Optional[CourseGenerator] = None
 
 
+def get_generation_stats() -> Dict[str, Any]:
+    """코스 생성기 통계 (생성기를 아직 만들지 않았으면 빈 딕셔너리)"""
+    if _course_generator is None:
+        return {}
+    return {
+        "cache": _course_generator.cache.stats(),
+        "hedge": _course_generator.hedge_stats.as_dict(),
+    }
+
+
 def get_course_generator() -> CourseGenerator:
     global _course_generator
     if _course_generator is None:
@@ -0,0 +1,127 @@
+"""코스 생성 프롬프트용 컨텍스트 구성
+
+후보 여행지와 RAG 검색 문서를 contentid 기준으로 중복 제거하고,
+우선순위(후보 여행지 → RAG 참고 문서) 순서로 토큰 예산 안에 들어가는 만큼만 담습니다.
+"""
+import math
+import re
+from typing import Any, Dict, List, Optional
+from app.utils.config import settings
+
+
+_HANGUL = re.compile(r"[가-힣ㄱ-ㆎ]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (토크나이저 호출 없이)
+
+    한글은 글자당 약 0.7토큰, 그 외 문자(영문/숫자/기호)는 4글자당 1토큰으로 계산합니다.
+    """
+    if not text:
+        return 0
+    compact = _WHITESPACE.sub(" ", text)
+    hangul = len(_HANGUL.findall(compact))
+    others = len(compact) - hangul
+    return int(math.ceil(hangul * 0.7 + others / 4))
+
+
+def format_item_block(idx: int, item: Dict[str, Any], with_overview: bool = True) -> str:
+    """후보 여행지 한 개 블록 (detailCommon2 개요가 붙어 있으면 설명 줄 추가)"""
+    title = item.get("title", "이름 없음") or ""
+    addr = item.get("addr1") or item.get("addr2") or ""
+    tel = item.get("tel", "") or ""
+    ctype = item.get("contenttypeid", "") or ""
+
+    block = (
+        f"{idx}. {title}\n"
+        f"   주소: {addr}\n"
+        f"   전화: {tel}\n"
+        f"   유형: {ctype}"
+    )
+    overview = (item.get("overview") or "")[:settings.rag_overview_max_chars] if with_overview else ""
+    if overview:
+        block += f"\n   설명: {overview}"
+    return block
+
+
+def build_course_context(
+    items: List[Dict[str, Any]],
+    rag_documents: Optional[List[Dict[str, Any]]] = None,
+    token_budget: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    토큰 예산 안에서 코스 생성 컨텍스트 구성
+
+    Args:
+        items: 후보 여행지 (동선 순서, 이 순서대로 우선, overview가 있으면 예산 안에서 함께 포함)
+        rag_documents: search_relevant_documents 결과 (후보와 contentid가 겹치면 제외)
+        token_budget: 컨텍스트 최대 토큰 수 (기본값: settings.context_token_budget)
+
+    Returns:
+        {
+            "context": 컨텍스트 문자열,
+            "tokens": 추정 토큰 수,
+            "items": 포함된 후보 수,
+            "documents": 포함된 RAG 문서 수,
+            "dropped": 예산 초과/중복으로 제외된 블록 수,
+        }
+    """
+    budget = settings.context_token_budget if token_budget is None else token_budget
+    used = 0
+    dropped = 0
+    seen = set()
+
+    item_blocks: List[str] = []
+    for item in items:
+        contentid = str(item.get("contentid", "") or "")
+        if contentid and contentid in seen:
+            dropped += 1
+            continue
+        block = format_item_block(len(item_blocks) + 1, item)
+        cost = estimate_tokens(block)
+        # 개요까지 넣으면 예산을 넘는 경우 개요 없이 기본 정보만
+        if item.get("overview") and used + cost > budget:
+            block = format_item_block(len(item_blocks) + 1, item, with_overview=False)
+            cost = estimate_tokens(block)
+        # 첫 번째 후보는 예산과 관계없이 포함
+        if item_blocks and used + cost > budget:
+            dropped += 1
+            continue
+        item_blocks.append(block)
+        used += cost
+        if contentid:
+            seen.add(contentid)
+
+    doc_blocks: List[str] = []
+    for doc in rag_documents or []:
+        metadata = doc.get("metadata") or {}
+        contentid = str(metadata.get("contentid", "") or "")
+        text = (doc.get("document") or "").strip()
+        if not text or (contentid and contentid in seen):
+            dropped += 1
+            continue
+        cost = estimate_tokens(text)
+        if used + cost > budget:
+            dropped += 1
+            continue
+        doc_blocks.append(text)
+        used += cost
+        if contentid:
+            seen.add(contentid)
+
+    sections = []
+    if item_blocks:
+        sections.append("\n\n".join(item_blocks))
+    if doc_blocks:
+        sections.append("참고 여행지:\n" + "\n\n".join(doc_blocks))
+    context = "\n\n".join(sections)
+
+    return {
+        "context": context,
+        "tokens": estimate_tokens(context),
+        "items": len(item_blocks),
+        "documents": len(doc_blocks),
+        "dropped": dropped,
+    }
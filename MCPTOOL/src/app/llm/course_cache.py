@@ -0,0 +1,161 @@
+"""생성된 여행 코스 응답 캐시 (정확 일치 + 선택적 의미 유사도)"""
+import copy
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from app.utils.cache import TTLCache
+from app.utils.query_parser import normalize_query
+
+
+# (정규화 쿼리 제외) 후보 집합/모델/온도 구간 -> 같은 그룹 안에서만 의미 유사도 비교
+GroupKey = Tuple[Tuple[str, ...], str, float]
+
+
+def _cosine(a: Any, b: Any) -> float:
+    dot = sum(float(x) * float(y) for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(float(x) * float(x) for x in a))
+    norm_b = math.sqrt(sum(float(y) * float(y) for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class CourseCache:
+    """
+    TravelCourse 결과 캐시
+
+    키: (정규화 쿼리, 정렬된 후보 contentid, 모델명, 온도 구간)
+    - 정확히 같은 키는 TTL + LRU 캐시에서 바로 반환
+    - similarity_threshold > 0 이고 embed_fn이 있으면, 후보 집합/모델/온도 구간이 같은 항목 중
+      쿼리 임베딩 코사인 유사도가 임계값 이상인 결과도 재사용
+    - 저장/반환 모두 복사본을 사용하므로 호출자가 결과를 수정해도 캐시 항목은 그대로 유지
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 1800.0,
+        similarity_threshold: float = 0.0,
+        embed_fn: Optional[Callable[[str], Awaitable[Any]]] = None,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.embed_fn = embed_fn
+        self._exact = TTLCache(max_size=max_size, ttl=ttl, name="course")
+        self._max_size = max_size
+
+        # 정확 키 -> (그룹 키, 쿼리 임베딩)
+        self._vectors: "OrderedDict[Hashable, Tuple[GroupKey, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 정확/의미 조회를 합친 요청 단위 통계 (내부 TTLCache는 의미 조회에서 두 번 조회되므로 따로 셈)
+        self.hits = 0
+        self.misses = 0
+        self.semantic_hits = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        contentids: List[str],
+        model: str,
+        temperature: float
+    ) -> Tuple[str, GroupKey]:
+        """(정규화 쿼리, 그룹 키) 반환"""
+        group: GroupKey = (tuple(sorted(str(cid) for cid in contentids)), model, round(temperature, 1))
+        return normalize_query(query), group
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.similarity_threshold > 0 and self.embed_fn is not None
+
+    async def get(
+        self,
+        query: str,
+        contentids: List[str],
+        model: str,
+        temperature: float
+    ) -> Optional[Dict[str, Any]]:
+        """캐시된 코스 조회 (없으면 None)"""
+        normalized, group = self.make_key(query, contentids, model, temperature)
+        cached = self._exact.get((normalized, group))
+        if cached is None and self.semantic_enabled:
+            cached = await self._semantic_get(normalized, group)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return copy.deepcopy(cached)
+
+    async def _semantic_get(self, normalized: str, group: GroupKey) -> Optional[Dict[str, Any]]:
+        """같은 그룹에서 쿼리 임베딩 유사도가 임계값 이상인 캐시 항목"""
+        with self._lock:
+            candidates = [(key, vector) for key, (g, vector) in self._vectors.items() if g == group]
+        if not candidates:
+            return None
+
+        vector = await self._embed(normalized)
+        if vector is None:
+            return None
+
+        best_key, best_score = None, self.similarity_threshold
+        for key, candidate_vector in candidates:
+            score = _cosine(vector, candidate_vector)
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+
+        result = self._exact.get(best_key)
+        if result is None:
+            # TTL 만료/축출된 항목은 의미 인덱스에서도 제거
+            with self._lock:
+                self._vectors.pop(best_key, None)
+            return None
+        with self._lock:
+            self.semantic_hits += 1
+        return result
+
+    async def set(
+        self,
+        query: str,
+        contentids: List[str],
+        model: str,
+        temperature: float,
+        result: Dict[str, Any]
+    ):
+        """생성된 코스 저장"""
+        normalized, group = self.make_key(query, contentids, model, temperature)
+        key = (normalized, group)
+        self._exact.set(key, copy.deepcopy(result))
+
+        if not self.semantic_enabled:
+            return
+        vector = await self._embed(normalized)
+        if vector is None:
+            return
+        with self._lock:
+            self._vectors[key] = (group, vector)
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self._max_size:
+                self._vectors.popitem(last=False)
+
+    async def _embed(self, text: str) -> Optional[Any]:
+        if self.embed_fn is None:
+            return None
+        try:
+            return await self.embed_fn(text)
+        except Exception as e:
+            print(f"코스 캐시 임베딩 오류: {str(e)}")
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._exact.stats()
+        total = self.hits + self.misses
+        stats.update(
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=(self.hits / total) if total else 0.0,
+        )
+        stats["semantic_hits"] = self.semantic_hits
+        stats["semantic_entries"] = len(self._vectors)
+        return stats
@@ -0,0 +1,145 @@
+"""부하 테스트용 가짜 Gemini 모델 (settings.llm_backend = "fake")
+
+google.generativeai.GenerativeModel의 generate_content_async만 흉내 냅니다.
+네트워크 호출 없이 프롬프트의 후보 여행지로 코스 JSON을 만들어 설정된 지연 후 반환하므로,
+LLM 비용/할당량 없이 서버 전체 처리량을 측정할 수 있습니다.
+"""
+import asyncio
+import json
+import random
+import re
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Union, overload
+from app.utils.config import settings
+from app.llm.context import estimate_tokens
+
+
+_ITEM_LINE = re.compile(r"^\d+\.\s+(.+)$")
+_ADDR_LINE = re.compile(r"^\s*주소:\s*(.*)$")
+
+
+class FakeUsage:
+    """usage_metadata 흉내 (토큰 수는 estimate_tokens 추정값)"""
+
+    def __init__(self, prompt_tokens: int, completion_tokens: int):
+        self.prompt_token_count = prompt_tokens
+        self.candidates_token_count = completion_tokens
+        self.total_token_count = prompt_tokens + completion_tokens
+
+
+class FakeChunk:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeResponse:
+    """단일 응답 (.text, .usage_metadata)"""
+
+    def __init__(self, text: str, usage: FakeUsage):
+        self.text = text
+        self.usage_metadata = usage
+
+
+class FakeStreamResponse:
+    """스트리밍 응답 (청크 사이에 지연을 나눠 넣음, 다 읽은 뒤 usage_metadata 사용 가능)"""
+
+    def __init__(self, text: str, usage: FakeUsage, chunks: int, delay: float):
+        size = max(1, -(-len(text) // max(chunks, 1)))
+        self._chunks = [text[idx:idx + size] for idx in range(0, len(text), size)]
+        self._delay = delay / max(len(self._chunks), 1)
+        self.usage_metadata = usage
+
+    async def _iterate(self) -> AsyncIterator[FakeChunk]:
+        for chunk in self._chunks:
+            await asyncio.sleep(self._delay)
+            yield FakeChunk(chunk)
+
+    def __aiter__(self) -> AsyncIterator[FakeChunk]:
+        return self._iterate()
+
+
+def build_fake_course(prompt: str, max_stops: int = 5) -> Dict[str, Any]:
+    """프롬프트 "여행지 정보:" 아래의 "N. 여행지명 / 주소:" 블록으로 코스 구성 (없으면 고정 코스)"""
+    _, marker, context = prompt.partition("여행지 정보:")
+    course: List[Dict[str, Any]] = []
+    for line in (context if marker else prompt).splitlines():
+        item_match = _ITEM_LINE.match(line)
+        if item_match and len(course) < max_stops:
+            course.append({
+                "name": item_match.group(1).strip(),
+                "description": "부하 테스트용 설명입니다.",
+                "address": "",
+                "type": "관광지",
+                "time": "1시간",
+            })
+            continue
+        addr_match = _ADDR_LINE.match(line)
+        if addr_match and course and not course[-1]["address"]:
+            course[-1]["address"] = addr_match.group(1).strip()
+
+    if not course:
+        course = [
+            {"name": "테스트 장소", "description": "부하 테스트용 설명입니다.", "address": "", "type": "관광지", "time": "1시간"}
+        ]
+    return {
+        "course": course,
+        "summary": f"부하 테스트용 코스입니다 ({len(course)}곳).",
+    }
+
+
+class FakeGenerativeModel:
+    """
+    가짜 GenerativeModel
+
+    지연: 중앙값 settings.fake_llm_delay초의 로그정규 분포 (폭 settings.fake_llm_delay_sigma, 0이면 고정)
+    오류: settings.fake_llm_error_rate 확률로 예외
+    """
+
+    def __init__(self, model_name: str, rng: Optional[random.Random] = None):
+        self.model_name = model_name
+        self._rng = rng or random.Random()
+
+    def _delay(self) -> float:
+        median = max(settings.fake_llm_delay, 0.0)
+        sigma = settings.fake_llm_delay_sigma
+        if sigma <= 0 or median == 0:
+            return median
+        return self._rng.lognormvariate(0.0, sigma) * median
+
+    @overload
+    async def generate_content_async(
+        self,
+        prompt: str,
+        generation_config: Any = None,
+        *,
+        stream: Literal[True]
+    ) -> FakeStreamResponse: ...
+
+    @overload
+    async def generate_content_async(
+        self,
+        prompt: str,
+        generation_config: Any = None,
+        stream: Literal[False] = False
+    ) -> FakeResponse: ...
+
+    async def generate_content_async(
+        self,
+        prompt: str,
+        generation_config: Any = None,
+        stream: bool = False
+    ) -> Union[FakeResponse, FakeStreamResponse]:
+        delay = self._delay()
+        text = json.dumps(build_fake_course(prompt), ensure_ascii=False)
+        usage = FakeUsage(estimate_tokens(prompt), estimate_tokens(text))
+
+        if self._rng.random() < settings.fake_llm_error_rate:
+            await asyncio.sleep(delay)
+            raise RuntimeError(f"가짜 LLM 오류 ({self.model_name})")
+
+        if stream:
+            # 첫 청크까지의 지연은 전체의 1/4, 나머지는 청크 사이에 나눔
+            await asyncio.sleep(delay / 4)
+            return FakeStreamResponse(text, usage, settings.fake_llm_stream_chunks, delay * 3 / 4)
+
+        await asyncio.sleep(delay)
+        return FakeResponse(text, usage)
@@ -1,11 +1,269 @@
 """RAG (Retrieval Augmented Generation) 시스템"""
-import chromadb
-from chromadb.config import Settings as ChromaSettings
-from chromadb.utils import embedding_functions
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from app.utils.config import settings
+from app.utils.query_parser import normalize_query
+import asyncio
+import hashlib
 import os
 import json
+import queue
+import threading
+import time
+
+
+def _document_hash(doc_text: str, metadata: Dict[str, Any]) -> str:
+    """문서 본문 + 메타데이터 해시"""
+    payload = json.dumps([doc_text, metadata], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _build_document(item: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+    """여행지 아이템 -> (contentid, 문서 본문, 메타데이터), contentid가 없으면 None"""
+    contentid = str(item.get("contentid", ""))
+    if not contentid:
+        return None
+    
+    # 문서 생성 (제목, 주소, 설명 등 결합)
+    title = item.get("title", "")
+    addr = item.get("addr1", "") or item.get("addr2", "")
+    tel = item.get("tel", "")
+    
+    doc_text = f"여행지명: {title}\n주소: {addr}\n전화번호: {tel}"
+    
+    # 상세정보(detailCommon2) 개요가 있으면 포함
+    overview = (item.get("overview") or "")[:settings.rag_overview_max_chars]
+    if overview:
+        doc_text += f"\n설명: {overview}"
+    
+    metadata = {
+        "contentid": contentid,
+        "title": title,
+        "contenttypeid": str(item.get("contenttypeid", "")),
+        "addr": addr,
+    }
+    metadata["doc_hash"] = _document_hash(doc_text, metadata)
+    return contentid, doc_text, metadata
+
+
+class _EmbeddingJob:
+    """임베딩 대기 작업 (텍스트 묶음 + 결과 Future)"""
+    __slots__ = ("texts", "future")
+    
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.future: "Future[List[Any]]" = Future()
+
+
+class EmbeddingBatcher:
+    """
+    마이크로 배칭 임베딩 서비스
+    
+    여러 스레드(동시 요청)에서 들어온 임베딩 작업을 최대 max_wait_ms 동안 모아
+    최대 max_batch_size개 텍스트를 한 번의 encode로 처리한 뒤, 결과를 각 호출자에게 나눠 줍니다.
+    encode는 전용 워커 스레드 하나에서만 실행됩니다.
+    
+    close() 이후나 워커 스레드가 죽은 뒤에는 배칭 없이 호출한 스레드에서 직접 encode합니다.
+    """
+    
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], Any],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        result_timeout: Optional[float] = 60.0
+    ):
+        self._encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.result_timeout = result_timeout
+        self._queue: "queue.Queue[Optional[_EmbeddingJob]]" = queue.Queue()
+        # _closed 확인과 큐 투입을 묶어 종료 신호(None) 뒤에 작업이 들어가지 않게 함
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._worker.start()
+        
+        # 통계
+        self.batches = 0
+        self.texts = 0
+    
+    def embed(self, texts: List[str]) -> List[Any]:
+        """
+        텍스트 리스트 임베딩 (배치에 합류하여 결과를 기다림)
+        
+        Raises:
+            concurrent.futures.TimeoutError: result_timeout 안에 배치 결과가 나오지 않은 경우
+        """
+        if not texts:
+            return []
+        job = _EmbeddingJob(list(texts))
+        with self._lock:
+            queued = not self._closed
+            if queued:
+                self._queue.put(job)
+        if not queued:
+            return list(self._encode_fn(job.texts))
+        try:
+            return job.future.result(timeout=self.result_timeout)
+        except FutureTimeoutError:
+            # 아직 encode 전이면 배치에서 빠지도록 취소
+            job.future.cancel()
+            raise
+    
+    def close(self):
+        """워커 종료 (대기 중인 작업은 처리한 뒤 종료, 여러 번 호출해도 됨)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+    
+    def _run(self):
+        batch: List[_EmbeddingJob] = []
+        try:
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                
+                batch = [first]
+                count = len(first.texts)
+                deadline = time.monotonic() + self.max_wait
+                stop = False
+                while count < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        job = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if job is None:
+                        stop = True
+                        break
+                    batch.append(job)
+                    count += len(job.texts)
+                
+                self._encode_batch(batch)
+                batch = []
+                if stop:
+                    return
+        finally:
+            # 정상 종료든 워커 오류든, 이후 호출은 직접 encode하고 남은 작업은 실패 처리
+            with self._lock:
+                self._closed = True
+            self._fail_pending(batch)
+    
+    def _fail_pending(self, batch: List[_EmbeddingJob]):
+        """처리하지 못한 작업의 Future를 실패 처리 (대기 중인 호출자가 영원히 막히지 않도록)"""
+        error = RuntimeError("임베딩 배처가 종료되었습니다")
+        jobs = list(batch)
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                jobs.append(job)
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(error)
+    
+    def _encode_batch(self, batch: List[_EmbeddingJob]):
+        # 기다리다 시간 초과로 취소된 작업은 제외
+        batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        texts = [text for job in batch for text in job.texts]
+        try:
+            vectors = self._encode_fn(texts)
+        except Exception as e:
+            for job in batch:
+                job.future.set_exception(e)
+            return
+        
+        self.batches += 1
+        self.texts += len(texts)
+        
+        offset = 0
+        for job in batch:
+            size = len(job.texts)
+            job.future.set_result(list(vectors[offset:offset + size]))
+            offset += size
+    
+    def stats(self) -> Dict[str, Any]:
+        """배칭 통계"""
+        return {
+            "batches": self.batches,
+            "texts": self.texts,
+            "avg_batch_size": (self.texts / self.batches) if self.batches else 0.0,
+            "queued": self._queue.qsize(),
+        }
+
+
+class QueryEmbeddingCache:
+    """
+    정규화된 쿼리 -> 임베딩 LRU 캐시
+    
+    항목 수(max_entries)와 대략적인 메모리 사용량(max_bytes: 벡터 + 키 바이트) 모두로 크기를 제한합니다.
+    """
+    
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _sizeof(key: str, vector: Any) -> int:
+        nbytes = getattr(vector, "nbytes", None)
+        if nbytes is None:
+            nbytes = len(vector) * 8  # 파이썬 float 리스트
+        return int(nbytes) + len(key.encode("utf-8"))
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def set(self, key: str, vector: Any):
+        size = self._sizeof(key, vector)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._data[key] = (vector, size)
+            self.bytes += size
+            while self._data and (len(self._data) > self.max_entries or self.bytes > self.max_bytes):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+        }
 
 
 class TourismRAG:
@@ -13,6 +271,12 @@ class TourismRAG:
     
     def __init__(self):
         """ChromaDB 초기화"""
+        # chromadb / sentence-transformers(torch)는 import만으로 수 초가 걸리므로
+        # 모듈 로드 시점이 아니라 RAG를 실제로 만들 때 불러옴 (/travel/search만 처리하는 워커는 불필요)
+        import chromadb
+        from chromadb.config import Settings as ChromaSettings
+        from chromadb.utils import embedding_functions
+        
         os.makedirs(settings.chroma_persist_directory, exist_ok=True)
         
         # 임베딩 함수 설정
@@ -32,48 +296,140 @@ class TourismRAG:
             embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
+        
+        # 동시 요청의 임베딩을 묶어서 처리 (Chroma에는 미리 계산한 임베딩 전달)
+        self.embedder = EmbeddingBatcher(
+            self.embedding_function,
+            max_batch_size=settings.embedding_max_batch_size,
+            max_wait_ms=settings.embedding_max_wait_ms,
+            result_timeout=settings.embedding_result_timeout
+        )
+        
+        # 반복 쿼리는 모델 추론 없이 캐시된 임베딩 사용
+        self.query_cache = QueryEmbeddingCache(
+            max_entries=settings.query_embedding_cache_size,
+            max_bytes=settings.query_embedding_cache_max_bytes
+        )
+        
+        # 문서 해시 -> 여행지 임베딩 (후보 랭킹용, 내용이 바뀌면 새 키)
+        self.item_cache = QueryEmbeddingCache(
+            max_entries=settings.item_embedding_cache_size,
+            max_bytes=settings.item_embedding_cache_max_bytes
+        )
+        
+        # 문서 id -> 내용 해시 (변경 없는 문서 재임베딩 방지)
+        self._doc_hashes: Dict[str, str] = {}
+        self._hash_lock = threading.Lock()
     
-    def add_tourism_documents(self, items: List[Dict[str, Any]]):
-        """여행지 정보를 벡터DB에 추가"""
+    def add_tourism_documents(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        여행지 정보를 벡터DB에 추가
+        
+        contentid별 문서 해시를 비교해 새로 생겼거나 내용이 바뀐 문서만 임베딩/저장합니다.
+        
+        Returns:
+            {"written": 저장한 문서 수, "skipped": 변경 없어 건너뛴 문서 수}
+        """
+        stats = {"written": 0, "skipped": 0}
         if not items:
-            return
+            return stats
         
         ids = []
         documents = []
         metadatas = []
         
         for item in items:
-            contentid = str(item.get("contentid", ""))
-            if not contentid:
+            document = _build_document(item)
+            if document is None:
                 continue
-            
-            # 문서 생성 (제목, 주소, 설명 등 결합)
-            title = item.get("title", "")
-            addr = item.get("addr1", "") or item.get("addr2", "")
-            tel = item.get("tel", "")
-            
-            # 상세 설명이 있으면 포함 (추후 상세정보 API 호출 시 활용)
-            doc_text = f"여행지명: {title}\n주소: {addr}\n전화번호: {tel}"
+            contentid, doc_text, metadata = document
             
             ids.append(f"tourism_{contentid}")
             documents.append(doc_text)
-            metadatas.append({
-                "contentid": contentid,
-                "title": title,
-                "contenttypeid": str(item.get("contenttypeid", "")),
-                "addr": addr,
-            })
-        
-        if ids:
+            metadatas.append(metadata)
+        
+        if not ids:
+            return stats
+        
+        # 변경 여부 확인 (메모리 인덱스 → 없으면 Chroma 메타데이터)
+        changed = self._filter_changed(ids, metadatas)
+        stats["skipped"] = len(ids) - len(changed)
+        
+        if changed:
             # 기존 문서가 있으면 업데이트, 없으면 추가
             try:
+                changed_documents = [documents[i] for i in changed]
                 self.collection.upsert(
-                    ids=ids,
-                    documents=documents,
-                    metadatas=metadatas
+                    ids=[ids[i] for i in changed],
+                    documents=changed_documents,
+                    embeddings=self.embedder.embed(changed_documents),
+                    metadatas=[metadatas[i] for i in changed]
                 )
+                with self._hash_lock:
+                    for i in changed:
+                        self._doc_hashes[ids[i]] = metadatas[i]["doc_hash"]
+                stats["written"] = len(changed)
             except Exception as e:
                 print(f"문서 추가 중 오류: {str(e)}")
+        
+        return stats
+    
+    def _filter_changed(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> List[int]:
+        """새 문서이거나 해시가 달라진 문서의 인덱스 목록 반환"""
+        with self._hash_lock:
+            unknown = [doc_id for doc_id in ids if doc_id not in self._doc_hashes]
+        
+        # 재시작 후 등 메모리 인덱스에 없는 id는 Chroma에 저장된 해시로 채움
+        if unknown:
+            try:
+                existing = self.collection.get(ids=unknown, include=["metadatas"])
+                with self._hash_lock:
+                    for doc_id, metadata in zip(existing["ids"], existing["metadatas"] or []):
+                        if metadata and metadata.get("doc_hash"):
+                            self._doc_hashes[doc_id] = metadata["doc_hash"]
+            except Exception as e:
+                print(f"문서 해시 조회 중 오류: {str(e)}")
+        
+        with self._hash_lock:
+            return [
+                i for i, doc_id in enumerate(ids)
+                if self._doc_hashes.get(doc_id) != metadatas[i]["doc_hash"]
+            ]
+    
+    def embed_query(self, query: str) -> Any:
+        """쿼리 임베딩 (정규화된 쿼리 기준 LRU 캐시)"""
+        key = normalize_query(query)
+        vector = self.query_cache.get(key)
+        if vector is None:
+            vector = self.embedder.embed([key])[0]
+            self.query_cache.set(key, vector)
+        return vector
+    
+    def embed_items(self, items: List[Dict[str, Any]]) -> List[Optional[Any]]:
+        """
+        여행지 문서 임베딩 (문서 해시 기준 캐시, 캐시에 없는 것만 한 번에 임베딩)
+        
+        contentid가 없는 아이템 자리는 None입니다.
+        """
+        vectors: List[Optional[Any]] = [None] * len(items)
+        missing: List[Tuple[int, str, str]] = []
+        for idx, item in enumerate(items):
+            document = _build_document(item)
+            if document is None:
+                continue
+            _, doc_text, metadata = document
+            vector = self.item_cache.get(metadata["doc_hash"])
+            if vector is None:
+                missing.append((idx, metadata["doc_hash"], doc_text))
+            else:
+                vectors[idx] = vector
+        
+        if missing:
+            encoded = self.embedder.embed([doc_text for _, _, doc_text in missing])
+            for (idx, doc_hash, _), vector in zip(missing, encoded):
+                self.item_cache.set(doc_hash, vector)
+                vectors[idx] = vector
+        return vectors
     
     def search_relevant_documents(
         self,
@@ -83,7 +439,7 @@ class TourismRAG:
         """쿼리와 관련된 문서 검색"""
         try:
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[self.embed_query(query)],
                 n_results=n_results
             )
             
@@ -127,8 +483,81 @@ class TourismRAG:
         return "\n\n".join(context_parts)
 
 
+class AsyncTourismRAG:
+    """
+    TourismRAG 비동기 파사드
+
+    임베딩 추론과 Chroma I/O는 동기 블로킹 호출이므로, 이벤트 루프를 막지 않도록
+    전용 스레드 풀(최대 settings.rag_max_workers개)에서 실행합니다.
+    TourismRAG 생성(모델 로딩)도 첫 호출 시 스레드 풀에서 수행합니다.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.rag_max_workers,
+            thread_name_prefix="rag"
+        )
+        self._init_lock = threading.Lock()
+    
+    def _get_rag(self) -> TourismRAG:
+        """스레드 풀 내부에서 호출: RAG 인스턴스 생성/반환"""
+        with self._init_lock:
+            return get_rag()
+    
+    async def _run(self, method_name: str, *args, **kwargs):
+        def call():
+            return getattr(self._get_rag(), method_name)(*args, **kwargs)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, call)
+    
+    async def add_tourism_documents(self, items: List[Dict[str, Any]]):
+        """여행지 정보를 벡터DB에 추가 (비동기)"""
+        return await self._run("add_tourism_documents", items)
+    
+    async def search_relevant_documents(
+        self,
+        query: str,
+        n_results: int = 5
+    ) -> List[Dict[str, Any]]:
+        """쿼리와 관련된 문서 검색 (비동기)"""
+        return await self._run("search_relevant_documents", query, n_results=n_results)
+    
+    async def get_context_for_course(self, items: List[Dict[str, Any]], query: str) -> str:
+        """코스 생성용 컨텍스트 생성 (비동기)"""
+        return await self._run("get_context_for_course", items, query)
+    
+    async def embed_query(self, query: str) -> Any:
+        """쿼리 임베딩 (비동기, 캐시 사용)"""
+        return await self._run("embed_query", query)
+    
+    async def embed_items(self, items: List[Dict[str, Any]]) -> List[Optional[Any]]:
+        """여행지 문서 임베딩 (비동기, 캐시 사용)"""
+        return await self._run("embed_items", items)
+    
+    async def warm_up(self) -> Dict[str, Any]:
+        """
+        모델 로딩 + 더미 임베딩 + Chroma 열기 (lifespan 워밍업용)
+        
+        첫 추천 요청이 모델 로딩 시간을 떠안지 않도록 서버 시작 시 미리 실행합니다.
+        """
+        def call() -> Dict[str, Any]:
+            rag = self._get_rag()
+            rag.embedder.embed(["워밍업"])
+            return {"documents": rag.collection.count()}
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, call)
+    
+    def shutdown(self):
+        """스레드 풀 + 임베딩 배처 종료"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        _close_embedder()
+
+
 # 전역 RAG 인스턴스
 _rag_instance: Optional[TourismRAG] = None
+_async_rag_instance: Optional[AsyncTourismRAG] = None
 
 
 def get_rag() -> TourismRAG:
@@ -138,3 +567,37 @@ def get_rag() -> TourismRAG:
         _rag_instance = TourismRAG()
     return _rag_instance
 
+
+def get_rag_stats() -> Dict[str, Any]:
+    """임베딩 배칭/캐시 통계 (RAG를 아직 만들지 않았으면 빈 딕셔너리, 모델을 로드하지 않음)"""
+    if _rag_instance is None:
+        return {}
+    return {
+        "embedder": _rag_instance.embedder.stats(),
+        "query_cache": _rag_instance.query_cache.stats(),
+        "item_cache": _rag_instance.item_cache.stats(),
+    }
+
+
+def get_async_rag() -> AsyncTourismRAG:
+    """비동기 RAG 파사드 싱글톤 반환"""
+    global _async_rag_instance
+    if _async_rag_instance is None:
+        _async_rag_instance = AsyncTourismRAG()
+    return _async_rag_instance
+
+
+def _close_embedder():
+    """RAG 인스턴스가 있으면 임베딩 배처 워커 종료 (모델을 로드하지 않음)"""
+    if _rag_instance is not None:
+        _rag_instance.embedder.close()
+
+
+def shutdown_async_rag():
+    """비동기 RAG 파사드 + 임베딩 배처 종료 (lifespan 종료 시 호출)"""
+    global _async_rag_instance
+    if _async_rag_instance is not None:
+        _async_rag_instance.shutdown()
+        _async_rag_instance = None
+    _close_embedder()
+
@@ -1,20 +1,127 @@
 """FastAPI 메인 애플리케이션"""
-from fastapi import FastAPI
+# 시작 시간 측정 기준이므로 가장 먼저 import
+from app.utils.startup import startup_state
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Tuple
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from app.api import travel
 from app.utils.config import settings
+from app.utils.http_client import init_http_client, close_http_client
+from app.utils.metrics import REGISTRY, begin_request_timing, render_metrics, server_timing_header
+from app.mcp.tourism_tool import (
+    get_detail_stats,
+    get_search_cache_stats,
+    get_search_flight_stats,
+    get_upstream_stats,
+)
+from app.llm.rag import get_async_rag, get_rag_stats, shutdown_async_rag
+from app.llm.chain import get_course_generator, get_generation_stats
+import asyncio
+import time
 import uvicorn
 
 
+_CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _collect_runtime_stats() -> List[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]:
+    """캐시 적중률 / 서킷 브레이커 / 재시도 / 헤지 통계를 조회 시점에 지표로 변환"""
+    detail = get_detail_stats()
+    caches: Dict[str, Dict[str, Any]] = {
+        "tourism_search": get_search_cache_stats(),
+        "tourism_detail": detail["cache"],
+    }
+    rag_stats = get_rag_stats()
+    if rag_stats:
+        caches["query_embedding"] = rag_stats["query_cache"]
+        caches["item_embedding"] = rag_stats["item_cache"]
+    generation_stats = get_generation_stats()
+    if generation_stats:
+        caches["course"] = generation_stats["cache"]
+
+    upstream = get_upstream_stats()
+    flight = get_search_flight_stats()
+    families = [
+        ("cache_hits_total", "counter", "캐시 적중 수",
+         [({"cache": name}, stats["hits"]) for name, stats in caches.items()]),
+        ("cache_misses_total", "counter", "캐시 미스 수",
+         [({"cache": name}, stats["misses"]) for name, stats in caches.items()]),
+        ("cache_hit_ratio", "gauge", "캐시 적중률",
+         [({"cache": name}, stats["hit_ratio"]) for name, stats in caches.items()]),
+        ("cache_entries", "gauge", "캐시 항목 수",
+         [({"cache": name}, stats["size"]) for name, stats in caches.items()]),
+        ("tourism_circuit_state", "gauge", "공공데이터 API 서킷 상태 (0=closed, 1=half_open, 2=open)",
+         [({}, _CIRCUIT_STATES.get(upstream["breaker"]["state"], 0))]),
+        ("tourism_circuit_rejected_total", "counter", "서킷 open으로 생략된 호출 수",
+         [({}, upstream["breaker"]["rejected"])]),
+        ("tourism_retries_total", "counter", "공공데이터 API 재시도 수",
+         [({}, upstream["retry"]["retries"])]),
+        ("tourism_stale_served_total", "counter", "장애 시 만료된 캐시로 응답한 수",
+         [({}, upstream["stale_served"])]),
+        ("tourism_coalesced_total", "counter", "동시 요청 병합으로 생략된 호출 수",
+         [({}, flight["coalesced"])]),
+        ("tourism_detail_total", "counter", "상세정보 보강 결과별 여행지 수",
+         [({"result": result}, detail[result]) for result in ("cached", "fetched", "errors", "late")]),
+    ]
+    if rag_stats:
+        families.append(("embedding_avg_batch_size", "gauge", "임베딩 배치 평균 크기",
+                         [({}, rag_stats["embedder"]["avg_batch_size"])]))
+    if generation_stats:
+        hedge = generation_stats["hedge"]
+        families.append(("llm_hedged_total", "counter", "헤지 지연 후 보낸 추가 요청 수", [({}, hedge["hedged"])]))
+        families.append(("llm_hedge_wins_total", "counter", "헤지 요청이 먼저 끝난 수", [({}, hedge["hedge_wins"])]))
+        families.append(("llm_retries_total", "counter", "앞선 요청이 모두 실패해 다시 보낸 LLM 요청 수", [({}, hedge["retries"])]))
+        families.append(("llm_timeouts_total", "counter", "LLM 마감 시간 초과 수", [({}, hedge["timeouts"])]))
+    return families
+
+
+REGISTRY.register_collector(_collect_runtime_stats)
+REGISTRY.register_collector(startup_state.collect)
+
+
+async def _warm_up_llm():
+    """코스 생성기 생성 (SDK import + 클라이언트 설정은 블로킹이므로 스레드에서)"""
+    loop = asyncio.get_running_loop()
+    generator = await loop.run_in_executor(None, get_course_generator)
+    return {"model": generator.model_name, "backend": settings.llm_backend}
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명주기: 공용 HTTP 클라이언트 열기/닫기, 워밍업, RAG 스레드 풀 정리
 
+    워밍업은 백그라운드에서 실행하므로 /health는 바로 응답하고,
+    /ready는 워밍업이 끝날 때까지 503을 반환합니다 (트래픽은 /ready 기준으로 받을 것).
+    """
+    await init_http_client()
+    steps = {}
+    if settings.warmup_rag:
+        steps["rag"] = get_async_rag().warm_up
+    if settings.warmup_llm:
+        steps["llm"] = _warm_up_llm
+    # 태스크가 실행되기 전에 등록해 두어야 /ready가 워밍업 시작 전에 200을 반환하지 않음
+    startup_state.register(steps)
+    warmup = asyncio.create_task(startup_state.warm_up_all(steps))
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await close_http_client()
+        shutdown_async_rag()
+
+
+startup_state.mark_imported()
 
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="TravelGenie API",
     description="AI 여행 코스 추천 서비스",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -24,8 +131,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+
+
+@app.middleware("http")
+async def server_timing(request: Request, call_next):
+    """요청별 단계 시간을 Server-Timing 헤더로 전달 (프론트엔드에서 단계별 소요 시간 표시용)"""
+    started = time.perf_counter()
+    timings = begin_request_timing()
+    response = await call_next(request)
+    # SSE 스트림은 200 이후에도 error 이벤트로 끝날 수 있으므로 최종 결과 전송 시점에 따로 기록
+    streaming = response.headers.get("content-type", "").startswith("text/event-stream")
+    if response.status_code < 400 and request.url.path.startswith("/travel/") and not streaming:
+        startup_state.record_first_success(request.url.path)
+    response.headers["Server-Timing"] = server_timing_header(timings, total=time.perf_counter() - started)
+    response.headers["Timing-Allow-Origin"] = "*"
+    return response
+
+
 # 라우터 등록
 app.include_router(travel.router)
 
@@ -45,11 +170,26 @@ async def root():
         "endpoints": {
             "search": "/travel/search",
             "recommend": "/travel/recommend",
+            "metrics": "/metrics",
+            "ready": "/ready",
             "docs": "/docs"
         }
     }
 
 
+@app.get("/ready")
+async def ready():
+    """준비 상태 (워밍업 완료 전이나 실패 시 503) + import/워밍업/첫 정상 응답 시간"""
+    snapshot = startup_state.snapshot()
+    return JSONResponse(snapshot, status_code=200 if snapshot["ready"] else 503)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 지표 (텍스트 형식)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.get("/health")
 async def health():
     """헬스 체크"""
@@ -0,0 +1,134 @@
+"""관광지 카탈로그 수집 (areaBasedList2 → 로컬 SQLite)
+
+사용법:
+    python -m app.mcp.ingest                 # 전체 지역 증분 수집 (처음이면 전체 수집)
+    python -m app.mcp.ingest --areas 6 39    # 부산, 제주만
+    python -m app.mcp.ingest --full          # 워터마크 무시하고 전체 재수집
+
+증분 수집은 수정일순(arrange=C, 최신순)으로 페이지를 넘기다가
+지역별로 저장된 마지막 modifiedtime 이하인 아이템을 만나면 멈춥니다.
+"""
+import argparse
+import asyncio
+import math
+import time
+from typing import Any, Dict, List, Optional
+from app.db.catalog import TourismCatalog, get_catalog
+from app.mcp.tourism_tool import fetch_area_based_list
+from app.utils.area_code import AREA_CODES
+from app.utils.http_client import init_http_client, close_http_client
+
+
+async def _full_crawl(
+    catalog: TourismCatalog,
+    area_code: str,
+    num_of_rows: int,
+    window: int
+) -> Dict[str, Any]:
+    """지역 전체 페이지 수집 (window개 페이지씩 동시 요청)"""
+    first = await fetch_area_based_list(area_code, num_of_rows=num_of_rows, page_no=1)
+    items: List[Dict[str, Any]] = list(first.get("items", []))
+    stored = catalog.upsert_items(items, area_code)
+    newest = max((str(item.get("modifiedtime", "")) for item in items), default="")
+
+    last_page = math.ceil(int(first.get("total_count") or 0) / num_of_rows)
+    for batch_start in range(2, last_page + 1, window):
+        pages = range(batch_start, min(batch_start + window, last_page + 1))
+        results = await asyncio.gather(
+            *(fetch_area_based_list(area_code, num_of_rows=num_of_rows, page_no=page) for page in pages)
+        )
+        for result in results:
+            page_items = result.get("items", [])
+            stored += catalog.upsert_items(page_items, area_code)
+            newest = max([newest] + [str(item.get("modifiedtime", "")) for item in page_items])
+
+    return {"stored": stored, "pages": max(last_page, 1), "newest": newest}
+
+
+async def _incremental_crawl(
+    catalog: TourismCatalog,
+    area_code: str,
+    num_of_rows: int,
+    watermark: str
+) -> Dict[str, Any]:
+    """워터마크 이후 수정된 아이템만 수집 (수정일 최신순으로 순차 조회)"""
+    stored = 0
+    newest = watermark
+    page_no = 1
+    while True:
+        result = await fetch_area_based_list(area_code, num_of_rows=num_of_rows, page_no=page_no)
+        page_items = result.get("items", [])
+        fresh = [item for item in page_items if str(item.get("modifiedtime", "")) > watermark]
+        stored += catalog.upsert_items(fresh, area_code)
+        newest = max([newest] + [str(item.get("modifiedtime", "")) for item in fresh])
+
+        # 이 페이지에 워터마크 이하 아이템이 있거나 마지막 페이지면 종료
+        if len(fresh) < len(page_items) or len(page_items) < num_of_rows:
+            break
+        page_no += 1
+
+    return {"stored": stored, "pages": page_no, "newest": newest}
+
+
+async def ingest_area(
+    area_code: str,
+    catalog: Optional[TourismCatalog] = None,
+    num_of_rows: int = 100,
+    window: int = 4,
+    full: bool = False
+) -> Dict[str, Any]:
+    """지역 하나 수집 후 워터마크 갱신"""
+    catalog = catalog or get_catalog()
+    watermark = None if full else catalog.get_watermark(area_code)
+
+    if watermark:
+        result = await _incremental_crawl(catalog, area_code, num_of_rows, watermark)
+    else:
+        result = await _full_crawl(catalog, area_code, num_of_rows, window)
+
+    if result["newest"]:
+        catalog.set_watermark(area_code, result["newest"])
+    result["mode"] = "incremental" if watermark else "full"
+    return result
+
+
+async def run_ingest(
+    area_codes: Optional[List[str]] = None,
+    num_of_rows: int = 100,
+    window: int = 4,
+    full: bool = False
+):
+    """여러 지역 순차 수집 (지역 내부는 페이지 병렬)"""
+    catalog = get_catalog()
+    await init_http_client()
+    try:
+        for area_code in area_codes or list(AREA_CODES.values()):
+            started = time.perf_counter()
+            try:
+                result = await ingest_area(
+                    area_code, catalog, num_of_rows=num_of_rows, window=window, full=full
+                )
+                print(
+                    f"[{area_code}] {result['mode']} 수집 완료: {result['stored']}건 "
+                    f"({result['pages']}페이지, {time.perf_counter() - started:.1f}초)"
+                )
+            except Exception as e:
+                print(f"[{area_code}] 수집 실패: {str(e)}")
+    finally:
+        await close_http_client()
+    print(f"카탈로그 전체 {catalog.count()}건: {catalog.path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관광지 카탈로그 수집")
+    parser.add_argument("--areas", nargs="*", help="지역 코드 목록 (기본값: 전체)")
+    parser.add_argument("--rows", type=int, default=100, help="페이지당 개수")
+    parser.add_argument("--window", type=int, default=4, help="동시 요청 페이지 수 (전체 수집 시)")
+    parser.add_argument("--full", action="store_true", help="워터마크 무시하고 전체 재수집")
+    args = parser.parse_args()
+
+    asyncio.run(run_ingest(args.areas, num_of_rows=args.rows, window=args.window, full=args.full))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp.server.stdio import stdio_server
 from app.mcp.tourism_tool import search_tourism_keyword, format_tourism_item
+from app.utils.http_client import init_http_client, close_http_client
 import asyncio
 import json
 
@@ -85,12 +86,17 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 async def run_mcp_server():
     """MCP 서버 실행"""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    # FastAPI와 동일하게 공용 HTTP 클라이언트를 서버 수명 동안 유지
+    await init_http_client()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        await close_http_client()
 
 
 if __name__ == "__main__":
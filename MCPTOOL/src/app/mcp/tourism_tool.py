@@ -1,9 +1,79 @@
 """공공데이터포털 관광정보 API 연동 MCP Tool"""
+import asyncio
+import html
+import math
+import os
+import re
+import time
 import httpx
-from typing import List, Dict, Optional, Any
+from typing import AsyncGenerator, Callable, List, Dict, Optional, Any, Sequence, Set, Tuple
 from urllib.parse import quote
 from app.utils.config import settings
 from app.utils.area_code import get_area_code, normalize_region
+from app.utils.http_client import get_http_client
+from app.utils.cache import TTLCache
+from app.utils.singleflight import SingleFlight
+from app.utils.resilience import CircuitBreaker, CircuitOpenError, RetryStats, retry_async
+from app.utils.metrics import UPSTREAM_ERRORS, UPSTREAM_REQUESTS, UPSTREAM_SECONDS
+from app.db.catalog import get_catalog
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 / 공공데이터 resultCode
+# (01 APPLICATION_ERROR, 02 DB_ERROR, 04 HTTP_ERROR, 05 SERVICETIMEOUT_ERROR, 99 UNKNOWN_ERROR)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRYABLE_RESULT_CODES = {"01", "02", "04", "05", "99"}
+
+
+class TourismAPIError(Exception):
+    """공공데이터 API 오류 (retryable: 일시적 장애라 재시도할 만한 오류인지)"""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retryable: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+# searchKeyword2 응답 캐시: (areaCode, keyword, pageNo, numOfRows) -> 결과
+_search_cache = TTLCache(
+    max_size=settings.tourism_cache_size,
+    ttl=settings.tourism_cache_ttl,
+    disk_path=settings.tourism_cache_path or None,
+    name="tourism_search",
+    stale_ttl=settings.tourism_cache_stale_ttl,
+)
+
+# 동일 파라미터 동시 호출 병합
+_search_flight = SingleFlight(name="tourism_search")
+
+# detailCommon2 상세정보 캐시: contentid -> {"contentid", "overview", "homepage"}
+# (상세정보는 거의 바뀌지 않으므로 긴 TTL + 디스크 계층으로 재시작 후에도 유지)
+_detail_cache = TTLCache(
+    max_size=settings.tourism_detail_cache_size,
+    ttl=settings.tourism_detail_cache_ttl,
+    disk_path=settings.tourism_detail_cache_path or None,
+    name="tourism_detail",
+)
+_detail_flight = SingleFlight(name="tourism_detail")
+_detail_semaphore: Optional[asyncio.Semaphore] = None
+_detail_stats = {"requested": 0, "cached": 0, "fetched": 0, "errors": 0, "late": 0}
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# 업스트림(apis.data.go.kr) 서킷 브레이커 / 재시도 통계
+_tourism_breaker = CircuitBreaker(
+    name="tourism_api",
+    failure_threshold=settings.tourism_breaker_failure_threshold,
+    reset_timeout=settings.tourism_breaker_reset_timeout,
+)
+_retry_stats = RetryStats()
+_stale_served = 0
+
+# auto 백엔드의 지역별 카탈로그 수집 여부: areaCode -> (확인 시각, 수집 여부)
+# (수집은 별도 프로세스에서 이뤄지므로 tourism_catalog_area_ttl마다 다시 확인)
+_catalog_areas: Dict[str, Tuple[float, bool]] = {}
 
 
 async def search_tourism_keyword(
@@ -11,17 +81,23 @@ async def search_tourism_keyword(
     keyword: Optional[str] = None,
     area_code: Optional[str] = None,
     num_of_rows: int = 10,
-    page_no: int = 1
+    page_no: int = 1,
+    backend: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     한국관광공사 관광정보 키워드 검색
     
+    동일한 (areaCode, keyword, pageNo, numOfRows) 조합은 TTL 캐시에서 바로 반환합니다.
+    업스트림 호출이 실패하면(서킷 open 포함) 만료된 캐시라도 남아 있으면 "stale": True로 표시해 반환합니다.
+    
+    검색 백엔드 (backend, 기본값: settings.tourism_search_backend):
+    - "remote": 공공데이터 API 호출
+    - "local": 오프라인 카탈로그(python -m app.mcp.ingest로 수집)에서 검색
+    - "auto": 해당 지역이 카탈로그에 수집되어 있으면 local, 아니면 remote
+    
     주의: 공공데이터 API가 500 에러를 반환하는 경우, API 키 확인이 필요합니다.
     - 공공데이터포털에서 API 키가 활성화되어 있는지 확인
     - API 키가 올바른 서비스에 연결되어 있는지 확인
-    """
-    """
-    한국관광공사 관광정보 키워드 검색
     
     Args:
         region: 지역명 (예: "부산", "서울")
@@ -29,6 +105,7 @@ async def search_tourism_keyword(
         area_code: 지역 코드 (region이 없을 경우)
         num_of_rows: 반환 개수
         page_no: 페이지 번호
+        backend: 검색 백엔드 ("remote", "local", "auto")
     
     Returns:
         API 응답 결과 딕셔너리
@@ -38,6 +115,509 @@ async def search_tourism_keyword(
         normalized_region = normalize_region(region)
         area_code = get_area_code(normalized_region) if normalized_region else None
     
+    # keyword는 필수일 수 있음 (searchKeyword1 API 특성), 없으면 기본값 사용
+    keyword = keyword or "관광"
+    
+    # 로컬 카탈로그 검색 (인덱스 조회라 캐시 불필요, SQLite 조회는 스레드에서 실행)
+    if await _use_catalog(area_code, backend):
+        return await asyncio.to_thread(
+            _catalog_search,
+            keyword=keyword,
+            area_code=area_code,
+            num_of_rows=num_of_rows,
+            page_no=page_no
+        )
+    
+    # 캐시 조회
+    cache_key = (area_code or "", keyword, page_no, num_of_rows)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        # 호출자가 리스트를 수정해도 캐시가 오염되지 않도록 얕은 복사
+        return {**cached, "items": list(cached["items"])}
+    
+    async def fetch() -> Dict[str, Any]:
+        global _stale_served
+        try:
+            result = await _request_tourism_keyword(
+                keyword=keyword,
+                area_code=area_code,
+                num_of_rows=num_of_rows,
+                page_no=page_no
+            )
+        except Exception as e:
+            # 업스트림 장애: 마지막으로 받은 결과가 있으면 대신 반환
+            stale = _search_cache.get_stale(cache_key)
+            if stale is None:
+                raise
+            _stale_served += 1
+            logger.warning(f"공공데이터 API 실패, 만료된 캐시 반환: {cache_key} ({str(e)[:200]})")
+            return {**stale, "stale": True}
+        _search_cache.set(cache_key, result)
+        return result
+    
+    # 동시에 들어온 동일 요청은 하나의 업스트림 호출을 공유
+    result = await _search_flight.do(cache_key, fetch)
+    return {**result, "items": list(result["items"])}
+
+
+def _catalog_covers(area_code: Optional[str]) -> bool:
+    """카탈로그에 해당 지역이 수집되어 있는지 (카탈로그 파일이 없으면 새로 만들지 않고 False)"""
+    if not os.path.exists(settings.tourism_catalog_path):
+        return False
+    return get_catalog().has_area(area_code)
+
+
+def _catalog_search(**kwargs: Any) -> Dict[str, Any]:
+    return get_catalog().search(**kwargs)
+
+
+def _catalog_nearby(**kwargs: Any) -> Dict[str, Any]:
+    return get_catalog().nearby(**kwargs)
+
+
+async def _use_catalog(area_code: Optional[str], backend: Optional[str] = None) -> bool:
+    """검색 백엔드 설정과 지역별 수집 여부(캐시)로 로컬 카탈로그 사용 여부 결정"""
+    backend = backend or settings.tourism_search_backend
+    if backend == "remote":
+        return False
+    if backend == "local":
+        return True
+    
+    key = area_code or ""
+    now = time.monotonic()
+    cached = _catalog_areas.get(key)
+    if cached is not None and now - cached[0] < settings.tourism_catalog_area_ttl:
+        return cached[1]
+    covered = await asyncio.to_thread(_catalog_covers, area_code)
+    _catalog_areas[key] = (now, covered)
+    return covered
+
+
+async def search_tourism_nearby(
+    lon: float,
+    lat: float,
+    radius_km: float,
+    region: Optional[str] = None,
+    keyword: Optional[str] = None,
+    num_of_rows: int = 10,
+    backend: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    기준점 반경 검색 (가까운 순)
+    
+    해당 지역이 카탈로그에 수집되어 있으면 카탈로그 전체에 대해 공간 인덱스로 조회하고,
+    아니면 None을 반환합니다 (호출자가 검색 결과 페이지를 직접 거리로 필터링).
+    """
+    normalized_region = normalize_region(region) if region else None
+    area_code = get_area_code(normalized_region) if normalized_region else None
+    if not await _use_catalog(area_code, backend):
+        return None
+    return await asyncio.to_thread(
+        _catalog_nearby,
+        lon=lon,
+        lat=lat,
+        radius_km=radius_km,
+        keyword=keyword,
+        area_code=area_code,
+        num_of_rows=num_of_rows
+    )
+
+
+async def search_tourism_multi(
+    searches: Sequence[Tuple[Optional[str], Optional[str]]],
+    num_of_rows: int = 20,
+    max_concurrency: Optional[int] = None,
+    rrf_k: int = 60
+) -> Dict[str, Any]:
+    """
+    여러 (지역, 키워드) 조합을 동시에 검색하고 contentid 기준으로 병합
+    
+    각 검색은 search_tourism_keyword(캐시/병합 적용)를 거치며, 동시 실행 수는 max_concurrency로 제한합니다.
+    병합 순위는 가중 Reciprocal Rank Fusion: 앞에 있는 검색일수록 가중치가 높고
+    (weight = 1 / (1 + 검색 순번)), 여러 검색에 나온 아이템일수록 점수가 누적됩니다.
+    
+    Args:
+        searches: (region, keyword) 리스트 (우선순위 순)
+        num_of_rows: 검색당 반환 개수
+        max_concurrency: 동시 호출 상한 (기본값: settings.tourism_fanout_concurrency)
+        rrf_k: RRF 평활 상수
+    
+    Returns:
+        {"total_count": 병합 후 개수, "items": [...], "sources": [검색별 결과 개수/오류]}
+    
+    Raises:
+        Exception: 모든 검색이 실패한 경우 첫 번째 오류
+    """
+    # 중복 조합 제거 (순서 유지)
+    unique_searches = list(dict.fromkeys(searches))
+    semaphore = asyncio.Semaphore(max_concurrency or settings.tourism_fanout_concurrency)
+    
+    async def run(region: Optional[str], keyword: Optional[str]) -> Dict[str, Any]:
+        async with semaphore:
+            return await search_tourism_keyword(
+                region=region,
+                keyword=keyword,
+                num_of_rows=num_of_rows
+            )
+    
+    results = await asyncio.gather(
+        *(run(region, keyword) for region, keyword in unique_searches),
+        return_exceptions=True
+    )
+    
+    scores: Dict[str, float] = {}
+    merged: Dict[str, Dict[str, Any]] = {}
+    sources = []
+    errors = []
+    
+    for source_idx, ((region, keyword), result) in enumerate(zip(unique_searches, results)):
+        if isinstance(result, BaseException):
+            errors.append(result)
+            sources.append({"region": region, "keyword": keyword, "count": 0, "error": str(result)})
+            continue
+        
+        items = result.get("items", [])
+        sources.append({"region": region, "keyword": keyword, "count": len(items)})
+        weight = 1.0 / (1 + source_idx)
+        for rank, item in enumerate(items):
+            contentid = str(item.get("contentid", ""))
+            if not contentid:
+                continue
+            scores[contentid] = scores.get(contentid, 0.0) + weight / (rrf_k + rank + 1)
+            merged.setdefault(contentid, item)
+    
+    if errors and len(errors) == len(unique_searches):
+        raise errors[0]
+    
+    ordered = sorted(merged, key=lambda cid: scores[cid], reverse=True)
+    return {
+        "total_count": len(ordered),
+        "items": [merged[cid] for cid in ordered],
+        "sources": sources
+    }
+
+
+async def iter_tourism_pages(
+    region: Optional[str] = None,
+    keyword: Optional[str] = None,
+    area_code: Optional[str] = None,
+    num_of_rows: int = 100,
+    window: Optional[int] = None,
+    max_pages: Optional[int] = None
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    검색 결과 전체 페이지를 스트리밍하는 비동기 제너레이터
+    
+    1페이지의 totalCount로 마지막 페이지를 계산한 뒤, 최대 window개 페이지를 동시에 요청하고
+    도착하는 순서대로 아이템을 내보냅니다 (페이지 순서는 보장하지 않음).
+    소비자가 중간에 멈추면(break / aclose) 남은 요청은 취소됩니다.
+    
+    Args:
+        region: 지역명
+        keyword: 검색 키워드
+        area_code: 지역 코드
+        num_of_rows: 페이지당 개수
+        window: 동시 요청 페이지 수 (기본값: settings.tourism_page_window)
+        max_pages: 최대 페이지 수 (None이면 totalCount까지)
+    
+    Yields:
+        원본 아이템 딕셔너리
+    """
+    async def fetch(page_no: int) -> Dict[str, Any]:
+        return await search_tourism_keyword(
+            region=region,
+            keyword=keyword,
+            area_code=area_code,
+            num_of_rows=num_of_rows,
+            page_no=page_no
+        )
+    
+    first = await fetch(1)
+    for item in first.get("items", []):
+        yield item
+    
+    total_count = int(first.get("total_count") or 0)
+    last_page = math.ceil(total_count / num_of_rows) if num_of_rows else 1
+    if max_pages is not None:
+        last_page = min(last_page, max_pages)
+    
+    window = window or settings.tourism_page_window
+    next_page = 2
+    pending: Set["asyncio.Task[Dict[str, Any]]"] = set()
+    try:
+        while next_page <= last_page or pending:
+            while next_page <= last_page and len(pending) < window:
+                pending.add(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+            
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                for item in task.result().get("items", []):
+                    yield item
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def collect_tourism_items(
+    limit: int,
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    **search_kwargs: Any
+) -> List[Dict[str, Any]]:
+    """
+    조건(predicate)을 통과한 아이템을 limit개 모을 때까지만 페이지를 가져옴
+    
+    예: await collect_tourism_items(50, predicate=lambda item: item.get("firstimage"), region="부산")
+    """
+    collected: List[Dict[str, Any]] = []
+    pages = iter_tourism_pages(**search_kwargs)
+    try:
+        async for item in pages:
+            if predicate is None or predicate(item):
+                collected.append(item)
+                if len(collected) >= limit:
+                    break
+    finally:
+        await pages.aclose()
+    return collected
+
+
+def get_search_cache_stats() -> Dict[str, Any]:
+    """검색 캐시 hit/miss 통계"""
+    return _search_cache.stats()
+
+
+def get_search_flight_stats() -> Dict[str, Any]:
+    """동시 요청 병합 통계"""
+    return _search_flight.stats()
+
+
+def get_upstream_stats() -> Dict[str, Any]:
+    """공공데이터 API 서킷 브레이커 / 재시도 / 만료 캐시 반환 통계"""
+    return {
+        "breaker": _tourism_breaker.stats(),
+        "retry": _retry_stats.as_dict(),
+        "stale_served": _stale_served,
+    }
+
+
+async def _request_tourism_keyword(
+    keyword: str,
+    area_code: Optional[str],
+    num_of_rows: int,
+    page_no: int
+) -> Dict[str, Any]:
+    """searchKeyword2 실제 API 호출 (캐시 미적용)"""
+    extra_params: Dict[str, Any] = {"keyword": keyword}
+    if area_code:
+        extra_params["areaCode"] = area_code
+    
+    return await _request_tourism_api(
+        settings.tourism_api_url,
+        extra_params,
+        num_of_rows=num_of_rows,
+        page_no=page_no
+    )
+
+
+async def fetch_area_based_list(
+    area_code: str,
+    num_of_rows: int = 100,
+    page_no: int = 1,
+    arrange: str = "C"
+) -> Dict[str, Any]:
+    """
+    areaBasedList2 호출 (지역 전체 목록, 캐시 미적용)
+    
+    Args:
+        area_code: 지역 코드
+        num_of_rows: 페이지당 개수
+        page_no: 페이지 번호
+        arrange: 정렬 (A=제목순, C=수정일순, D=생성일순)
+    """
+    return await _request_tourism_api(
+        settings.tourism_area_list_url,
+        {"areaCode": area_code, "arrange": arrange},
+        num_of_rows=num_of_rows,
+        page_no=page_no
+    )
+
+
+def _clean_text(text: Any) -> str:
+    """상세정보 텍스트 정리 (<br> 등 HTML 태그/엔티티 제거, 공백 정리)"""
+    return " ".join(html.unescape(_HTML_TAG.sub(" ", str(text or ""))).split())
+
+
+def _get_detail_semaphore() -> asyncio.Semaphore:
+    global _detail_semaphore
+    if _detail_semaphore is None:
+        _detail_semaphore = asyncio.Semaphore(settings.tourism_detail_concurrency)
+    return _detail_semaphore
+
+
+async def _request_tourism_detail(contentid: str) -> Dict[str, Any]:
+    """detailCommon2 실제 API 호출 (캐시 미적용), 보강에 쓰는 필드만 정리해서 반환"""
+    result = await _request_tourism_api(
+        settings.tourism_detail_url,
+        {"contentId": contentid},
+        num_of_rows=1,
+        page_no=1
+    )
+    items = result.get("items") or []
+    item = items[0] if items else {}
+    return {
+        "contentid": contentid,
+        "overview": _clean_text(item.get("overview")),
+        "homepage": _clean_text(item.get("homepage")),
+    }
+
+
+async def fetch_tourism_detail(contentid: str) -> Dict[str, Any]:
+    """
+    여행지 상세정보(개요) 조회
+    
+    캐시 → 동시 동일 요청 병합 → detailCommon2 순서로 조회하며,
+    실제 업스트림 호출은 프로세스 전체에서 settings.tourism_detail_concurrency개로 제한합니다.
+    개요가 없는 여행지도 빈 문자열로 캐시해 다시 조회하지 않습니다.
+    """
+    cached = _detail_cache.get(contentid)
+    if cached is not None:
+        return cached
+    return await _fetch_detail_uncached(contentid)
+
+
+async def _fetch_detail_uncached(contentid: str) -> Dict[str, Any]:
+    """캐시 조회 없이 상세정보 조회 (동시 동일 요청 병합 + 동시 호출 수 제한 + 캐시 저장)"""
+    async def fetch() -> Dict[str, Any]:
+        async with _get_detail_semaphore():
+            detail = await _request_tourism_detail(contentid)
+        _detail_cache.set(contentid, detail)
+        return detail
+    
+    return await _detail_flight.do(contentid, fetch)
+
+
+def _consume_late_detail(task: "asyncio.Task[Any]"):
+    if not task.cancelled() and task.exception() is not None:
+        _detail_stats["errors"] += 1
+
+
+async def fetch_tourism_details(
+    contentids: List[Any],
+    timeout: Optional[float] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 여행지 상세정보를 동시에 조회 (응답을 막지 않도록 마감 시간 적용)
+    
+    timeout초(기본값: settings.tourism_detail_deadline) 안에 끝난 조회만 반환합니다.
+    늦은 조회는 취소하지 않고 끝까지 진행해 캐시만 채우므로 다음 요청부터 바로 사용됩니다.
+    실패한 여행지는 결과에서 빠집니다.
+    
+    Returns:
+        contentid -> {"contentid", "overview", "homepage"}
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+    for contentid in dict.fromkeys(str(cid) for cid in contentids if cid):
+        cached = _detail_cache.get(contentid)
+        if cached is not None:
+            results[contentid] = cached
+        else:
+            missing.append(contentid)
+    _detail_stats["requested"] += len(results) + len(missing)
+    _detail_stats["cached"] += len(results)
+    if not missing:
+        return results
+    
+    tasks = {asyncio.ensure_future(_fetch_detail_uncached(contentid)): contentid for contentid in missing}
+    timeout = settings.tourism_detail_deadline if timeout is None else timeout
+    done, pending = await asyncio.wait(tasks, timeout=max(timeout, 0.0))
+    
+    for task in done:
+        error = task.exception()
+        if error is not None:
+            _detail_stats["errors"] += 1
+            logger.debug(f"상세정보 조회 실패 ({tasks[task]}): {str(error)[:200]}")
+            continue
+        results[tasks[task]] = task.result()
+        _detail_stats["fetched"] += 1
+    
+    for task in pending:
+        _detail_stats["late"] += 1
+        task.add_done_callback(_consume_late_detail)
+    
+    return results
+
+
+def get_detail_stats() -> Dict[str, Any]:
+    """상세정보 보강 통계 (캐시 포함)"""
+    return {**_detail_stats, "cache": _detail_cache.stats(), "flight": _detail_flight.stats()}
+
+
+def _is_retryable(error: BaseException) -> bool:
+    return isinstance(error, TourismAPIError) and error.retryable
+
+
+async def _request_tourism_api(
+    url: str,
+    extra_params: Dict[str, Any],
+    num_of_rows: int,
+    page_no: int
+) -> Dict[str, Any]:
+    """
+    KorService2 호출 (서킷 브레이커 + 재시도)
+    
+    재시도 가능한 오류(타임아웃/연결 오류, 5xx, 일시적 resultCode)만 지터가 섞인 지수 백오프로 재시도하고,
+    서킷이 열려 있으면 업스트림을 호출하지 않고 CircuitOpenError를 바로 발생시킵니다.
+    각 시도는 settings.tourism_request_deadline에서 남은 시간 안에 끝나야 하며, 넘기면 취소 후
+    재시도 가능한 TourismAPIError를 발생시킵니다.
+    """
+    endpoint = url.rstrip("/").rsplit("/", 1)[-1]
+    
+    async def call() -> Dict[str, Any]:
+        UPSTREAM_REQUESTS.inc(endpoint)
+        started = time.perf_counter()
+        try:
+            return await _call_tourism_api(url, extra_params, num_of_rows, page_no)
+        except Exception as e:
+            UPSTREAM_ERRORS.inc(endpoint, "retryable" if _is_retryable(e) else "fatal")
+            raise
+        finally:
+            UPSTREAM_SECONDS.observe(time.perf_counter() - started, endpoint)
+    
+    async def attempt() -> Dict[str, Any]:
+        try:
+            return await _tourism_breaker.call(call, is_failure=_is_retryable)
+        except CircuitOpenError:
+            UPSTREAM_ERRORS.inc(endpoint, "circuit_open")
+            raise
+    
+    try:
+        return await retry_async(
+            attempt,
+            is_retryable=_is_retryable,
+            attempts=settings.tourism_retry_attempts,
+            base_delay=settings.tourism_retry_base_delay,
+            max_delay=settings.tourism_retry_max_delay,
+            deadline=settings.tourism_request_deadline,
+            stats=_retry_stats
+        )
+    except asyncio.TimeoutError:
+        # 진행 중이던 시도는 취소됨 (connect/read 타임아웃보다 전체 마감이 우선)
+        UPSTREAM_ERRORS.inc(endpoint, "deadline")
+        raise TourismAPIError(
+            f"API 요청 실패: 재시도 포함 마감 시간 {settings.tourism_request_deadline:g}초 초과",
+            retryable=True
+        )
+
+
+async def _call_tourism_api(
+    url: str,
+    extra_params: Dict[str, Any],
+    num_of_rows: int,
+    page_no: int
+) -> Dict[str, Any]:
+    """KorService2 공통 호출 및 응답 파싱 (1회)"""
     # API 파라미터 설정
     # serviceKey는 URL 인코딩이 필요할 수 있음 (공공데이터 API 요구사항)
     service_key = settings.tourism_api_key
@@ -53,104 +633,115 @@ async def search_tourism_keyword(
         "MobileApp": "TravelGenie",
         "_type": "json",
     }
-    
-    # keyword는 필수일 수 있음 (searchKeyword1 API 특성)
-    if keyword:
-        params["keyword"] = keyword
-    else:
-        # keyword가 없으면 기본값 사용
-        params["keyword"] = "관광"
-    
-    if area_code:
-        params["areaCode"] = area_code
+    params.update(extra_params)
     
     # API 요청
     try:
-        # 요청 URL 생성 (디버깅용)
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # 요청 정보 로깅 (serviceKey는 마스킹)
         debug_params = params.copy()
         if "serviceKey" in debug_params:
             debug_params["serviceKey"] = f"{debug_params['serviceKey'][:10]}...{debug_params['serviceKey'][-10:]}"
-        logger.debug(f"공공데이터 API 요청: {settings.tourism_api_url}, 파라미터: {debug_params}")
+        logger.debug(f"공공데이터 API 요청: {url}, 파라미터: {debug_params}")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(settings.tourism_api_url, params=params)
-            
-            # 응답 본문 확인
-            response_text = response.text
-            
-            # XML 응답인 경우 처리 (공공데이터 API는 때때로 XML로 에러 반환)
-            if response_text.strip().startswith('<?xml') or response_text.strip().startswith('<'):
-                # XML 파싱 시도
-                import xml.etree.ElementTree as ET
-                try:
-                    root = ET.fromstring(response_text)
-                    error_msg = ""
-                    for elem in root.iter():
-                        if elem.tag in ['resultMsg', 'resultCode', 'message']:
-                            error_msg += f"{elem.tag}: {elem.text} "
-                    if error_msg:
-                        raise Exception(f"API XML 에러 응답: {error_msg.strip()}")
-                except ET.ParseError:
-                    pass
-            
+        # 공용 커넥션 풀 클라이언트 사용 (keep-alive 재사용)
+        client = get_http_client()
+        response = await client.get(url, params=params)
+        
+        # 응답 본문 확인
+        response_text = response.text
+        
+        # XML 응답인 경우 처리 (공공데이터 API는 때때로 XML로 에러 반환)
+        if response_text.strip().startswith('<?xml') or response_text.strip().startswith('<'):
+            # XML 파싱 시도
+            import xml.etree.ElementTree as ET
             try:
-                data = response.json()
-            except Exception as json_error:
-                # JSON 파싱 실패 시 텍스트 응답 확인
-                text_response = response_text[:500]  # 처음 500자만
-                raise Exception(f"API 응답 파싱 실패 (Status: {response.status_code}): {text_response}")
+                root = ET.fromstring(response_text)
+                error_msg = ""
+                xml_code = ""
+                for elem in root.iter():
+                    # <response><header> 형식과 게이트웨이 <OpenAPI_ServiceResponse><cmmMsgHeader> 형식 모두 처리
+                    if elem.tag in ['resultMsg', 'resultCode', 'message', 'errMsg', 'returnAuthMsg', 'returnReasonCode']:
+                        error_msg += f"{elem.tag}: {elem.text} "
+                    if elem.tag in ['resultCode', 'returnReasonCode']:
+                        xml_code = (elem.text or "").strip()
+                if error_msg:
+                    raise TourismAPIError(
+                        f"API XML 에러 응답: {error_msg.strip()}",
+                        status_code=response.status_code,
+                        retryable=(
+                            xml_code in RETRYABLE_RESULT_CODES
+                            or response.status_code in RETRYABLE_STATUS_CODES
+                        )
+                    )
+            except ET.ParseError:
+                pass
+        
+        try:
+            data = response.json()
+        except Exception as json_error:
+            # JSON 파싱 실패 시 텍스트 응답 확인
+            text_response = response_text[:500]  # 처음 500자만
+            raise TourismAPIError(
+                f"API 응답 파싱 실패 (Status: {response.status_code}): {text_response}",
+                status_code=response.status_code,
+                retryable=response.status_code >= 500 or response.status_code in RETRYABLE_STATUS_CODES
+            )
+        
+        # 에러 응답 확인
+        if response.status_code != 200:
+            error_msg = data.get("response", {}).get("header", {}).get("resultMsg", "")
+            error_code = data.get("response", {}).get("header", {}).get("resultCode", "")
+            raise TourismAPIError(
+                f"API 오류 (Code: {error_code}, Status: {response.status_code}): {error_msg}",
+                status_code=response.status_code,
+                retryable=response.status_code in RETRYABLE_STATUS_CODES
+            )
+        
+        # 응답 구조 파싱
+        if "response" in data:
+            header = data["response"].get("header", {})
+            result_code = header.get("resultCode", "")
             
-            # 에러 응답 확인
-            if response.status_code != 200:
-                error_msg = data.get("response", {}).get("header", {}).get("resultMsg", "")
-                error_code = data.get("response", {}).get("header", {}).get("resultCode", "")
-                raise Exception(f"API 오류 (Code: {error_code}, Status: {response.status_code}): {error_msg}")
+            # API 에러 코드 확인
+            if result_code != "0000":
+                result_msg = header.get("resultMsg", "알 수 없는 오류")
+                raise TourismAPIError(
+                    f"API 오류 (Code: {result_code}): {result_msg}",
+                    status_code=response.status_code,
+                    retryable=result_code in RETRYABLE_RESULT_CODES
+                )
             
-            # 응답 구조 파싱
-            if "response" in data:
-                header = data["response"].get("header", {})
-                result_code = header.get("resultCode", "")
-                
-                # API 에러 코드 확인
-                if result_code != "0000":
-                    result_msg = header.get("resultMsg", "알 수 없는 오류")
-                    raise Exception(f"API 오류 (Code: {result_code}): {result_msg}")
-                
-                body = data["response"].get("body", {})
-                items = body.get("items", {})
-                
-                # items가 None이거나 비어있을 수 있음
-                if not items:
-                    return {
-                        "total_count": 0,
-                        "page_no": page_no,
-                        "num_of_rows": num_of_rows,
-                        "items": []
-                    }
-                
-                item_list = items.get("item", [])
-                
-                # 단일 아이템인 경우 리스트로 변환
-                if isinstance(item_list, dict):
-                    item_list = [item_list]
-                
-                return {
-                    "total_count": body.get("totalCount", 0),
-                    "page_no": page_no,
-                    "num_of_rows": num_of_rows,
-                    "items": item_list if item_list else []
-                }
-            else:
+            body = data["response"].get("body", {})
+            items = body.get("items", {})
+            
+            # items가 None이거나 비어있을 수 있음
+            if not items:
                 return {
                     "total_count": 0,
                     "page_no": page_no,
                     "num_of_rows": num_of_rows,
                     "items": []
                 }
+            
+            item_list = items.get("item", [])
+            
+            # 단일 아이템인 경우 리스트로 변환
+            if isinstance(item_list, dict):
+                item_list = [item_list]
+            
+            return {
+                "total_count": body.get("totalCount", 0),
+                "page_no": page_no,
+                "num_of_rows": num_of_rows,
+                "items": item_list if item_list else []
+            }
+        else:
+            return {
+                "total_count": 0,
+                "page_no": page_no,
+                "num_of_rows": num_of_rows,
+                "items": []
+            }
     
     except httpx.HTTPStatusError as e:
         error_detail = ""
@@ -188,12 +779,22 @@ async def search_tourism_keyword(
             error_message += "3. API 서비스 신청 상태를 확인 (승인 대기 중일 수 있음)\n"
             error_message += "4. 잠시 후 다시 시도 (서버 일시적 문제일 수 있음)"
         
-        raise Exception(error_message)
+        raise TourismAPIError(
+            error_message,
+            status_code=e.response.status_code,
+            retryable=e.response.status_code in RETRYABLE_STATUS_CODES
+        )
+    except httpx.TransportError as e:
+        # 연결/읽기 타임아웃, 연결 끊김 등
+        raise TourismAPIError(f"API 요청 실패: {str(e) or type(e).__name__}", retryable=True)
     except httpx.HTTPError as e:
-        raise Exception(f"API 요청 실패: {str(e)}")
+        raise TourismAPIError(f"API 요청 실패: {str(e)}")
+    except TourismAPIError as e:
+        # 원본 에러 메시지 유지
+        raise TourismAPIError(f"데이터 처리 실패: {str(e)}", status_code=e.status_code, retryable=e.retryable)
     except Exception as e:
         # 원본 에러 메시지 유지
-        raise Exception(f"데이터 처리 실패: {str(e)}")
+        raise TourismAPIError(f"데이터 처리 실패: {str(e)}")
 
 
 def format_tourism_item(item: Dict[str, Any]) -> Dict[str, Any]:
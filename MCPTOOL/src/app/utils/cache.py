@@ -0,0 +1,338 @@
+"""TTL + LRU 인메모리 캐시 (선택적 SQLite 디스크 계층)"""
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """
+    항목별 TTL과 LRU 축출을 지원하는 캐시
+
+    - 메모리 계층: OrderedDict 기반 LRU, 최대 max_size개 유지
+    - 디스크 계층(선택): disk_path가 주어지면 SQLite에 JSON으로 저장하여 재시작 후에도 유지
+      (메모리에서 miss가 나면 디스크를 조회하고, 찾으면 메모리로 승격)
+      쓰기/삭제는 대기열에 모았다가 백그라운드 스레드가 flush_interval마다 한 트랜잭션으로 커밋하므로
+      set/delete가 이벤트 루프에서 디스크 I/O를 기다리지 않음 (대기 중인 값도 조회에 반영)
+      메모리 miss 시의 디스크 조회는 잠금 밖에서 하지만 호출 스레드에서 동기로 실행됨 (_disk_get 참고)
+
+    - stale_ttl > 0 이면 만료된 항목도 그 시간만큼 보관하여, 업스트림 장애 시 get_stale로 꺼내 쓸 수 있음
+
+    값은 디스크 계층을 사용할 경우 JSON 직렬화 가능해야 합니다.
+    """
+
+    # 디스크 쓰기 대기열이 이만큼 쌓이면 주기를 기다리지 않고 바로 커밋
+    FLUSH_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300.0,
+        disk_path: Optional[str] = None,
+        name: str = "cache",
+        stale_ttl: float = 0.0,
+        flush_interval: float = 1.0,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+        self.flush_interval = flush_interval
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # 디스크 키 -> (expires_at, 값) / None(삭제), 커밋 전까지 조회 시 디스크보다 우선
+        self._pending: Dict[str, Optional[Tuple[float, Any]]] = {}
+        self._inflight: Dict[str, Optional[Tuple[float, Any]]] = {}
+        self._clear_pending = False
+        self._inflight_clear = False
+        # 대기열 변경 횟수 (잠금 밖 디스크 조회 중 쓰기가 끼어들었는지 확인)
+        self._disk_version = 0
+        self._flush_event = threading.Event()
+        self._closed = False
+        if disk_path:
+            self._open_disk(disk_path)
+
+    # ==========================
+    # 디스크 계층
+    # ==========================
+    def _open_disk(self, disk_path: str):
+        directory = os.path.dirname(disk_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(disk_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        threading.Thread(target=self._flush_loop, name=f"{self.name}-disk-writer", daemon=True).start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _disk_key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False, default=str)
+
+    def _pending_get(self, disk_key: str) -> Tuple[bool, Optional[Tuple[float, Any]]]:
+        """커밋 전 쓰기 조회 (self._lock 보유 상태에서 호출), (결정 여부, 항목) 반환"""
+        # 최신 순서: 대기열 -> (대기 중인 clear) -> 커밋 중인 묶음 -> (커밋 중인 clear) -> 디스크
+        if disk_key in self._pending:
+            return True, self._pending[disk_key]
+        if self._clear_pending:
+            return True, None
+        if disk_key in self._inflight:
+            return True, self._inflight[disk_key]
+        if self._inflight_clear:
+            return True, None
+        return False, None
+
+    def _disk_read(self, disk_key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return None
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (disk_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("[%s] 디스크 캐시 조회 오류: %s", self.name, e)
+            return None
+        if row is None:
+            return None
+        value, expires_at = row
+        return expires_at, json.loads(value)
+
+    def _disk_get(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        디스크 계층 조회 (self._lock 없이 호출, 커밋 대기 중인 쓰기 우선)
+
+        대기열 확인만 self._lock 안에서 하고 SQLite 조회는 잠금 밖에서 실행하므로,
+        다른 스레드의 메모리 조회는 디스크 I/O를 기다리지 않습니다.
+        조회하는 동안 쓰기가 들어왔으면 대기열부터 다시 확인합니다 (계속 겹치면 miss로 처리).
+
+        SQLite 조회 자체는 호출한 스레드에서 동기로 실행됩니다. 기본 키 인덱스 조회 한 번이라
+        이벤트 루프에서 그대로 부르지만, 디스크가 느린 환경에서는 async 호출자가
+        asyncio.to_thread(cache.get, key)로 감싸야 합니다.
+        """
+        if self._db is None:
+            return None
+        disk_key = self._disk_key(key)
+        for _ in range(2):
+            with self._lock:
+                decided, entry = self._pending_get(disk_key)
+                if decided:
+                    return entry
+                version = self._disk_version
+            entry = self._disk_read(disk_key)
+            with self._lock:
+                if self._disk_version == version:
+                    return entry
+        return None
+
+    def _disk_set(self, key: Hashable, value: Any, expires_at: float):
+        if self._db is None:
+            return
+        self._enqueue(self._disk_key(key), (expires_at, value))
+
+    def _disk_delete(self, key: Hashable):
+        if self._db is None:
+            return
+        self._enqueue(self._disk_key(key), None)
+
+    def _enqueue(self, disk_key: str, entry: Optional[Tuple[float, Any]]):
+        """쓰기/삭제를 커밋 대기열에 추가 (self._lock 보유 상태에서 호출)"""
+        self._pending[disk_key] = entry
+        self._disk_version += 1
+        if len(self._pending) >= self.FLUSH_BATCH_SIZE:
+            self._flush_event.set()
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
+
+    def flush(self):
+        """대기 중인 디스크 쓰기를 한 트랜잭션으로 커밋"""
+        if self._db is None:
+            return
+        with self._flush_lock:
+            self._flush_batch()
+
+    def _flush_batch(self):
+        with self._lock:
+            if not self._pending and not self._clear_pending:
+                return
+            batch, self._pending = self._pending, {}
+            clear, self._clear_pending = self._clear_pending, False
+            self._inflight, self._inflight_clear = batch, clear
+
+        upserts = []
+        deletes = []
+        for disk_key, entry in batch.items():
+            if entry is None:
+                deletes.append((disk_key,))
+                continue
+            expires_at, value = entry
+            try:
+                upserts.append((disk_key, json.dumps(value, ensure_ascii=False), expires_at))
+            except (TypeError, ValueError) as e:
+                logger.warning("[%s] 디스크 캐시 직렬화 오류: %s", self.name, e)
+
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return
+                with self._db:
+                    if clear:
+                        self._db.execute("DELETE FROM cache")
+                    if deletes:
+                        self._db.executemany("DELETE FROM cache WHERE key = ?", deletes)
+                    if upserts:
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                            upserts
+                        )
+        except sqlite3.Error as e:
+            logger.warning("[%s] 디스크 캐시 저장 오류: %s", self.name, e)
+        finally:
+            with self._lock:
+                self._inflight, self._inflight_clear = {}, False
+
+    def close(self):
+        """남은 쓰기를 커밋하고 디스크 계층 종료"""
+        if self._db is None or self._closed:
+            return
+        self._closed = True
+        self._flush_event.set()
+        self.flush()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ==========================
+    # 공개 API
+    # ==========================
+    def get(self, key: Hashable) -> Optional[Any]:
+        """키 조회 (만료되었거나 없으면 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if expires_at + self.stale_ttl <= now:
+                    del self._data[key]
+
+        # 디스크 계층 조회 (SQLite 조회 동안 self._lock을 잡지 않음)
+        disk_entry = self._disk_get(key)
+
+        with self._lock:
+            # 디스크를 읽는 동안 메모리에 새 값이 저장되었으면 그 값을 우선
+            current = self._data.get(key)
+            if current is not None and current[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return current[1]
+            if disk_entry is not None:
+                expires_at, value = disk_entry
+                if expires_at > now:
+                    self._store(key, value, expires_at)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+                if expires_at + self.stale_ttl <= now:
+                    self._disk_delete(key)
+
+            self.misses += 1
+            return None
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """
+        만료 여부와 관계없이 보관 중인 값 조회 (만료 후 stale_ttl 이내)
+
+        업스트림 장애 시 마지막으로 받은 결과를 대신 돌려줄 때 사용합니다.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            entry = self._disk_get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at + self.stale_ttl <= now:
+            return None
+        with self._lock:
+            self.stale_hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """키 저장 (ttl 미지정 시 기본 TTL 사용)"""
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._store(key, value, expires_at)
+            self._disk_set(key, value, expires_at)
+
+    def _store(self, key: Hashable, value: Any, expires_at: float):
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+            self._disk_delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            if self._db is not None:
+                self._pending.clear()
+                self._clear_pending = True
+                self._disk_version += 1
+                self._flush_event.set()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """hit/miss 통계"""
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "stale_hits": self.stale_hits,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+        }
@@ -24,14 +24,95 @@ class Settings(BaseSettings):
 
     # API URLs
     tourism_api_url: str = "https://apis.data.go.kr/B551011/KorService2/searchKeyword2"
+    tourism_area_list_url: str = "https://apis.data.go.kr/B551011/KorService2/areaBasedList2"
+    tourism_detail_url: str = "https://apis.data.go.kr/B551011/KorService2/detailCommon2"
+
+    # HTTP Client Settings (공공데이터 API 공용 커넥션 풀)
+    http_timeout: float = 10.0  # 쓰기/커넥션 풀 대기 기본값
+    http_connect_timeout: float = 3.0
+    http_read_timeout: float = 8.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    # Tourism Search Cache Settings
+    tourism_cache_size: int = 1024
+    tourism_cache_ttl: float = 600.0  # 초
+    tourism_cache_path: str = ""  # 비어 있으면 디스크 계층 비활성화 (예: app/db/tourism_cache.sqlite)
+    tourism_cache_stale_ttl: float = 86400.0  # 만료 후에도 장애 시 대신 반환할 수 있도록 보관하는 시간 (초)
+
+    # Tourism API Resilience Settings (재시도 + 서킷 브레이커)
+    tourism_retry_attempts: int = 3  # 첫 시도 포함
+    tourism_retry_base_delay: float = 0.2  # 초, 지수 백오프 (full jitter)
+    tourism_retry_max_delay: float = 2.0
+    tourism_request_deadline: float = 15.0  # 재시도 포함 전체 마감 시간 (초)
+    tourism_breaker_failure_threshold: int = 5  # 연속 실패 횟수
+    tourism_breaker_reset_timeout: float = 30.0  # 서킷 open 유지 시간 (초)
+
+    # Detail Enrichment Settings (detailCommon2 개요로 RAG 문서 보강)
+    tourism_detail_enabled: bool = True
+    tourism_detail_concurrency: int = 4  # 프로세스 전체 동시 상세 조회 수
+    tourism_detail_deadline: float = 1.5  # 요청당 보강 대기 시간 (초, 늦은 조회는 백그라운드에서 캐시만 채움)
+    tourism_detail_cache_size: int = 20000
+    tourism_detail_cache_ttl: float = 7 * 86400.0  # 상세정보는 거의 바뀌지 않음 (초)
+    tourism_detail_cache_path: str = ""  # 비어 있으면 메모리만 사용 (예: app/db/tourism_detail_cache.sqlite)
+
+    # Fan-out Search Settings (추천 시 여러 지역/키워드 동시 검색)
+    tourism_fanout_concurrency: int = 4
+    tourism_fanout_max_regions: int = 2
+    tourism_fanout_max_keywords: int = 3
+    tourism_page_window: int = 4  # 전체 페이지 순회 시 동시 요청 페이지 수
+
+    # Offline Catalog Settings
+    tourism_search_backend: str = "remote"  # "remote" | "local" | "auto"
+    tourism_catalog_path: str = str(BASE_DIR / "app" / "db" / "tourism_catalog.sqlite")
+    tourism_catalog_area_ttl: float = 300.0  # 지역별 수집 여부 / 공간 인덱스 최신 여부를 다시 확인하는 주기 (초)
 
     # LLM Settings
     gemini_model: str = "gemini-1.5-flash"
     temperature: float = 0.7
+    course_cache_size: int = 256  # 생성 코스 캐시 최대 항목 수
+    course_cache_ttl: float = 1800.0  # 초
+    course_cache_similarity: float = 0.0  # 의미 유사도 캐시 임계값 (0이면 정확 일치만)
+    context_token_budget: int = 1200  # 코스 생성 컨텍스트 최대 추정 토큰 수
+    recommend_deadline: float = 30.0  # 추천 요청 전체 마감 시간 (초, 남은 시간이 LLM 호출 마감)
+    llm_deadline: float = 25.0  # 마감 시각이 전달되지 않은 LLM 호출의 기본 마감 시간 (초)
+    llm_fallback_model: str = "gemini-2.5-flash-lite"  # 비어 있으면 대체 모델 없이 결정적 코스
+    llm_fallback_reserve: float = 6.0  # 대체 모델 몫으로 남겨 둘 시간 (초)
+    llm_hedge_percentile: float = 0.9  # 이 백분위 지연 후 헤지 요청 (0이면 헤지 안 함)
+    llm_hedge_initial_delay: float = 4.0  # 지연 샘플이 쌓이기 전 헤지 지연 (초)
+    llm_latency_window: int = 200
+    llm_backend: str = "gemini"  # "gemini" | "fake" (부하 테스트용, 네트워크 호출 없음)
+    fake_llm_delay: float = 2.0  # 가짜 모델 응답 지연 중앙값 (초)
+    fake_llm_delay_sigma: float = 0.3  # 지연 로그정규 분포 폭 (0이면 고정)
+    fake_llm_error_rate: float = 0.0  # 가짜 모델 오류 확률
+    fake_llm_stream_chunks: int = 8  # 스트리밍 응답 청크 수
     
     # RAG Settings
     chroma_persist_directory: str = str(BASE_DIR / "app" / "db" / "chroma_db")
     embedding_model: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    rag_max_workers: int = 8  # 임베딩/Chroma 작업 스레드 풀 크기 (encode 자체는 배처 스레드 하나에서 실행)
+    embedding_max_batch_size: int = 64  # 한 번에 encode할 최대 텍스트 수
+    embedding_max_wait_ms: float = 5.0  # 배치를 모으기 위해 기다리는 최대 시간
+    embedding_result_timeout: float = 60.0  # 배치 결과를 기다리는 최대 시간 (초, 첫 모델 로딩 포함)
+    query_embedding_cache_size: int = 2048  # 쿼리 임베딩 캐시 최대 항목 수
+    query_embedding_cache_max_bytes: int = 16 * 1024 * 1024  # 쿼리 임베딩 캐시 최대 메모리
+    item_embedding_cache_size: int = 20000  # 여행지 임베딩 캐시 최대 항목 수 (후보 랭킹용)
+    item_embedding_cache_max_bytes: int = 64 * 1024 * 1024  # 여행지 임베딩 캐시 최대 메모리
+    rag_overview_max_chars: int = 500  # RAG 문서에 넣을 개요 최대 글자 수
+    
+    # Ranking Settings (필터링 후 LLM에 넘길 후보 선정)
+    rank_top_k: int = 10
+    rank_use_embeddings: bool = True  # False면 키워드/테마/인기도 점수만 사용
+    rank_weight_keyword: float = 1.0
+    rank_weight_theme: float = 0.5
+    rank_weight_embedding: float = 1.5
+    rank_weight_popularity: float = 0.3
+    
+    # Startup Settings (lifespan 워밍업, /ready는 워밍업이 끝나야 200)
+    warmup_rag: bool = True  # 임베딩 모델 로딩 + 더미 임베딩 + Chroma 열기 (검색 전용 워커는 False)
+    warmup_llm: bool = True  # LLM 클라이언트 생성 (SDK import + 설정)
     
     # Server Settings
     host: str = "0.0.0.0"
@@ -1,7 +1,141 @@
-"""여행지 필터링 기능"""
-from typing import List, Dict, Any, Optional
+"""여행지 필터링 기능
 
+테마/실내·실외/난이도 사전은 모듈 로드 시 정규식으로 컴파일하고,
+지정된 조건에 필요한 특징(테마/실내·실외 일치 여부, 난이도)만 계산해 contentid 단위로 캐시합니다.
+이동 거리 필터는 NumPy로 벡터화한 haversine으로 계산합니다.
+"""
+import re
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Pattern, Tuple
+import numpy as np
+from app.utils.geo import center_of, haversine_km, item_coordinates
+from app.utils.query_parser import parse_query
+from app.utils.route import estimate_stay_minutes
 
+
+# ==========================
+# 사전 (모듈 로드 시 컴파일)
+# ==========================
+THEME_KEYWORDS: Dict[str, List[str]] = {
+    "데이트": ["카페", "레스토랑", "공원", "전시", "영화"],
+    "가족": ["공원", "박물관", "체험", "놀이", "아이"],
+    "힐링": ["산", "바다", "공원", "카페", "스파"],
+    "문화": ["박물관", "미술관", "전시", "공연", "역사"],
+    "야경": ["타워", "전망", "다리", "산"],
+}
+INDOOR_KEYWORDS = ["실내", "미술관", "박물관", "카페", "레스토랑", "쇼핑", "영화"]
+OUTDOOR_KEYWORDS = ["산", "바다", "공원", "해변", "등산", "산책"]
+
+# 난이도 (제목 기준, 높은 난이도 우선)
+DIFFICULTY_LEVELS = {"easy": 0, "medium": 1, "hard": 2}
+HARD_KEYWORDS = ["등산", "트레킹", "암벽", "클라이밍", "봉", "산성", "오름", "레포츠"]
+MEDIUM_KEYWORDS = ["산책", "둘레길", "올레", "숲", "계곡", "공원", "해변", "자전거"]
+HARD_CONTENT_TYPES = {"28"}  # 레포츠
+
+
+def _compile(words: List[str]) -> Pattern[str]:
+    return re.compile("|".join(re.escape(word.lower()) for word in words))
+
+
+_THEME_PATTERNS: Dict[str, Pattern[str]] = {theme: _compile(words) for theme, words in THEME_KEYWORDS.items()}
+_INDOOR_PATTERN = _compile(INDOOR_KEYWORDS)
+_OUTDOOR_PATTERN = _compile(OUTDOOR_KEYWORDS)
+_HARD_PATTERN = _compile(HARD_KEYWORDS)
+_MEDIUM_PATTERN = _compile(MEDIUM_KEYWORDS)
+
+
+@lru_cache(maxsize=128)
+def _adhoc_theme_pattern(theme: str) -> Pattern[str]:
+    """사전에 없는 테마는 테마명 자체를 키워드로 사용"""
+    return _compile([theme])
+
+
+# ==========================
+# 아이템 특징 캐시
+# ==========================
+# 특징 이름 -> {contentid: (계산에 쓴 원본 필드 값, 특징 값)}
+# 읽기는 잠금/LRU 갱신 없이 dict 조회 한 번이고, 원본 필드가 바뀐 아이템만 다시 계산합니다.
+# (dict 단일 연산은 GIL 아래에서 원자적이라 스레드 간 공유해도 안전, 상한을 넘으면 통째로 비움)
+_FEATURE_CACHE_SIZE = 20000
+_feature_cache: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+
+_TITLE_FIELDS = ("title",)
+_TEXT_FIELDS = ("title", "addr1", "addr2")
+_DIFFICULTY_FIELDS = ("title", "contenttypeid")
+
+
+def _feature_values(
+    items: List[Dict[str, Any]],
+    name: str,
+    fields: Tuple[str, ...],
+    compute: Callable[[Dict[str, Any]], Any]
+) -> List[Any]:
+    """아이템별 특징 값 (contentid와 fields 값이 캐시와 같으면 다시 계산하지 않음)"""
+    cache = _feature_cache.get(name)
+    if cache is None or len(cache) > _FEATURE_CACHE_SIZE:
+        cache = _feature_cache[name] = {}
+
+    single = fields[0] if len(fields) == 1 else None
+    values = []
+    for item in items:
+        contentid = item.get("contentid")
+        if not contentid:
+            values.append(compute(item))
+            continue
+        source = item.get(single) if single is not None else tuple(map(item.get, fields))
+        entry = cache.get(contentid)
+        if entry is None or entry[0] != source:
+            entry = cache[contentid] = (source, compute(item))
+        values.append(entry[1])
+    return values
+
+
+def _title(item: Dict[str, Any]) -> str:
+    return (item.get("title", "") or "").lower()
+
+
+def _text(item: Dict[str, Any]) -> str:
+    return (_title(item) + " " + ((item.get("addr1", "") or "") + (item.get("addr2", "") or "")).lower())
+
+
+def _title_matcher(pattern: Pattern[str]) -> Callable[[Dict[str, Any]], bool]:
+    return lambda item: pattern.search(_title(item)) is not None
+
+
+def _text_matcher(pattern: Pattern[str]) -> Callable[[Dict[str, Any]], bool]:
+    return lambda item: pattern.search(_text(item)) is not None
+
+
+def _difficulty_of(item: Dict[str, Any]) -> int:
+    title = _title(item)
+    if _HARD_PATTERN.search(title) or str(item.get("contenttypeid", "")) in HARD_CONTENT_TYPES:
+        return DIFFICULTY_LEVELS["hard"]
+    if _MEDIUM_PATTERN.search(title):
+        return DIFFICULTY_LEVELS["medium"]
+    return DIFFICULTY_LEVELS["easy"]
+
+
+_THEME_MATCHERS = {theme: _title_matcher(pattern) for theme, pattern in _THEME_PATTERNS.items()}
+_INDOOR_MATCHER = _text_matcher(_INDOOR_PATTERN)
+_OUTDOOR_MATCHER = _text_matcher(_OUTDOOR_PATTERN)
+
+
+def _keep(items: List[Dict[str, Any]], flags: List[Any]) -> List[Dict[str, Any]]:
+    return [item for item, flag in zip(items, flags) if flag]
+
+
+def theme_matches(items: List[Dict[str, Any]], theme: str) -> List[bool]:
+    """테마 키워드가 제목에 포함되었는지 아이템별 여부 (사전에 없는 테마는 테마명으로 검색)"""
+    matcher = _THEME_MATCHERS.get(theme)
+    if matcher is None:
+        adhoc = _adhoc_theme_pattern(theme)
+        return [adhoc.search(_title(item)) is not None for item in items]
+    return _feature_values(items, f"theme:{theme}", _TITLE_FIELDS, matcher)
+
+
+# ==========================
+# 필터링
+# ==========================
 def filter_tourism_items(
     items: List[Dict[str, Any]],
     theme: Optional[str] = None,
@@ -9,106 +143,87 @@ def filter_tourism_items(
     difficulty: Optional[str] = None,
     min_time: Optional[int] = None,
     max_time: Optional[int] = None,
+    max_distance_km: Optional[float] = None,
+    center: Optional[Tuple[float, float]] = None,
 ) -> List[Dict[str, Any]]:
     """
     여행지 아이템 필터링
-    
+
+    지정된 조건만, 앞 조건을 통과한 아이템에 대해서만 순서대로 검사합니다.
+
     Args:
         items: 여행지 아이템 리스트
         theme: 테마 (예: "데이트", "가족", "힐링" 등)
         indoor_outdoor: 실내/실외 구분 ("indoor", "outdoor")
-        difficulty: 난이도 ("easy", "medium", "hard")
-        min_time: 최소 체류 시간 (분)
-        max_time: 최대 체류 시간 (분)
-    
+        difficulty: 난이도 ("easy", "medium", "hard"), 지정한 난이도 이하만 유지
+        min_time: 여행지 한 곳의 최소 예상 체류 시간 (분), 이보다 짧은 곳 제외
+        max_time: 여행지 한 곳의 최대 예상 체류 시간 (분), 이보다 긴 곳 제외
+            (쿼리의 max_time은 코스 전체 시간 예산이므로 여기에 넘기지 말고 plan_route에 사용)
+        max_distance_km: 기준점으로부터 최대 이동 거리 (km)
+        center: 기준점 (경도, 위도), 없으면 아이템 좌표의 중앙값
+
     Returns:
         필터링된 여행지 아이템 리스트
     """
-    filtered = items.copy()
-    
-    # 테마 필터링 (제목 또는 설명에 키워드 포함 여부)
-    if theme:
-        theme_keywords = {
-            "데이트": ["카페", "레스토랑", "공원", "전시", "영화"],
-            "가족": ["공원", "박물관", "체험", "놀이", "아이"],
-            "힐링": ["산", "바다", "공원", "카페", "스파"],
-            "문화": ["박물관", "미술관", "전시", "공연", "역사"],
-            "야경": ["타워", "전망", "다리", "산"],
-        }
-        
-        keywords = theme_keywords.get(theme, [theme])
-        
-        def matches_theme(item):
-            title = item.get("title", "").lower()
-            for keyword in keywords:
-                if keyword.lower() in title:
-                    return True
-            return False
-        
-        filtered = [item for item in filtered if matches_theme(item)]
-    
-    # 실내/실외 필터링 (간단한 휴리스틱)
-    if indoor_outdoor:
-        indoor_keywords = ["실내", "미술관", "박물관", "카페", "레스토랑", "쇼핑", "영화"]
-        outdoor_keywords = ["산", "바다", "공원", "해변", "등산", "산책"]
-        
-        def is_indoor_or_outdoor(item, is_indoor: bool):
-            title = item.get("title", "").lower()
-            addr = (item.get("addr1", "") + item.get("addr2", "")).lower()
-            text = title + " " + addr
-            
-            keywords = indoor_keywords if is_indoor else outdoor_keywords
-            for keyword in keywords:
-                if keyword in text:
-                    return True
-            return False
-        
-        is_indoor = indoor_outdoor.lower() == "indoor"
-        filtered = [item for item in filtered if is_indoor_or_outdoor(item, is_indoor)]
-    
+    filtered = list(items)
+
+    # 테마 필터링 (제목에 테마 키워드 포함 여부)
+    if theme and filtered:
+        filtered = _keep(filtered, theme_matches(filtered, theme))
+
+    # 실내/실외 필터링 (제목 + 주소 기준 휴리스틱)
+    if indoor_outdoor and filtered:
+        if indoor_outdoor.lower() == "indoor":
+            flags = _feature_values(filtered, "indoor", _TEXT_FIELDS, _INDOOR_MATCHER)
+        else:
+            flags = _feature_values(filtered, "outdoor", _TEXT_FIELDS, _OUTDOOR_MATCHER)
+        filtered = _keep(filtered, flags)
+
+    # 난이도 필터링
+    if difficulty and difficulty.lower() in DIFFICULTY_LEVELS and filtered:
+        limit = DIFFICULTY_LEVELS[difficulty.lower()]
+        levels = _feature_values(filtered, "difficulty", _DIFFICULTY_FIELDS, _difficulty_of)
+        filtered = _keep(filtered, [level <= limit for level in levels])
+
+    # 여행지별 체류 시간 필터링 (콘텐츠 타입 사전 조회라 캐시 불필요)
+    if min_time is not None:
+        filtered = [item for item in filtered if estimate_stay_minutes(item) >= min_time]
+    if max_time is not None:
+        filtered = [item for item in filtered if estimate_stay_minutes(item) <= max_time]
+
+    # 이동 거리 필터링 (좌표 없는 아이템은 제외, 거리 계산은 NumPy로 벡터화)
+    if max_distance_km is not None and filtered:
+        origin = center or center_of(filtered)
+        if origin is not None:
+            lons, lats, valid = item_coordinates(filtered)
+            distances = np.full(len(filtered), np.inf)
+            distances[valid] = haversine_km(origin[0], origin[1], lons[valid], lats[valid])
+            filtered = [filtered[idx] for idx in np.flatnonzero(distances <= max_distance_km).tolist()]
+
     return filtered
 
 
-def extract_filters_from_query(query: str) -> Dict[str, Any]:
+def extract_filters_from_query(
+    query: str,
+    parsed: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     자연어 쿼리에서 필터 조건 추출
     
     Args:
         query: 사용자 쿼리
+        parsed: parse_query 결과 (이미 해석했다면 재사용)
     
     Returns:
         필터 조건 딕셔너리
     """
-    query_lower = query.lower()
+    if parsed is None:
+        parsed = parse_query(query)
     filters = {}
     
-    # 테마 추출
-    if "데이트" in query_lower or "연인" in query_lower:
-        filters["theme"] = "데이트"
-    elif "가족" in query_lower or "아이" in query_lower or "아이들" in query_lower:
-        filters["theme"] = "가족"
-    elif "힐링" in query_lower:
-        filters["theme"] = "힐링"
-    elif "문화" in query_lower:
-        filters["theme"] = "문화"
-    
-    # 실내/실외 추출
-    if "실내" in query_lower:
-        filters["indoor_outdoor"] = "indoor"
-    elif "야외" in query_lower or "실외" in query_lower or "바깥" in query_lower:
-        filters["indoor_outdoor"] = "outdoor"
-    
-    # 시간 추출 (예: "3시간", "반나절", "하루" 등)
-    if "반나절" in query_lower or "반 날" in query_lower:
-        filters["max_time"] = 240  # 4시간
-    elif "하루" in query_lower or "일일" in query_lower:
-        filters["max_time"] = 480  # 8시간
-    elif "2시간" in query_lower:
-        filters["max_time"] = 120
-    elif "3시간" in query_lower:
-        filters["max_time"] = 180
-    elif "4시간" in query_lower:
-        filters["max_time"] = 240
+    # 테마 / 실내·실외 / 코스 전체 시간 예산 (예: "3시간", "반나절", "하루" 등, 동선 계획에 사용)
+    for key in ("theme", "indoor_outdoor", "max_time"):
+        if parsed[key] is not None:
+            filters[key] = parsed[key]
     
     return filters
-
@@ -0,0 +1,138 @@
+"""여행지 좌표(mapx/mapy) 공간 인덱스
+
+mapx = 경도(longitude), mapy = 위도(latitude) (WGS84, 문자열로 내려옴)
+거리 계산은 NumPy로 벡터화된 haversine을 사용합니다.
+"""
+import math
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lon: float, lat: float, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """한 점과 여러 점 사이의 대원 거리(km)"""
+    lon1, lat1 = np.radians(lon), np.radians(lat)
+    lons2, lats2 = np.radians(lons), np.radians(lats)
+    dlat = lats2 - lat1
+    dlon = lons2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lats2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix_km(lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """점 집합의 쌍별 거리 행렬(km)"""
+    lons_r, lats_r = np.radians(lons), np.radians(lats)
+    dlat = lats_r[:, None] - lats_r[None, :]
+    dlon = lons_r[:, None] - lons_r[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lats_r)[:, None] * np.cos(lats_r)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def item_coordinates(items: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    아이템 리스트의 (경도 배열, 위도 배열, 유효 좌표 마스크)
+
+    좌표가 없거나 숫자가 아니면 NaN으로 두고 마스크에서 제외합니다.
+    """
+    count = len(items)
+    lons = np.full(count, np.nan)
+    lats = np.full(count, np.nan)
+    for idx, item in enumerate(items):
+        try:
+            lons[idx] = float(item.get("mapx") or "nan")
+            lats[idx] = float(item.get("mapy") or "nan")
+        except (TypeError, ValueError):
+            continue
+    valid = ~(np.isnan(lons) | np.isnan(lats)) & (lons != 0) & (lats != 0)
+    return lons, lats, valid
+
+
+def center_of(items: List[Dict[str, Any]]) -> Optional[Tuple[float, float]]:
+    """좌표 중앙값 (경도, 위도) - 중심점이 주어지지 않았을 때 기준점으로 사용"""
+    lons, lats, valid = item_coordinates(items)
+    if not valid.any():
+        return None
+    return float(np.median(lons[valid])), float(np.median(lats[valid]))
+
+
+class GeoIndex:
+    """
+    격자(grid) 기반 공간 인덱스
+
+    좌표를 cell_deg 크기의 격자 칸으로 묶어 두고, 질의 범위와 겹치는 칸의 후보만
+    벡터화된 거리 계산으로 확인합니다.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], cell_deg: float = 0.05):
+        self.items = items
+        self.cell_deg = cell_deg
+        self.lons, self.lats, valid = item_coordinates(items)
+        self._ids = np.nonzero(valid)[0]
+
+        # 격자 칸 -> 아이템 인덱스 배열
+        cells_x = np.floor(self.lons[self._ids] / cell_deg).astype(np.int64)
+        cells_y = np.floor(self.lats[self._ids] / cell_deg).astype(np.int64)
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for idx, cx, cy in zip(self._ids.tolist(), cells_x.tolist(), cells_y.tolist()):
+            buckets.setdefault((cx, cy), []).append(idx)
+        self._cells = {cell: np.array(ids, dtype=np.int64) for cell, ids in buckets.items()}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _candidates(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> np.ndarray:
+        x0, x1 = math.floor(min_lon / self.cell_deg), math.floor(max_lon / self.cell_deg)
+        y0, y1 = math.floor(min_lat / self.cell_deg), math.floor(max_lat / self.cell_deg)
+
+        # 범위가 격자 칸 수보다 넓으면 전체 후보
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            return self._ids
+        parts = [
+            self._cells[(cx, cy)]
+            for cx in range(x0, x1 + 1)
+            for cy in range(y0, y1 + 1)
+            if (cx, cy) in self._cells
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[int]:
+        """경계 상자 안의 아이템 인덱스"""
+        ids = self._candidates(min_lon, min_lat, max_lon, max_lat)
+        lons, lats = self.lons[ids], self.lats[ids]
+        inside = (lons >= min_lon) & (lons <= max_lon) & (lats >= min_lat) & (lats <= max_lat)
+        return ids[inside].tolist()
+
+    def radius(self, lon: float, lat: float, radius_km: float) -> List[Tuple[int, float]]:
+        """중심에서 radius_km 이내 아이템의 (인덱스, 거리km), 가까운 순"""
+        dlat = radius_km / 111.32
+        dlon = radius_km / (111.32 * max(math.cos(math.radians(lat)), 1e-6))
+        ids = self._candidates(lon - dlon, lat - dlat, lon + dlon, lat + dlat)
+        if len(ids) == 0:
+            return []
+        distances = haversine_km(lon, lat, self.lons[ids], self.lats[ids])
+        within = distances <= radius_km
+        ids, distances = ids[within], distances[within]
+        order = np.argsort(distances)
+        return list(zip(ids[order].tolist(), distances[order].tolist()))
+
+    def nearest(self, lon: float, lat: float, k: int = 5) -> List[Tuple[int, float]]:
+        """가장 가까운 k개 아이템의 (인덱스, 거리km)"""
+        if len(self._ids) == 0 or k <= 0:
+            return []
+        k = min(k, len(self._ids))
+
+        # 반경을 두 배씩 넓혀가며 k개 이상 찾으면 종료 (반경 내 결과는 정확한 최근접)
+        radius_km = self.cell_deg * 111.32
+        while True:
+            found = self.radius(lon, lat, radius_km)
+            if len(found) >= k:
+                return found[:k]
+            if radius_km > 2 * math.pi * EARTH_RADIUS_KM:
+                break
+            radius_km *= 2
+
+        distances = haversine_km(lon, lat, self.lons[self._ids], self.lats[self._ids])
+        order = np.argsort(distances)[:k]
+        return list(zip(self._ids[order].tolist(), distances[order].tolist()))
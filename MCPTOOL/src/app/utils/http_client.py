@@ -0,0 +1,70 @@
+"""공용 httpx.AsyncClient 관리 모듈
+
+공공데이터 API 호출마다 새 클라이언트를 만들면 매번 TCP/TLS 핸드셰이크가 발생하므로,
+프로세스 전체에서 커넥션 풀을 공유하는 단일 클라이언트를 사용합니다.
+FastAPI lifespan / MCP 서버 실행 시 열고 닫습니다.
+"""
+import httpx
+from typing import Optional
+from app.utils.config import settings
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """설정값 기반으로 커넥션 풀 클라이언트 생성"""
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+    http2 = settings.http2
+    if http2:
+        # HTTP/2는 h2 패키지가 필요 (httpx[http2])
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+
+    # 연결/읽기 마감 시간을 따로 두어 느린 업스트림이 워커를 오래 붙잡지 않도록 함
+    timeout = httpx.Timeout(
+        settings.http_timeout,
+        connect=settings.http_connect_timeout,
+        read=settings.http_read_timeout,
+    )
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+    )
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """공용 클라이언트 열기 (lifespan 시작 시 호출)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def close_http_client():
+    """공용 클라이언트 닫기 (lifespan 종료 시 호출)"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공용 클라이언트 반환
+
+    lifespan 밖(스크립트 등)에서 호출된 경우에도 동작하도록 필요 시 생성합니다.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
@@ -0,0 +1,244 @@
+"""파이프라인 지표 수집 (Prometheus 텍스트 형식) + 요청별 Server-Timing
+
+외부 의존성 없이 카운터/히스토그램과 조회 시점에 값을 읽는 수집기(collector)만 지원합니다.
+
+사용 예:
+    with stage("search"):
+        items = await _search_items(parsed)
+
+stage()는 단계별 히스토그램(travel_stage_seconds)에 기록하고, 요청 처리 중이면
+해당 요청의 Server-Timing 헤더에도 포함됩니다.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = tuple(str(label) for label in labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> (버킷별 개수, 합계, 개수)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str):
+        key = tuple(str(label) for label in labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[idx] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            values = sorted((labels, (list(counts), total, count)) for labels, (counts, total, count) in self._values.items())
+        for labels, (counts, total, count) in values:
+            for bound, bucket_count in zip(self.buckets, counts):
+                le = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {bucket_count}")
+            le = _format_labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+# 수집기: 조회 시점에 (이름, 타입, 설명, [(라벨 딕셔너리, 값)]) 목록 반환
+Sample = Tuple[Dict[str, str], float]
+Collector = Callable[[], List[Tuple[str, str, str, List[Sample]]]]
+
+
+class Registry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics: List[Any] = []
+        self._collectors: List[Collector] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Collector):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                families = collector()
+            except Exception as e:
+                logger.warning("지표 수집 오류: %s", e)
+                continue
+            for name, metric_type, help_text, samples in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    names = tuple(labels)
+                    lines.append(
+                        f"{name}{_format_labels(names, [labels[n] for n in names])} {_format_value(float(value))}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "travel_stage_seconds", "추천 파이프라인 단계별 처리 시간 (초)", ["stage"]
+))
+UPSTREAM_REQUESTS = REGISTRY.register(Counter(
+    "tourism_upstream_requests_total", "공공데이터 API 호출 수 (재시도 포함)", ["endpoint"]
+))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "tourism_upstream_errors_total", "공공데이터 API 호출 오류 수", ["endpoint", "kind"]
+))
+UPSTREAM_SECONDS = REGISTRY.register(Histogram(
+    "tourism_upstream_seconds", "공공데이터 API 호출 시간 (초)", ["endpoint"]
+))
+LLM_REQUESTS = REGISTRY.register(Counter(
+    "llm_requests_total", "LLM 호출 수 (헤지 요청 포함)", ["model", "mode"]
+))
+LLM_ERRORS = REGISTRY.register(Counter(
+    "llm_errors_total", "LLM 호출 오류 수", ["model", "mode"]
+))
+LLM_SECONDS = REGISTRY.register(Histogram(
+    "llm_request_seconds", "LLM 호출 시간 (초)", ["model", "mode"]
+))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "llm_tokens_total", "LLM 사용 토큰 수 (usage_metadata)", ["model", "kind"]
+))
+COURSE_SOURCES = REGISTRY.register(Counter(
+    "course_generation_total", "코스 생성 경로별 횟수", ["source"]
+))
+
+
+def record_llm_usage(model: str, response: Any):
+    """Gemini 응답의 usage_metadata 토큰 수 기록 (없으면 무시)"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    for kind, attr in (
+        ("prompt", "prompt_token_count"),
+        ("completion", "candidates_token_count"),
+        ("total", "total_token_count"),
+    ):
+        value = getattr(usage, attr, None)
+        if value:
+            LLM_TOKENS.inc(model, kind, amount=float(value))
+
+
+# ==========================
+# 요청별 단계 시간 (Server-Timing)
+# ==========================
+_request_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def begin_request_timing() -> List[Tuple[str, float]]:
+    """현재 요청의 단계 시간 기록 시작 (미들웨어에서 호출)"""
+    timings: List[Tuple[str, float]] = []
+    _request_timings.set(timings)
+    return timings
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """단계 시간 측정 (히스토그램 + 현재 요청 Server-Timing)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, name)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.append((name, elapsed))
+
+
+def timings_ms(timings: List[Tuple[str, float]]) -> Dict[str, float]:
+    """단계별 시간 (같은 단계는 합산, 단위 ms, 기록 순서 유지)"""
+    merged: Dict[str, float] = {}
+    for name, elapsed in timings:
+        merged[name] = merged.get(name, 0.0) + elapsed * 1000
+    return {name: round(elapsed, 1) for name, elapsed in merged.items()}
+
+
+def server_timing_header(timings: List[Tuple[str, float]], total: Optional[float] = None) -> str:
+    """Server-Timing 헤더 값 (같은 단계는 합산, 단위 ms)"""
+    parts = [f"{name};dur={elapsed:.1f}" for name, elapsed in timings_ms(timings).items()]
+    if total is not None:
+        parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 형식 출력"""
+    return REGISTRY.render()
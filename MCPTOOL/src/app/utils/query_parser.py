@@ -0,0 +1,354 @@
+"""자연어 쿼리 해석 엔진 (Aho-Corasick 기반)
+
+지역/세부 지역/키워드/테마/실내외/시간 사전을 모듈 로드 시 하나의 오토마톤으로 컴파일하고,
+쿼리를 한 번만 훑어서 모든 조건을 추출합니다.
+
+모호성 해소 규칙 (결정적):
+1. 겹치는 매칭은 가장 왼쪽-가장 긴 매칭만 채택 (예: "부산"에 포함된 "산"은 무시)
+2. 같은 종류의 후보가 여럿이면 더 긴 매칭 → 사전 우선순위 → 먼저 등장한 순서
+3. 여러 광역 지역에 속하는 세부 지역(예: "고성", "광주")은 쿼리에 함께 언급된 광역 지역을 따르고,
+   없으면 AMBIGUOUS_SUB_AREAS에 먼저 적힌 지역으로 해석
+"""
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# ==========================
+# 사전
+# ==========================
+# 세부 지역 -> 광역 지역
+SUB_AREAS: Dict[str, str] = {
+    # 서울 세부
+    "강남": "서울", "강북": "서울", "홍대": "서울", "이태원": "서울", "명동": "서울",
+    "종로": "서울", "잠실": "서울", "여의도": "서울", "신촌": "서울", "건대": "서울",
+    # 부산 세부
+    "해운대": "부산", "광안리": "부산", "남포동": "부산", "서면": "부산", "태종대": "부산",
+    "기장": "부산", "영도": "부산", "다대포": "부산", "송도": "부산", "용호동": "부산",
+    # 제주 세부
+    "제주시": "제주", "서귀포": "제주", "애월": "제주", "성산": "제주", "중문": "제주",
+    "우도": "제주", "한림": "제주", "표선": "제주",
+    # 경기 세부
+    "수원": "경기", "성남": "경기", "고양": "경기", "용인": "경기", "부천": "경기",
+    "안산": "경기", "남양주": "경기", "안양": "경기", "평택": "경기", "시흥": "경기",
+    "파주": "경기", "의정부": "경기", "김포": "경기", "광명": "경기",
+    "군포": "경기", "하남": "경기", "오산": "경기", "양주": "경기", "이천": "경기",
+    "구리": "경기", "안성": "경기", "포천": "경기", "의왕": "경기", "양평": "경기",
+    "가평": "경기", "여주": "경기", "연천": "경기",
+    # 강원 세부
+    "춘천": "강원", "원주": "강원", "강릉": "강원", "동해": "강원", "속초": "강원",
+    "삼척": "강원", "태백": "강원", "평창": "강원", "정선": "강원", "양양": "강원",
+    "인제": "강원", "홍천": "강원", "횡성": "강원", "영월": "강원",
+    # 경남 세부
+    "창원": "경남", "김해": "경남", "진주": "경남", "양산": "경남", "거제": "경남",
+    "통영": "경남", "사천": "경남", "밀양": "경남", "함안": "경남", "거창": "경남",
+    "남해": "경남", "하동": "경남", "산청": "경남", "함양": "경남",
+    # 경북 세부
+    "포항": "경북", "경주": "경북", "구미": "경북", "안동": "경북", "영주": "경북",
+    "영천": "경북", "상주": "경북", "문경": "경북", "김천": "경북", "경산": "경북",
+    "울진": "경북", "울릉도": "경북", "청송": "경북", "영양": "경북",
+    # 전남 세부
+    "여수": "전남", "순천": "전남", "목포": "전남", "나주": "전남", "광양": "전남",
+    "담양": "전남", "곡성": "전남", "구례": "전남", "보성": "전남", "고흥": "전남",
+    "완도": "전남", "진도": "전남", "신안": "전남", "강진": "전남", "해남": "전남",
+    # 전북 세부
+    "전주": "전북", "익산": "전북", "군산": "전북", "정읍": "전북", "남원": "전북",
+    "김제": "전북", "완주": "전북", "고창": "전북", "부안": "전북", "무주": "전북",
+    # 충남 세부
+    "천안": "충남", "아산": "충남", "서산": "충남", "논산": "충남", "계룡": "충남",
+    "당진": "충남", "공주": "충남", "보령": "충남", "금산": "충남", "태안": "충남",
+    # 충북 세부
+    "청주": "충북", "충주": "충북", "제천": "충북", "단양": "충북", "음성": "충북",
+    "진천": "충북", "괴산": "충북", "증평": "충북",
+}
+
+# 여러 광역 지역에 존재하는 지명 (기본값 순서대로)
+AMBIGUOUS_SUB_AREAS: Dict[str, Tuple[str, ...]] = {
+    "고성": ("강원", "경남"),
+    "광주": ("광주", "경기"),  # 광주광역시 / 경기 광주시
+}
+
+# 광역 지역
+MAIN_REGIONS: List[str] = [
+    "서울", "부산", "제주", "인천", "대전", "대구", "울산", "세종",
+    "경기", "강원", "충북", "충남", "경북", "경남", "전북", "전남",
+]
+
+# 여행 키워드 그룹 (먼저 적힌 그룹이 우선)
+KEYWORD_GROUPS: Dict[str, List[str]] = {
+    # 자연/풍경
+    "바다": ["바다", "해수욕장", "해변", "해안", "비치", "오션뷰", "일몰", "낚시"],
+    "산": ["산", "등산", "하이킹", "트레킹", "계곡", "폭포", "숲", "자연"],
+    "공원": ["공원", "정원", "수목원", "식물원"],
+    "호수": ["호수", "저수지", "강", "물"],
+    # 액티비티
+    "체험": ["체험", "액티비티", "놀이", "테마파크", "워터파크"],
+    "캠핑": ["캠핑", "글램핑", "차박", "오토캠핑"],
+    "스포츠": ["스포츠", "골프", "수영", "서핑", "스키", "보드"],
+    "자전거": ["자전거", "사이클", "자전거길"],
+    # 문화/예술
+    "문화": ["문화", "박물관", "미술관", "갤러리", "전시", "공연"],
+    "역사": ["역사", "유적", "사적", "전통", "한옥", "고택", "사찰", "절"],
+    "예술": ["예술", "공연", "음악", "연극", "영화"],
+    # 음식/카페
+    "맛집": ["맛집", "음식", "레스토랑", "식당", "요리", "미식"],
+    "카페": ["카페", "커피", "디저트", "베이커리", "브런치"],
+    "술": ["술", "바", "와인", "맥주", "포차", "전통주"],
+    # 쇼핑/도심
+    "쇼핑": ["쇼핑", "마켓", "시장", "아울렛", "백화점", "거리"],
+    "야경": ["야경", "야시장", "밤", "나이트", "루프탑"],
+    "도심": ["도심", "시내", "번화가", "중심가"],
+    # 목적별
+    "데이트": ["데이트", "연인", "커플", "로맨틱"],
+    "가족": ["가족", "아이", "아이들", "어린이", "키즈"],
+    "힐링": ["힐링", "휴양", "쉼", "휴식", "조용한"],
+    "사진": ["사진", "포토존", "인스타", "갬성", "감성"],
+    "드라이브": ["드라이브", "드라이빙", "자동차"],
+    # 계절/시간
+    "봄": ["봄", "벚꽃", "꽃"],
+    "여름": ["여름", "피서", "시원한"],
+    "가을": ["가을", "단풍", "억새"],
+    "겨울": ["겨울", "눈", "스키"],
+    # 숙박/여행 스타일
+    "펜션": ["펜션", "리조트", "호텔", "숙박"],
+    "당일": ["당일", "일일", "하루"],
+    "1박2일": ["1박", "숙박", "여행"],
+}
+
+# 필터용 테마 (먼저 적힌 테마가 우선)
+THEME_LEXICON: Dict[str, List[str]] = {
+    "데이트": ["데이트", "연인"],
+    "가족": ["가족", "아이", "아이들"],
+    "힐링": ["힐링"],
+    "문화": ["문화"],
+}
+
+# 실내/실외
+INDOOR_OUTDOOR_LEXICON: Dict[str, List[str]] = {
+    "indoor": ["실내"],
+    "outdoor": ["야외", "실외", "바깥"],
+}
+
+# 최대 체류 시간 (분, 먼저 적힌 표현이 우선)
+TIME_LEXICON: Dict[int, List[str]] = {
+    240: ["반나절", "반 날"],
+    480: ["하루", "일일"],
+    120: ["2시간"],
+    180: ["3시간"],
+}
+# 4시간은 반나절과 같은 값이지만 우선순위가 가장 낮음
+_TIME_EXTRA: List[Tuple[str, int]] = [("4시간", 240)]
+
+
+# ==========================
+# Aho-Corasick 오토마톤
+# ==========================
+class AhoCorasick:
+    """문자열 다중 패턴 매칭 오토마톤 (add → build → find_all)"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self.patterns: List[str] = []
+
+    def add(self, pattern: str) -> int:
+        """패턴 등록 후 패턴 id 반환 (같은 패턴은 같은 id)"""
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        if self._out[state]:
+            return self._out[state][0]
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self._out[state].append(pattern_id)
+        return pattern_id
+
+    def build(self):
+        """실패 링크 계산 (BFS)"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """모든 매칭을 (start, end, pattern_id)로 반환"""
+        matches = []
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for idx, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in out[state]:
+                end = idx + 1
+                matches.append((end - len(self.patterns[pattern_id]), end, pattern_id))
+        return matches
+
+
+def _leftmost_longest(matches: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """겹치는 매칭 중 가장 왼쪽-가장 긴 것만 남김"""
+    selected = []
+    last_end = 0
+    for start, end, pattern_id in sorted(matches, key=lambda m: (m[0], -(m[1] - m[0]))):
+        if start >= last_end:
+            selected.append((start, end, pattern_id))
+            last_end = end
+    return selected
+
+
+# 패턴 id -> [(종류, 값, 우선순위)]
+_PAYLOADS: Dict[int, List[Tuple[str, Any, int]]] = {}
+_AUTOMATON = AhoCorasick()
+
+
+def _register(pattern: str, kind: str, value: Any, priority: int):
+    pattern_id = _AUTOMATON.add(pattern.lower())
+    _PAYLOADS.setdefault(pattern_id, []).append((kind, value, priority))
+
+
+def _compile():
+    for priority, (sub_area, main_area) in enumerate(SUB_AREAS.items()):
+        _register(sub_area, "sub_area", (main_area,), priority)
+    for sub_area, main_areas in AMBIGUOUS_SUB_AREAS.items():
+        _register(sub_area, "sub_area", main_areas, len(SUB_AREAS))
+    for priority, region in enumerate(MAIN_REGIONS):
+        _register(region, "region", region, priority)
+    for priority, (group, synonyms) in enumerate(KEYWORD_GROUPS.items()):
+        for synonym in synonyms:
+            _register(synonym, "keyword", group, priority)
+    for priority, (theme, words) in enumerate(THEME_LEXICON.items()):
+        for word in words:
+            _register(word, "theme", theme, priority)
+    for priority, (value, words) in enumerate(INDOOR_OUTDOOR_LEXICON.items()):
+        for word in words:
+            _register(word, "indoor_outdoor", value, priority)
+    time_entries = [(word, minutes) for minutes, words in TIME_LEXICON.items() for word in words]
+    for priority, (word, minutes) in enumerate(time_entries + _TIME_EXTRA):
+        _register(word, "max_time", minutes, priority)
+    _AUTOMATON.build()
+
+
+_compile()
+
+
+# ==========================
+# 쿼리 해석
+# ==========================
+def _best(candidates: List[Tuple[int, int, int, Any]]) -> Optional[Tuple[int, int, int, Any]]:
+    """(길이, 우선순위, 시작 위치, 값) 후보 중 최선 선택: 긴 매칭 → 우선순위 → 먼저 등장"""
+    if not candidates:
+        return None
+    return min(candidates, key=lambda c: (-c[0], c[1], c[2]))
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (유니코드 NFC, 소문자, 공백 정리)"""
+    text = unicodedata.normalize("NFC", query).lower()
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def parse_query(query: str) -> Dict[str, Any]:
+    """
+    자연어 쿼리에서 지역/키워드/필터 조건을 한 번에 추출
+
+    Args:
+        query: 사용자 쿼리
+
+    Returns:
+        {
+            "region": 광역 지역명 또는 None,
+            "regions": 언급된 광역 지역 전체 (우선순위 순),
+            "sub_area": 세부 지역명 또는 None,
+            "keyword": 대표 키워드 그룹 또는 None,
+            "keywords": 매칭된 키워드 그룹 전체 (우선순위 순),
+            "keyword_terms": 쿼리에 실제로 등장한 키워드 동의어 (예: "등산" -> 그룹 "산"),
+            "theme": 필터 테마 또는 None,
+            "indoor_outdoor": "indoor" / "outdoor" / None,
+            "max_time": 최대 체류 시간(분) 또는 None,
+        }
+    """
+    text = query.lower()
+    matches = _leftmost_longest(_AUTOMATON.find_all(text))
+
+    buckets: Dict[str, List[Tuple[int, int, int, Any]]] = {}
+    for start, end, pattern_id in matches:
+        for kind, value, priority in _PAYLOADS[pattern_id]:
+            buckets.setdefault(kind, []).append((end - start, priority, start, value))
+
+    mentioned_regions = {c[3] for c in buckets.get("region", [])}
+
+    # 지역: 세부 지역 우선, 없으면 광역 지역
+    region = None
+    sub_area = None
+    best_sub = _best(buckets.get("sub_area", []))
+    if best_sub is not None:
+        length, _, start, main_areas = best_sub
+        sub_name = text[start:start + length]
+        region = next((a for a in main_areas if a in mentioned_regions), main_areas[0])
+        # "광주"처럼 세부 지역명 자체가 광역 지역명으로 해석되면 세부 지역 없음
+        sub_area = sub_name if sub_name != region else None
+    else:
+        best_region = _best(buckets.get("region", []))
+        if best_region is not None:
+            region = best_region[3]
+
+    # 언급된 모든 광역 지역 (대표 지역 → 세부 지역 순위 → 광역 지역 순위)
+    regions: List[str] = [region] if region else []
+    for candidate in sorted(buckets.get("sub_area", []), key=lambda c: (-c[0], c[1], c[2])):
+        main_areas = candidate[3]
+        resolved = next((a for a in main_areas if a in mentioned_regions), main_areas[0])
+        if resolved not in regions:
+            regions.append(resolved)
+    for candidate in sorted(buckets.get("region", []), key=lambda c: (-c[0], c[1], c[2])):
+        if candidate[3] not in regions:
+            regions.append(candidate[3])
+
+    # 키워드: 긴 매칭 → 그룹 우선순위 (중복 그룹 제거)
+    keywords: List[str] = []
+    keyword_terms: List[str] = []
+    for candidate in sorted(buckets.get("keyword", []), key=lambda c: (-c[0], c[1], c[2])):
+        if candidate[3] not in keywords:
+            keywords.append(candidate[3])
+        term = text[candidate[2]:candidate[2] + candidate[0]]
+        if term not in keyword_terms:
+            keyword_terms.append(term)
+
+    def by_priority(kind: str) -> Optional[Any]:
+        candidates = buckets.get(kind, [])
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: (c[1], c[2]))[3]
+
+    return {
+        "region": region,
+        "regions": regions,
+        "sub_area": sub_area,
+        "keyword": keywords[0] if keywords else None,
+        "keywords": keywords,
+        "keyword_terms": keyword_terms,
+        "theme": by_priority("theme"),
+        "indoor_outdoor": by_priority("indoor_outdoor"),
+        "max_time": by_priority("max_time"),
+    }
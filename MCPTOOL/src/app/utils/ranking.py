@@ -0,0 +1,142 @@
+"""여행지 후보 랭킹
+
+필터링된 후보를 LLM에 넘기기 전에 점수를 매겨 상위 k개만 남깁니다.
+
+점수 = 키워드 일치 + 테마 일치 + 쿼리 임베딩 코사인 유사도 + 인기도(대표 이미지 유무, 검색 순위)
+각 항목 가중치는 settings.rank_weight_* 로 조정합니다.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Sequence
+import numpy as np
+from app.utils.config import settings
+from app.utils.filter import THEME_KEYWORDS
+
+
+def keyword_scores(items: List[Dict[str, Any]], keywords: Sequence[str]) -> np.ndarray:
+    """
+    제목에 포함된 키워드 비율 (주소에만 있으면 절반 점수)
+
+    한 글자 키워드(예: "산")는 "부산" 같은 지명에 걸리므로 제외합니다.
+    """
+    scores = np.zeros(len(items))
+    keywords = [keyword.lower() for keyword in keywords if keyword and len(keyword) > 1]
+    if not keywords or not items:
+        return scores
+    for idx, item in enumerate(items):
+        title = (item.get("title", "") or "").lower()
+        addr = (item.get("addr1", "") or "").lower()
+        hit = 0.0
+        for keyword in keywords:
+            if keyword in title:
+                hit += 1.0
+            elif keyword in addr:
+                hit += 0.5
+        scores[idx] = hit
+    return scores / len(keywords)
+
+
+@lru_cache(maxsize=64)
+def _theme_pattern(theme: str) -> Optional[Pattern[str]]:
+    """테마 키워드 중 두 글자 이상만 (사전에 없는 테마는 테마명 자체)"""
+    words = [word.lower() for word in THEME_KEYWORDS.get(theme, [theme]) if len(word) > 1]
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word) for word in words))
+
+
+def theme_scores(items: List[Dict[str, Any]], theme: str) -> np.ndarray:
+    """
+    제목에 테마 키워드가 있으면 1
+
+    필터용 테마 사전의 한 글자 키워드(예: 힐링의 "산")는 "부산…" 같은 제목에도 걸리므로
+    점수에는 반영하지 않습니다.
+    """
+    pattern = _theme_pattern(theme)
+    if pattern is None or not items:
+        return np.zeros(len(items))
+    return np.fromiter(
+        (1.0 if pattern.search((item.get("title", "") or "").lower()) else 0.0 for item in items),
+        dtype=float,
+        count=len(items)
+    )
+
+
+def embedding_scores(query_vector: Any, item_vectors: Sequence[Optional[Any]]) -> np.ndarray:
+    """쿼리와 각 아이템 임베딩의 코사인 유사도 (벡터가 없으면 0, 음수는 0으로 자름)"""
+    scores = np.zeros(len(item_vectors))
+    present = [idx for idx, vector in enumerate(item_vectors) if vector is not None]
+    if query_vector is None or not present:
+        return scores
+
+    matrix = np.asarray([item_vectors[idx] for idx in present], dtype=np.float32)
+    query = np.asarray(query_vector, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    cosine = np.divide(matrix @ query, norms, out=np.zeros(len(present), dtype=np.float32), where=norms > 0)
+    scores[present] = np.clip(cosine, 0.0, 1.0)
+    return scores
+
+
+def popularity_scores(items: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    인기도 대용 점수
+
+    검색 API가 조회수를 내려주지 않으므로, 대표 이미지 유무와
+    검색 결과 순위(다중 검색 RRF 병합 순서)를 절반씩 반영합니다.
+    """
+    count = len(items)
+    if not count:
+        return np.zeros(0)
+    has_image = np.fromiter(
+        (bool(item.get("firstimage") or item.get("firstimage2")) for item in items),
+        dtype=bool,
+        count=count
+    )
+    position = 1.0 - np.arange(count) / count
+    return 0.5 * has_image + 0.5 * position
+
+
+def score_items(
+    items: List[Dict[str, Any]],
+    parsed: Dict[str, Any],
+    query_vector: Any = None,
+    item_vectors: Optional[Sequence[Optional[Any]]] = None
+) -> np.ndarray:
+    """parse_query 결과와 (선택) 임베딩으로 아이템별 관련도 점수 계산"""
+    # 그룹 이름이 아니라 쿼리에 실제로 등장한 동의어로 매칭
+    keywords = list(parsed.get("keyword_terms") or [])
+    if parsed.get("sub_area"):
+        keywords.append(parsed["sub_area"])
+
+    scores = settings.rank_weight_keyword * keyword_scores(items, keywords)
+    if parsed.get("theme"):
+        scores += settings.rank_weight_theme * theme_scores(items, parsed["theme"])
+    if query_vector is not None and item_vectors is not None:
+        scores += settings.rank_weight_embedding * embedding_scores(query_vector, item_vectors)
+    scores += settings.rank_weight_popularity * popularity_scores(items)
+    return scores
+
+
+def rank_items(
+    items: List[Dict[str, Any]],
+    parsed: Dict[str, Any],
+    query_vector: Any = None,
+    item_vectors: Optional[Sequence[Optional[Any]]] = None,
+    top_k: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    관련도 점수 상위 top_k개 아이템 (점수 내림차순, 동점이면 원래 순서)
+
+    Args:
+        items: 후보 아이템
+        parsed: parse_query 결과
+        query_vector: 쿼리 임베딩 (없으면 임베딩 점수 생략)
+        item_vectors: items와 같은 순서의 아이템 임베딩 (없는 자리는 None)
+        top_k: 남길 개수 (기본값: settings.rank_top_k)
+    """
+    if not items:
+        return []
+    top_k = settings.rank_top_k if top_k is None else top_k
+    scores = score_items(items, parsed, query_vector, item_vectors)
+    order = np.argsort(-scores, kind="stable")[:top_k]
+    return [items[idx] for idx in order.tolist()]
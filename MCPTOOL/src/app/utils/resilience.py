@@ -0,0 +1,335 @@
+"""업스트림 호출 복원력 (재시도 + 서킷 브레이커 + 헤지 요청)
+
+- retry_async: 재시도 가능한 오류에 대해 지터가 섞인 지수 백오프로 재시도 (전체 마감 시간 준수)
+- CircuitBreaker: 연속 실패가 임계값을 넘으면 일정 시간 동안 호출 없이 즉시 실패,
+  이후 한 번의 시험 호출(half-open)로 복구 여부를 확인
+- hedged_call: 지연이 긴 꼬리(tail latency)를 줄이기 위해 일정 시간 후 같은 요청을 하나 더 보내고 먼저 온 결과 사용
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 업스트림 호출을 생략한 경우"""
+
+
+class CircuitBreaker:
+    """
+    closed → (연속 실패 failure_threshold회) → open → (reset_timeout 경과) → half_open
+    half_open 상태에서는 시험 호출 하나만 통과시키고, 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str = "breaker", failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open에서는 시험 호출 하나만 허용)"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self._failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def release(self):
+        """결과를 판단할 수 없는 호출(재시도 불가 오류 등) 후 half_open 시험 자리 반환"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        is_failure: Callable[[BaseException], bool] = lambda e: True
+    ) -> T:
+        """
+        서킷을 거쳐 fn 실행
+
+        is_failure(e)가 False인 오류(예: 잘못된 요청)는 실패로 세지 않고 그대로 전달합니다.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"[{self.name}] 업스트림 장애로 서킷이 열려 있습니다 (잠시 후 재시도)")
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        except BaseException as e:
+            if is_failure(e):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        self.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+        return {
+            "name": self.name,
+            "state": state,
+            "consecutive_failures": self._failures,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
+
+
+class RetryStats:
+    """재시도 통계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.retries = 0
+        self.gave_up = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "retries": self.retries, "gave_up": self.gave_up}
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """full jitter 지수 백오프: 0 ~ min(max_delay, base_delay * 2^attempt)"""
+    return random.uniform(0.0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[T]],
+    is_retryable: Callable[[BaseException], bool],
+    attempts: int = 3,
+    base_delay: float = 0.2,
+    max_delay: float = 2.0,
+    deadline: Optional[float] = None,
+    stats: Optional[RetryStats] = None
+) -> T:
+    """
+    fn을 최대 attempts회 실행
+
+    Args:
+        fn: 실행할 코루틴 함수
+        is_retryable: 재시도할 오류인지 판단
+        attempts: 최대 시도 횟수 (첫 시도 포함)
+        base_delay: 백오프 기본 지연 (초)
+        max_delay: 백오프 최대 지연 (초)
+        deadline: 전체 마감 시간 (초). 각 시도는 남은 시간 안에 끝나야 하며(초과 시 취소),
+            다음 대기가 마감을 넘기면 재시도하지 않음
+        stats: 재시도 통계 누적 대상
+
+    Raises:
+        asyncio.TimeoutError: 마감 시간 안에 성공하지 못한 경우 (시도 중 초과 포함)
+    """
+    started = time.monotonic()
+    if stats is not None:
+        stats.calls += 1
+
+    attempt = 0
+    while True:
+        try:
+            if deadline is None:
+                return await fn()
+            remaining = deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            return await asyncio.wait_for(fn(), timeout=remaining)
+        except asyncio.TimeoutError:
+            # 마감 시간 초과는 재시도하지 않음 (남은 시간이 없음)
+            if stats is not None and attempt > 0:
+                stats.gave_up += 1
+            raise
+        except Exception as e:
+            attempt += 1
+            if attempt >= attempts or not is_retryable(e):
+                if stats is not None and attempt > 1:
+                    stats.gave_up += 1
+                raise
+            delay = backoff_delay(attempt - 1, base_delay, max_delay)
+            if deadline is not None and time.monotonic() - started + delay >= deadline:
+                if stats is not None:
+                    stats.gave_up += 1
+                raise
+            if stats is not None:
+                stats.retries += 1
+            await asyncio.sleep(delay)
+
+
+class LatencyWindow:
+    """최근 N개 호출 지연 시간 (헤지 지연 계산용 백분위수)"""
+
+    def __init__(self, size: int = 200):
+        self.size = size
+        self._samples: List[float] = []
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            if len(self._samples) > self.size:
+                del self._samples[:len(self._samples) - self.size]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q (0~1) 백분위수, 샘플이 없으면 None"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        idx = min(len(samples) - 1, max(0, int(round(q * (len(samples) - 1)))))
+        return samples[idx]
+
+
+class HedgeStats:
+    """헤지 요청 통계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.hedged = 0  # 헤지 지연이 지나서 보낸 추가 요청
+        self.hedge_wins = 0
+        self.retries = 0  # 진행 중인 요청이 모두 실패해서 다시 보낸 요청
+        self.timeouts = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+        }
+
+
+async def hedged_call(
+    fn: Callable[[], Awaitable[T]],
+    hedge_delay: Optional[float],
+    timeout: Optional[float] = None,
+    max_attempts: int = 2,
+    stats: Optional[HedgeStats] = None
+) -> T:
+    """
+    헤지 요청: 첫 요청이 hedge_delay 안에 끝나지 않으면 같은 요청을 하나 더 보내고 먼저 성공한 결과 사용
+
+    진행 중인 요청이 모두 실패하면 남은 시도 횟수만큼 바로 다시 보냅니다.
+    먼저 끝난 결과를 받으면 나머지 요청은 취소합니다.
+
+    Args:
+        fn: 요청 코루틴 함수 (호출할 때마다 새 요청)
+        hedge_delay: 추가 요청을 보내기까지 기다리는 시간 (초, None이면 헤지하지 않음)
+        timeout: 전체 마감 시간 (초, 초과 시 asyncio.TimeoutError)
+        max_attempts: 최대 동시/연속 요청 수
+        stats: 헤지 통계 누적 대상
+
+    Raises:
+        asyncio.TimeoutError: 마감 시간 초과
+        Exception: 모든 요청이 실패한 경우 마지막 오류
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + timeout if timeout is not None else None
+    if stats is not None:
+        stats.calls += 1
+
+    first = asyncio.ensure_future(fn())
+    pending: Set["asyncio.Future[T]"] = {first}
+    hedges: Set["asyncio.Future[T]"] = set()
+    launched = 1
+    next_hedge = started + hedge_delay if hedge_delay is not None and max_attempts > 1 else None
+    last_error: Optional[BaseException] = None
+    try:
+        while True:
+            now = loop.time()
+            waits = [moment - now for moment in (next_hedge, deadline) if moment is not None]
+            wait_timeout = max(min(waits), 0.0) if waits else None
+            done: Set["asyncio.Future[T]"] = set()
+            if pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+            for task in done:
+                if task.exception() is None:
+                    if stats is not None and task in hedges:
+                        stats.hedge_wins += 1
+                    return task.result()
+                last_error = task.exception()
+
+            now = loop.time()
+            if deadline is not None and now >= deadline:
+                if stats is not None:
+                    stats.timeouts += 1
+                raise asyncio.TimeoutError()
+
+            # 헤지 지연이 지났거나 진행 중인 요청이 모두 실패했으면 다음 요청 시작
+            if launched < max_attempts and (not pending or (next_hedge is not None and now >= next_hedge)):
+                task = asyncio.ensure_future(fn())
+                if pending:
+                    hedges.add(task)
+                if stats is not None:
+                    if pending:
+                        stats.hedged += 1
+                    else:
+                        stats.retries += 1
+                pending.add(task)
+                launched += 1
+                next_hedge = now + hedge_delay if hedge_delay is not None and launched < max_attempts else None
+            elif not pending:
+                assert last_error is not None
+                raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
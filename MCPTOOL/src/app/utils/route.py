@@ -0,0 +1,199 @@
+"""여행 코스 동선 최적화
+
+여행지 좌표(mapx/mapy)로 haversine 거리 행렬을 만들고
+최근접 이웃(nearest neighbour)으로 초기 경로를 만든 뒤 2-opt로 교차 구간을 풀어
+지그재그 없는 방문 순서를 정합니다. 시간 예산(max_time)이 주어지면
+체류 시간 + 이동 시간 누적이 예산을 넘지 않는 곳까지만 남깁니다.
+"""
+import time
+from typing import Any, Dict, List, Optional
+import numpy as np
+from app.utils.geo import haversine_matrix_km, item_coordinates
+
+
+# 콘텐츠 타입별 예상 체류 시간 (분)
+STAY_MINUTES: Dict[str, int] = {
+    "12": 60,   # 관광지
+    "14": 90,   # 문화시설
+    "15": 90,   # 축제/공연/행사
+    "25": 120,  # 여행코스
+    "28": 120,  # 레포츠
+    "32": 0,    # 숙박
+    "38": 60,   # 쇼핑
+    "39": 60,   # 음식점
+}
+DEFAULT_STAY_MINUTES = 60
+
+# 코스 아이템 이름 ↔ 여행지 제목 부분 일치로 인정하는 최소 글자 수 (공백 제외, "공원" 같은 일반명사 배제)
+MIN_NAME_MATCH_CHARS = 3
+
+
+def estimate_stay_minutes(item: Dict[str, Any]) -> int:
+    """콘텐츠 타입 기준 예상 체류 시간 (분)"""
+    return STAY_MINUTES.get(str(item.get("contenttypeid", "") or ""), DEFAULT_STAY_MINUTES)
+
+
+def _path_length(order: List[int], dist: np.ndarray) -> float:
+    return float(sum(dist[a, b] for a, b in zip(order, order[1:])))
+
+
+def _nearest_neighbour(dist: np.ndarray, start: int) -> List[int]:
+    count = len(dist)
+    visited = np.zeros(count, dtype=bool)
+    order = [start]
+    visited[start] = True
+    for _ in range(count - 1):
+        row = np.where(visited, np.inf, dist[order[-1]])
+        nxt = int(np.argmin(row))
+        order.append(nxt)
+        visited[nxt] = True
+    return order
+
+
+def _two_opt(order: List[int], dist: np.ndarray, time_budget_s: float) -> List[int]:
+    """열린 경로(시작점 고정) 2-opt 개선, time_budget_s 안에서 더 이상 개선이 없을 때까지"""
+    deadline = time.perf_counter() + time_budget_s
+    best = list(order)
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for i in range(1, len(best) - 1):
+            for j in range(i + 1, len(best)):
+                a, b = best[i - 1], best[i]
+                c = best[j]
+                d = best[j + 1] if j + 1 < len(best) else None
+                before = dist[a, b] + (dist[c, d] if d is not None else 0.0)
+                after = dist[a, c] + (dist[b, d] if d is not None else 0.0)
+                if after + 1e-9 < before:
+                    best[i:j + 1] = reversed(best[i:j + 1])
+                    improved = True
+    return best
+
+
+def plan_route(
+    items: List[Dict[str, Any]],
+    max_time: Optional[int] = None,
+    speed_kmh: float = 30.0,
+    min_stops: int = 2,
+    time_budget_s: float = 0.02
+) -> Dict[str, Any]:
+    """
+    방문 순서 최적화
+
+    Args:
+        items: 여행지 아이템 (첫 번째 아이템을 출발지로 고정)
+        max_time: 총 시간 예산 (분, 체류 + 이동), None이면 자르지 않음
+        speed_kmh: 이동 평균 속도 (직선거리 기준)
+        min_stops: 시간 예산을 넘더라도 남길 최소 방문지 수
+        time_budget_s: 2-opt 개선에 쓸 최대 시간 (초)
+
+    Returns:
+        {
+            "items": 방문 순서대로 정렬된 아이템 (좌표 없는 아이템은 예산 안에서 뒤에 원래 순서대로),
+            "total_km": 이동 거리 합,
+            "total_minutes": 체류 + 이동 시간 합,
+        }
+    """
+    if not items:
+        return {"items": [], "total_km": 0.0, "total_minutes": 0}
+
+    lons, lats, valid = item_coordinates(items)
+    located = np.nonzero(valid)[0].tolist()
+    unlocated = [idx for idx in range(len(items)) if not valid[idx]]
+
+    order: List[int] = []
+    dist = np.zeros((0, 0))
+    if located:
+        dist = haversine_matrix_km(lons[located], lats[located])
+        local_order = _nearest_neighbour(dist, 0)
+        if len(local_order) > 3:
+            local_order = _two_opt(local_order, dist, time_budget_s)
+        order = local_order
+
+    # 시간 예산 적용 (경로 순서대로 누적)
+    minutes_per_km = 60.0 / speed_kmh if speed_kmh > 0 else 0.0
+    kept: List[int] = []
+    total_km = 0.0
+    total_minutes = 0.0
+    for position, local_idx in enumerate(order):
+        leg_km = float(dist[order[position - 1], local_idx]) if position else 0.0
+        stay = estimate_stay_minutes(items[located[local_idx]])
+        cost = stay + leg_km * minutes_per_km
+        if max_time is not None and len(kept) >= min_stops and total_minutes + cost > max_time:
+            break
+        kept.append(local_idx)
+        total_km += leg_km
+        total_minutes += cost
+
+    # 좌표 없는 아이템은 이동 시간 없이 체류 시간만 남은 예산에서 차감하며 뒤에 추가
+    ordered = [items[located[local_idx]] for local_idx in kept]
+    for idx in unlocated:
+        stay = estimate_stay_minutes(items[idx])
+        if max_time is not None and len(ordered) >= min_stops and total_minutes + stay > max_time:
+            continue
+        ordered.append(items[idx])
+        total_minutes += stay
+
+    return {
+        "items": ordered,
+        "total_km": round(total_km, 2),
+        "total_minutes": int(round(total_minutes)),
+    }
+
+
+def order_course(
+    course: List[Dict[str, Any]],
+    items: List[Dict[str, Any]],
+    speed_kmh: float = 30.0
+) -> List[Dict[str, Any]]:
+    """
+    LLM이 만든 코스를 실제 좌표 기준 동선 순서로 재정렬 (후처리)
+
+    코스 아이템 name을 여행지 title과 매칭하고, 매칭된 곳만 동선 순서로 바꿉니다.
+    매칭은 공백을 무시한 완전 일치를 우선하고, 없으면 MIN_NAME_MATCH_CHARS 이상 겹치는
+    포함 관계 중 가장 길게 겹치는 제목을 고릅니다.
+    매칭되지 않은 아이템(식사 시간 등)은 원래 위치를 유지합니다.
+    """
+    def normalize(text: str) -> str:
+        return "".join(str(text).split())
+
+    by_title: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        title = normalize(item.get("title", "") or "")
+        if title and title not in by_title:
+            by_title[title] = item
+
+    def match(name: str) -> Optional[Dict[str, Any]]:
+        name = normalize(name)
+        if not name:
+            return None
+        if name in by_title:
+            return by_title[name]
+        best, best_len = None, 0
+        for title, item in by_title.items():
+            if title in name or name in title:
+                overlap = min(len(title), len(name))
+                if overlap >= MIN_NAME_MATCH_CHARS and overlap > best_len:
+                    best, best_len = item, overlap
+        return best
+
+    slots = []
+    matched_items = []
+    for position, course_item in enumerate(course):
+        item = match(str(course_item.get("name", "")))
+        if item is not None and item not in matched_items:
+            slots.append(position)
+            matched_items.append(item)
+
+    if len(matched_items) < 3:
+        return course
+
+    # 매칭된 아이템 순서 재계산 (첫 방문지는 LLM 선택 유지)
+    route = plan_route(matched_items, speed_kmh=speed_kmh)["items"]
+    route_ids = [id(item) for item in route]
+    by_item = {id(matched_items[k]): course[slots[k]] for k in range(len(slots))}
+
+    reordered = list(course)
+    for slot, item_id in zip(slots, route_ids):
+        reordered[slot] = by_item[item_id]
+    return reordered
@@ -0,0 +1,52 @@
+"""동시 동일 요청 병합 (single-flight)"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 호출을 하나의 실행으로 합칩니다.
+
+    첫 호출이 실제 작업을 Task로 실행하고, 실행 중에 들어온 같은 키의 호출은
+    그 Task의 결과(또는 예외)를 함께 받습니다. 개별 호출자가 취소되어도
+    공유 Task는 취소되지 않습니다 (asyncio.shield).
+    """
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+        # 통계
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key에 대해 fn()을 실행하거나, 이미 실행 중이면 그 결과를 기다림"""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]"):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계"""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
@@ -0,0 +1,133 @@
+"""서버 시작 준비 상태 (워밍업) 및 시작 시간 측정
+
+app.main에서 가장 먼저 import해 이 모듈이 로드된 시각을 시작 기준으로 삼습니다.
+
+- import 시간: 기준 시각 → app.main 모듈 로드 완료
+- 워밍업 시간: 구성 요소(임베딩 모델/Chroma, LLM 클라이언트)별 준비 시간
+- 첫 정상 응답 시간: 기준 시각 → 엔드포인트별 첫 2xx 응답
+"""
+import asyncio
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+_STARTED = time.perf_counter()
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+
+class StartupState:
+    """워밍업 구성 요소 상태 + 시작 시간 기록"""
+
+    def __init__(self, started: float):
+        self.started = started
+        self.import_seconds: Optional[float] = None
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.first_success: Dict[str, float] = {}
+        # 워밍업 구성 요소 등록이 끝났는지 (등록 전에는 구성 요소가 없어도 ready가 아님)
+        self.registered = False
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def mark_imported(self):
+        """app.main 모듈 로드 완료 시점 기록"""
+        if self.import_seconds is None:
+            self.import_seconds = self.elapsed()
+
+    def expect(self, name: str):
+        """준비가 끝나야 ready가 되는 구성 요소 등록"""
+        self.components[name] = {"status": PENDING, "seconds": None, "error": None}
+
+    def register(self, names: Iterable[str]):
+        """워밍업할 구성 요소를 한꺼번에 등록 (워밍업 태스크를 시작하기 전에 호출)"""
+        for name in names:
+            self.expect(name)
+        self.registered = True
+
+    def is_ready(self) -> bool:
+        return self.registered and all(component["status"] == READY for component in self.components.values())
+
+    def record_first_success(self, endpoint: str):
+        """엔드포인트별 첫 정상 응답까지 걸린 시간 (처음 한 번만)"""
+        if endpoint not in self.first_success:
+            self.first_success[endpoint] = self.elapsed()
+
+    async def warm_up(self, name: str, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """구성 요소 하나 워밍업 (실패해도 예외를 올리지 않고 상태에 기록), 성공 여부 반환"""
+        component = self.components.setdefault(name, {"status": PENDING, "seconds": None, "error": None})
+        component["attempts"] = component.get("attempts", 0) + 1
+        started = time.perf_counter()
+        try:
+            detail = await fn()
+        except Exception as e:
+            component.update(status=FAILED, error=str(e) or type(e).__name__)
+            print(f"워밍업 실패 ({name}, {component['attempts']}회차): {component['error']}")
+            traceback.print_exc()
+            succeeded = False
+        else:
+            component.update(status=READY, error=None)
+            if isinstance(detail, dict):
+                component.update(detail)
+            succeeded = True
+        component["seconds"] = round(time.perf_counter() - started, 3)
+        return succeeded
+
+    async def warm_up_retrying(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 300.0
+    ):
+        """
+        성공할 때까지 지수 백오프로 다시 워밍업
+
+        모델 다운로드/Chroma 오류 같은 일시적 실패로 /ready가 계속 503에 머물지 않도록 합니다.
+        (재시도 사이에는 FAILED 상태와 마지막 오류가 그대로 노출됨)
+        """
+        delay = retry_delay
+        while not await self.warm_up(name, fn):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_retry_delay)
+
+    async def warm_up_all(self, steps: Dict[str, Callable[[], Awaitable[Any]]]):
+        """등록된 구성 요소를 동시에 워밍업 (실패한 구성 요소는 성공할 때까지 재시도)"""
+        if not self.registered:
+            self.register(steps)
+        await asyncio.gather(*(self.warm_up_retrying(name, fn) for name, fn in steps.items()))
+        status = ", ".join(f"{name}={component['status']}({component['seconds']}s)"
+                           for name, component in self.components.items())
+        print(f"워밍업 완료 ({self.elapsed():.2f}초): {status}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.is_ready(),
+            "uptime_seconds": round(self.elapsed(), 3),
+            "import_seconds": round(self.import_seconds, 3) if self.import_seconds is not None else None,
+            "components": self.components,
+            "first_success_seconds": {name: round(value, 3) for name, value in self.first_success.items()},
+        }
+
+    def collect(self) -> List[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]:
+        """지표 수집기 (metrics.REGISTRY.register_collector용)"""
+        families = [
+            ("app_ready", "gauge", "워밍업 완료 여부 (1=ready)", [({}, 1.0 if self.is_ready() else 0.0)]),
+        ]
+        if self.import_seconds is not None:
+            families.append(("app_import_seconds", "gauge", "app.main import 시간 (초)",
+                             [({}, self.import_seconds)]))
+        warmed = [({"component": name}, component["seconds"])
+                  for name, component in self.components.items() if component["seconds"] is not None]
+        if warmed:
+            families.append(("app_warmup_seconds", "gauge", "구성 요소별 워밍업 시간 (초)", warmed))
+        if self.first_success:
+            families.append(("app_first_success_seconds", "gauge", "시작 후 엔드포인트별 첫 정상 응답까지 시간 (초)",
+                             [({"endpoint": name}, value) for name, value in self.first_success.items()]))
+        return families
+
+
+startup_state = StartupState(_STARTED)
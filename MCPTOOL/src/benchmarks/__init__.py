@@ -0,0 +1,6 @@
+"""CPU 위주 파이프라인 구간 마이크로 벤치마크 (오프라인 실행)
+
+실행:
+    python -m benchmarks.run                       # 결과를 benchmarks/results/<시각>.json 에 저장
+    python -m benchmarks.run --compare 이전결과.json  # 이전 결과와 비교 (회귀 시 종료 코드 1)
+"""
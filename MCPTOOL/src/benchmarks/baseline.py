@@ -0,0 +1,55 @@
+"""비교 기준용 이전 구현
+
+최적화 전 코드를 그대로 옮겨 두고, 같은 입력으로 현재 구현과 나란히 측정합니다.
+(결과가 같아야 하므로 동작은 바꾸지 않음)
+"""
+from typing import Any, Dict, List, Optional
+
+
+def filter_tourism_items(
+    items: List[Dict[str, Any]],
+    theme: Optional[str] = None,
+    indoor_outdoor: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """아이템마다 클로저로 키워드를 검사하던 이전 filter_tourism_items (테마 / 실내·실외)"""
+    filtered = items.copy()
+
+    if theme:
+        theme_keywords = {
+            "데이트": ["카페", "레스토랑", "공원", "전시", "영화"],
+            "가족": ["공원", "박물관", "체험", "놀이", "아이"],
+            "힐링": ["산", "바다", "공원", "카페", "스파"],
+            "문화": ["박물관", "미술관", "전시", "공연", "역사"],
+            "야경": ["타워", "전망", "다리", "산"],
+        }
+
+        keywords = theme_keywords.get(theme, [theme])
+
+        def matches_theme(item):
+            title = item.get("title", "").lower()
+            for keyword in keywords:
+                if keyword.lower() in title:
+                    return True
+            return False
+
+        filtered = [item for item in filtered if matches_theme(item)]
+
+    if indoor_outdoor:
+        indoor_keywords = ["실내", "미술관", "박물관", "카페", "레스토랑", "쇼핑", "영화"]
+        outdoor_keywords = ["산", "바다", "공원", "해변", "등산", "산책"]
+
+        def is_indoor_or_outdoor(item, is_indoor: bool):
+            title = item.get("title", "").lower()
+            addr = (item.get("addr1", "") + item.get("addr2", "")).lower()
+            text = title + " " + addr
+
+            keywords = indoor_keywords if is_indoor else outdoor_keywords
+            for keyword in keywords:
+                if keyword in text:
+                    return True
+            return False
+
+        is_indoor = indoor_outdoor.lower() == "indoor"
+        filtered = [item for item in filtered if is_indoor_or_outdoor(item, is_indoor)]
+
+    return filtered
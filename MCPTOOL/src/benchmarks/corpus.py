@@ -0,0 +1,92 @@
+"""벤치마크용 고정 코퍼스
+
+KorService2 searchKeyword2 응답 형태의 합성 여행지 아이템과 한국어 쿼리를 시드 고정으로 생성합니다.
+실행할 때마다 같은 데이터가 만들어지므로 커밋 간 결과를 비교할 수 있습니다.
+"""
+import json
+import random
+from typing import Any, Dict, List
+
+
+SEED = 20240601
+
+# (지역명, 지역 코드, 시군구, 중심 경도, 중심 위도)
+REGIONS = [
+    ("서울특별시", "1", ["종로구", "중구", "마포구", "강남구", "송파구"], 126.98, 37.57),
+    ("부산광역시", "6", ["해운대구", "수영구", "중구", "기장군", "영도구"], 129.07, 35.18),
+    ("강원특별자치도", "32", ["강릉시", "속초시", "춘천시", "양양군", "고성군"], 128.60, 37.75),
+    ("제주특별자치도", "39", ["제주시", "서귀포시"], 126.55, 33.40),
+    ("경상북도", "35", ["경주시", "안동시", "포항시"], 129.21, 35.85),
+    ("전라남도", "38", ["여수시", "순천시", "목포시"], 127.66, 34.76),
+]
+
+PLACE_WORDS = [
+    "해수욕장", "해변", "공원", "박물관", "미술관", "카페", "레스토랑", "전망대", "타워", "시장",
+    "산책로", "둘레길", "등산로", "계곡", "사찰", "한옥마을", "체험마을", "놀이공원", "스파", "야시장",
+    "수목원", "전시관", "케이블카", "다리", "항구", "오름", "숲길", "레일바이크", "서점", "공연장",
+]
+PREFIXES = ["해운대", "광안리", "경포", "성산", "불국사", "북촌", "남산", "감천", "오동도", "순천만", "속초", "한라"]
+CONTENT_TYPES = ["12", "12", "12", "14", "14", "15", "28", "32", "38", "39", "39"]
+
+QUERIES = [
+    "부산에서 3시간 바다 코스 추천해줘",
+    "서울 실내 위주 데이트 코스",
+    "가족이랑 갈만한 제주도 반나절 여행지",
+    "강릉 카페 투어 하루 코스",
+    "경주 역사 문화 여행 2시간",
+    "여수 야경 명소 데이트",
+    "속초 등산 힐링 코스 추천",
+    "비 오는 날 서울 박물관 실내 코스",
+    "부산 해운대 맛집이랑 산책",
+    "제주 오름 트레킹 하루",
+    "고성 바다 캠핑 여행",
+    "아이와 함께 가는 체험 여행 전남",
+]
+
+COURSE_RESPONSE = {
+    "course": [
+        {
+            "name": f"장소 {idx}",
+            "description": "바다를 바라보며 산책하기 좋은 곳입니다. " * 2,
+            "address": "부산광역시 해운대구 우동",
+            "type": "관광지",
+            "time": "1시간",
+        }
+        for idx in range(5)
+    ],
+    "summary": "이 코스는 부산의 주요 명소를 5시간 동안 둘러보는 코스입니다.",
+}
+
+
+def make_items(count: int, seed: int = SEED) -> List[Dict[str, Any]]:
+    """합성 여행지 아이템 count개"""
+    rng = random.Random(seed)
+    items = []
+    for idx in range(count):
+        region, area_code, districts, lon, lat = rng.choice(REGIONS)
+        district = rng.choice(districts)
+        title = f"{rng.choice(PREFIXES)} {rng.choice(PLACE_WORDS)}"
+        if rng.random() < 0.3:
+            title += f" {rng.choice(PLACE_WORDS)}"
+        items.append({
+            "contentid": str(100000 + idx),
+            "contenttypeid": rng.choice(CONTENT_TYPES),
+            "areacode": area_code,
+            "sigungucode": str(rng.randint(1, 20)),
+            "title": title,
+            "addr1": f"{region} {district} {rng.choice(['중앙로', '해안로', '산책길', '역사길'])} {rng.randint(1, 300)}",
+            "addr2": "" if rng.random() < 0.7 else f"{rng.randint(1, 30)}층",
+            "tel": "" if rng.random() < 0.4 else f"0{rng.randint(2, 64)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            "mapx": f"{lon + rng.uniform(-0.25, 0.25):.7f}",
+            "mapy": f"{lat + rng.uniform(-0.2, 0.2):.7f}",
+            "firstimage": "" if rng.random() < 0.35 else f"http://tong.visitkorea.or.kr/cms/resource/{idx}.jpg",
+            "firstimage2": "",
+            "modifiedtime": f"2024{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}120000",
+        })
+    return items
+
+
+def course_response_text(fenced: bool = True) -> str:
+    """LLM 응답 형태의 코스 JSON 문자열 (코드블럭 포함 여부 선택)"""
+    body = json.dumps(COURSE_RESPONSE, ensure_ascii=False, indent=2)
+    return f"```json\n{body}\n```" if fenced else body
@@ -0,0 +1,394 @@
+"""마이크로 벤치마크 실행기
+
+각 벤치마크는 준비(setup) 함수가 측정 대상 함수(인자 없음)를 반환하는 형태입니다.
+측정 대상은 한 라운드가 --min-time초 이상 걸리도록 반복 횟수를 맞춘 뒤 --rounds번 실행하고,
+1회 실행 시간(µs)의 최소/중앙값/평균/표준편차를 JSON으로 저장합니다.
+
+선택 의존성(chromadb, sentence-transformers, google-generativeai)이나 임베딩 모델이 없으면
+해당 벤치마크는 건너뛰고 결과에 사유를 남깁니다.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from benchmarks.corpus import QUERIES, course_response_text, make_items
+
+
+Bench = Callable[[], Any]
+BENCHMARKS: List[Tuple[str, Callable[[], Bench]]] = []
+_CLEANUPS: List[Callable[[], None]] = []
+
+
+class Skip(Exception):
+    """실행 환경에 필요한 의존성이 없어 건너뛰는 벤치마크"""
+
+
+def benchmark(name: str):
+    """벤치마크 등록 데코레이터"""
+    def register(setup: Callable[[], Bench]) -> Callable[[], Bench]:
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+
+def _cycle(values: List[Any]) -> Callable[[], Any]:
+    state = {"idx": 0}
+
+    def next_value():
+        value = values[state["idx"] % len(values)]
+        state["idx"] += 1
+        return value
+    return next_value
+
+
+# ==========================
+# 쿼리 해석
+# ==========================
+@benchmark("query.parse_query")
+def bench_parse_query() -> Bench:
+    from app.utils.query_parser import parse_query
+    next_query = _cycle(QUERIES)
+    return lambda: parse_query(next_query())
+
+
+@benchmark("query.extract_filters_from_query")
+def bench_extract_filters() -> Bench:
+    from app.utils.filter import extract_filters_from_query
+    next_query = _cycle(QUERIES)
+    return lambda: extract_filters_from_query(next_query())
+
+
+# ==========================
+# 필터링 / 랭킹 / 동선
+# ==========================
+def _filter_bench(count: int, **filters: Any) -> Bench:
+    from app.utils.filter import filter_tourism_items
+    items = make_items(count)
+    return lambda: filter_tourism_items(items, **filters)
+
+
+@benchmark("filter.theme_1k")
+def bench_filter_theme() -> Bench:
+    return _filter_bench(1000, theme="데이트")
+
+
+def _filter_pair(count: int) -> None:
+    """테마 + 실내 필터를 현재 구현과 이전 구현(benchmarks.baseline)으로 나란히 등록"""
+    filters: Dict[str, Any] = {"theme": "데이트", "indoor_outdoor": "indoor"}
+
+    @benchmark(f"filter.theme_indoor_{count}")
+    def current() -> Bench:
+        return _filter_bench(count, **filters)
+
+    @benchmark(f"filter.baseline_theme_indoor_{count}")
+    def baseline() -> Bench:
+        from app.utils.filter import filter_tourism_items
+        from benchmarks.baseline import filter_tourism_items as baseline_filter
+        items = make_items(count)
+        if baseline_filter(items, **filters) != filter_tourism_items(items, **filters):
+            raise AssertionError("이전 구현과 필터링 결과가 다름")
+        return lambda: baseline_filter(items, **filters)
+
+
+for _count in (10, 20, 1000, 5000):
+    _filter_pair(_count)
+
+
+@benchmark("filter.all_5k")
+def bench_filter_all() -> Bench:
+    return _filter_bench(5000, theme="힐링", indoor_outdoor="outdoor", difficulty="medium", max_time=120)
+
+
+@benchmark("filter.distance_5k")
+def bench_filter_distance() -> Bench:
+    return _filter_bench(5000, max_distance_km=10.0, center=(129.07, 35.18))
+
+
+@benchmark("filter.features_cold_1k")
+def bench_filter_cold() -> Bench:
+    """contentid 특징 캐시가 비어 있는 경우 (새 아이템)"""
+    from app.utils import filter as filter_module
+    items = make_items(1000)
+
+    def run():
+        filter_module._feature_cache.clear()
+        return filter_module.filter_tourism_items(items, theme="가족", indoor_outdoor="indoor")
+    return run
+
+
+@benchmark("rank.rank_items_lexical_200")
+def bench_rank() -> Bench:
+    from app.utils.query_parser import parse_query
+    from app.utils.ranking import rank_items
+    items = make_items(200)
+    parsed = parse_query(QUERIES[0])
+    return lambda: rank_items(items, parsed, top_k=10)
+
+
+@benchmark("route.plan_route_10")
+def bench_route() -> Bench:
+    from app.utils.route import plan_route
+    items = make_items(300)
+    busan = [item for item in items if item["areacode"] == "6"][:10]
+    return lambda: plan_route(busan, max_time=300)
+
+
+# ==========================
+# 컨텍스트 구성
+# ==========================
+@benchmark("context.format_items_10")
+def bench_format_items() -> Bench:
+    """CourseGenerator.format_tourism_items_for_context와 같은 포맷팅"""
+    from app.llm.context import format_item_block
+    items = make_items(10)
+    return lambda: "\n\n".join(format_item_block(idx, item) for idx, item in enumerate(items[:10], 1))
+
+
+@benchmark("context.build_course_context_10")
+def bench_build_context() -> Bench:
+    from app.llm.context import build_course_context
+    items = make_items(13)
+    documents = [
+        {"document": f"여행지명: {item['title']}\n주소: {item['addr1']}", "metadata": {"contentid": item["contentid"]}}
+        for item in items[7:]
+    ]
+    return lambda: build_course_context(items[:10], documents, token_budget=1200)
+
+
+# ==========================
+# LLM 응답 후처리
+# ==========================
+def _import_chain():
+    try:
+        from app.llm import chain
+    except ImportError as e:
+        raise Skip(f"app.llm.chain import 실패: {str(e)}")
+    return chain
+
+
+@benchmark("llm.parse_course_content")
+def bench_parse_course() -> Bench:
+    chain = _import_chain()
+    text = course_response_text(fenced=True)
+    return lambda: chain.parse_course_content(text)
+
+
+@benchmark("llm.stream_parser_32b_chunks")
+def bench_stream_parser() -> Bench:
+    chain = _import_chain()
+    text = course_response_text(fenced=False)
+    chunks = [text[idx:idx + 32] for idx in range(0, len(text), 32)]
+
+    def run():
+        parser = chain.CourseItemStreamParser()
+        return [item for chunk in chunks for item in parser.feed(chunk)]
+    return run
+
+
+@benchmark("llm.build_fallback_course")
+def bench_fallback_course() -> Bench:
+    chain = _import_chain()
+    items = make_items(10)
+    return lambda: chain.build_fallback_course(items)
+
+
+# ==========================
+# RAG (임시 Chroma 디렉토리)
+# ==========================
+_rag_state: Dict[str, Any] = {}
+
+
+def _get_bench_rag():
+    """임시 디렉토리에 Chroma를 여는 RAG 인스턴스 (벤치마크 전체에서 하나)"""
+    if "rag" in _rag_state:
+        return _rag_state["rag"]
+    try:
+        from app.llm.rag import TourismRAG
+        from app.utils.config import settings
+    except ImportError as e:
+        raise Skip(f"RAG 의존성 없음: {str(e)}")
+
+    directory = tempfile.mkdtemp(prefix="bench_chroma_")
+    _CLEANUPS.append(lambda: shutil.rmtree(directory, ignore_errors=True))
+    original = settings.chroma_persist_directory
+    settings.chroma_persist_directory = directory
+    try:
+        rag = TourismRAG()
+        rag.embedder.embed(["워밍업"])
+    except Exception as e:
+        raise Skip(f"임베딩 모델/Chroma 초기화 실패: {str(e)}")
+    finally:
+        settings.chroma_persist_directory = original
+    _CLEANUPS.append(rag.embedder.close)
+    _rag_state["rag"] = rag
+    return rag
+
+
+@benchmark("rag.add_documents_new_20")
+def bench_rag_add_new() -> Bench:
+    rag = _get_bench_rag()
+    base = make_items(20)
+    state = {"batch": 0}
+
+    def run():
+        # 매번 새 contentid로 임베딩 + upsert
+        state["batch"] += 1
+        offset = state["batch"] * 1000
+        items = [{**item, "contentid": str(int(item["contentid"]) + offset * 100)} for item in base]
+        return rag.add_tourism_documents(items)
+    return run
+
+
+@benchmark("rag.add_documents_unchanged_20")
+def bench_rag_add_unchanged() -> Bench:
+    rag = _get_bench_rag()
+    items = make_items(20, seed=7)
+    rag.add_tourism_documents(items)
+    return lambda: rag.add_tourism_documents(items)
+
+
+@benchmark("rag.search_relevant_documents")
+def bench_rag_search() -> Bench:
+    rag = _get_bench_rag()
+    rag.add_tourism_documents(make_items(200, seed=11))
+    next_query = _cycle(QUERIES)
+    return lambda: rag.search_relevant_documents(next_query(), n_results=3)
+
+
+# ==========================
+# 측정 / 저장 / 비교
+# ==========================
+def measure(fn: Bench, rounds: int, min_time: float) -> Dict[str, Any]:
+    """1회 실행 시간 통계 (µs)"""
+    fn()  # 워밍업
+
+    # 한 라운드가 min_time 이상이 되도록 반복 횟수 결정
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number * 1e6)
+
+    return {
+        "number": number,
+        "rounds": rounds,
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(
+    selected: Optional[List[str]] = None,
+    rounds: int = 7,
+    min_time: float = 0.05
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, setup in BENCHMARKS:
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        try:
+            fn = setup()
+            results[name] = measure(fn, rounds=rounds, min_time=min_time)
+            print(f"{name:40s} {results[name]['median_us']:>12.1f} µs (x{results[name]['number']})")
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+            print(f"{name:40s} {'건너뜀':>12s}  {str(e)[:80]}")
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": rounds,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """중앙값 기준 비교, threshold(비율) 이상 느려진 벤치마크 이름 목록 반환"""
+    regressions = []
+    print(f"\n기준: {baseline['meta'].get('commit')} → 현재: {current['meta'].get('commit')}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if "median_us" not in result or not before or "median_us" not in before:
+            continue
+        ratio = result["median_us"] / before["median_us"] if before["median_us"] else float("inf")
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  << 회귀"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            mark = "  (개선)"
+        print(f"{name:40s} {before['median_us']:>12.1f} → {result['median_us']:>12.1f} µs  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 마이크로 벤치마크")
+    parser.add_argument("--only", nargs="*", help="이름 접두사로 선택 (예: filter. rag.)")
+    parser.add_argument("--rounds", type=int, default=7, help="측정 라운드 수")
+    parser.add_argument("--min-time", type=float, default=0.05, help="라운드당 최소 측정 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 중앙값 증가 비율")
+    args = parser.parse_args()
+
+    try:
+        current = run_benchmarks(args.only, rounds=args.rounds, min_time=args.min_time)
+    finally:
+        for cleanup in _CLEANUPS:
+            cleanup()
+
+    output = args.output or os.path.join(
+        os.path.dirname(__file__), "results", f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(current, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(current, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
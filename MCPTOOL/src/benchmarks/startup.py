@@ -0,0 +1,113 @@
+"""서버 시작 시간 측정
+
+- import: 새 인터프리터에서 `import app.main`에 걸리는 시간 (중앙값)과 함께 불러온 무거운 라이브러리
+- serve: uvicorn 프로세스 시작부터 /health 응답(소켓 열림), /ready 200(워밍업 완료),
+  첫 정상 응답(2xx)까지 걸린 시간
+
+실행:
+    python -m benchmarks.startup --repeat 5
+    python -m benchmarks.startup --serve --endpoint recommend --query "부산 바다 코스"
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Optional
+import httpx
+
+
+HEAVY_MODULES = ["chromadb", "torch", "sentence_transformers", "google.generativeai", "grpc"]
+
+_IMPORT_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "heavy": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_import(repeat: int) -> Dict[str, Any]:
+    """새 프로세스에서 app.main import 시간 repeat회 측정"""
+    samples = []
+    heavy = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SNIPPET], capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        samples.append(result["seconds"])
+        heavy = result["heavy"]
+    return {
+        "repeat": repeat,
+        "median_seconds": round(statistics.median(samples), 3),
+        "min_seconds": round(min(samples), 3),
+        "heavy_modules_loaded": heavy,
+    }
+
+
+def _poll(client: httpx.Client, method: str, path: str, timeout: float, **kwargs) -> Optional[float]:
+    """2xx 응답이 올 때까지 반복 요청, 성공 시각(perf_counter) 반환"""
+    stop_at = time.perf_counter() + timeout
+    while time.perf_counter() < stop_at:
+        try:
+            response = client.request(method, path, **kwargs)
+            if response.status_code < 300:
+                return time.perf_counter()
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+    return None
+
+
+def measure_serve(port: int, endpoint: str, query: str, timeout: float) -> Dict[str, Any]:
+    """uvicorn 실행 후 /health, /ready, 첫 정상 응답까지 시간 측정"""
+    if endpoint == "recommend":
+        request = ("POST", "/travel/recommend", {"json": {"query": query}})
+    else:
+        request = ("POST", "/travel/search", {"json": {"region": "부산", "keyword": "해수욕장"}})
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=os.environ.copy(),
+    )
+    result: Dict[str, Any] = {"endpoint": request[1]}
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            listening = _poll(client, "GET", "/health", timeout)
+            result["listening_seconds"] = round(listening - started, 3) if listening else None
+            ready = _poll(client, "GET", "/ready", timeout)
+            result["ready_seconds"] = round(ready - started, 3) if ready else None
+            if ready is None:
+                result["ready_detail"] = client.get("/ready").json()
+            method, path, kwargs = request
+            first = _poll(client, method, path, timeout, **kwargs)
+            result["first_success_seconds"] = round(first - started, 3) if first else None
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="import 측정 반복 횟수")
+    parser.add_argument("--serve", action="store_true", help="uvicorn을 띄워 준비/첫 응답 시간까지 측정")
+    parser.add_argument("--port", type=int, default=8123)
+    parser.add_argument("--endpoint", choices=["search", "recommend"], default="search")
+    parser.add_argument("--query", default="부산에서 3시간 바다 코스 추천해줘")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {"import": measure_import(args.repeat)}
+    if args.serve:
+        report["serve"] = measure_serve(args.port, args.endpoint, args.query, args.timeout)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""부하 테스트 도구
+
+공공데이터 API 모의 서버(mock_tourism)와 부하 생성기(run)로 구성됩니다.
+LLM은 서버 설정 LLM_BACKEND=fake로 가짜 모델(app.llm.fake)을 사용합니다.
+
+    python -m loadtest.mock_tourism --port 9100
+    TOURISM_API_URL=http://127.0.0.1:9100/B551011/KorService2/searchKeyword2 LLM_BACKEND=fake \\
+        uvicorn app.main:app --port 8000
+    python -m loadtest.run --base-url http://127.0.0.1:8000 --concurrency 8 32
+"""
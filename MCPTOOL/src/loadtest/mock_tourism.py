@@ -0,0 +1,255 @@
+"""공공데이터 KorService2 모의 서버 (searchKeyword2 / areaBasedList2 / detailCommon2)
+
+benchmarks.corpus의 합성 여행지로 실제 API와 같은 JSON 구조를 응답하고,
+지연 분포와 오류(HTTP 5xx, XML 에러, resultCode 에러, 응답 없음)를 확률로 섞습니다.
+
+실행:
+    python -m loadtest.mock_tourism --port 9100 --latency-ms 150 --latency-sigma 0.5 \\
+        --http-error-rate 0.02 --xml-error-rate 0.02
+
+서버 쪽 설정 (.env 또는 환경 변수):
+    TOURISM_API_URL=http://127.0.0.1:9100/B551011/KorService2/searchKeyword2
+    TOURISM_AREA_LIST_URL=http://127.0.0.1:9100/B551011/KorService2/areaBasedList2
+    TOURISM_DETAIL_URL=http://127.0.0.1:9100/B551011/KorService2/detailCommon2
+"""
+import argparse
+import asyncio
+import random
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from benchmarks.corpus import make_items
+
+
+# 실제 게이트웨이/서비스가 돌려주는 XML 에러 (코드, 메시지)
+XML_GATEWAY_ERRORS = [
+    ("22", "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR"),
+    ("30", "SERVICE_KEY_IS_NOT_REGISTERED_ERROR"),
+    ("01", "APPLICATION_ERROR"),
+    ("04", "HTTP_ERROR"),
+]
+XML_SERVICE_ERRORS = [
+    ("05", "SERVICE_TIMEOUT_ERROR"),
+    ("99", "UNKNOWN_ERROR"),
+]
+# JSON 본문 resultCode 에러
+RESULT_CODE_ERRORS = [
+    ("02", "DB_ERROR"),
+    ("10", "INVALID_REQUEST_PARAMETER_ERROR"),
+    ("99", "UNKNOWN_ERROR"),
+]
+
+
+@dataclass
+class MockConfig:
+    """모의 서버 동작 설정 (확률은 요청마다 독립적으로 적용)"""
+    items: int = 20000
+    latency_ms: float = 150.0  # 지연 중앙값
+    latency_sigma: float = 0.5  # 로그정규 분포 폭 (0이면 고정 지연)
+    http_error_rate: float = 0.0  # HTTP 500/502/503 + "Unexpected errors"
+    xml_error_rate: float = 0.0  # HTTP 200 + XML 에러 본문
+    result_error_rate: float = 0.0  # HTTP 200 + JSON resultCode 에러
+    hang_rate: float = 0.0  # 클라이언트 읽기 타임아웃을 넘길 만큼 응답 지연
+    hang_seconds: float = 30.0
+    strict: bool = False  # True면 실제 API처럼 일치하는 항목만 (없으면 빈 결과)
+    seed: int = 7
+
+
+@dataclass
+class MockStats:
+    requests: int = 0
+    ok: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"requests": self.requests, "ok": self.ok, "errors": dict(self.errors)}
+
+
+def _xml_gateway_error(code: str, message: str) -> str:
+    return (
+        "<OpenAPI_ServiceResponse>\n"
+        "\t<cmmMsgHeader>\n"
+        "\t\t<errMsg>SERVICE ERROR</errMsg>\n"
+        f"\t\t<returnAuthMsg>{message}</returnAuthMsg>\n"
+        f"\t\t<returnReasonCode>{code}</returnReasonCode>\n"
+        "\t</cmmMsgHeader>\n"
+        "</OpenAPI_ServiceResponse>"
+    )
+
+
+def _xml_service_error(code: str, message: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<response><header><resultCode>{code}</resultCode><resultMsg>{message}</resultMsg></header></response>"
+    )
+
+
+def _page_response(items: List[Dict[str, Any]], total: int, num_of_rows: int, page_no: int) -> Dict[str, Any]:
+    return {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {
+                # 실제 API는 결과가 없으면 items를 빈 문자열로 내려줌
+                "items": {"item": items} if items else "",
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": total,
+            },
+        }
+    }
+
+
+def _detail_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """detailCommon2 형태 상세정보 (개요는 실제 응답처럼 <br> 태그 포함)"""
+    overview = (
+        f"{item['title']}은(는) {item['addr1']}에 있는 여행지입니다.<br>"
+        "사계절 내내 방문객이 많으며 주변 산책로와 전망이 좋아 가족, 연인 단위 여행객에게 인기가 높습니다.<br>"
+        "주차 공간이 마련되어 있고 대중교통으로도 쉽게 찾아갈 수 있습니다."
+    )
+    return {
+        **item,
+        "overview": overview,
+        "homepage": f'<a href="https://example.com/{item["contentid"]}" target="_blank">example.com</a>',
+    }
+
+
+def create_app(config: MockConfig) -> FastAPI:
+    """설정에 따라 동작하는 모의 서버 앱"""
+    app = FastAPI(title="KorService2 Mock")
+    rng = random.Random(config.seed)
+    catalog = make_items(config.items)
+    by_id = {item["contentid"]: item for item in catalog}
+    by_area: Dict[str, List[Dict[str, Any]]] = {}
+    for item in catalog:
+        by_area.setdefault(item["areacode"], []).append(item)
+    stats = MockStats()
+
+    def latency() -> float:
+        median = config.latency_ms / 1000
+        if config.latency_sigma <= 0 or median <= 0:
+            return median
+        return rng.lognormvariate(0.0, config.latency_sigma) * median
+
+    def count_error(kind: str):
+        stats.errors[kind] = stats.errors.get(kind, 0) + 1
+
+    async def injected_failure() -> Optional[Response]:
+        """설정된 확률로 오류 응답 (없으면 None)"""
+        roll = rng.random()
+        threshold = config.hang_rate
+        if roll < threshold:
+            count_error("hang")
+            await asyncio.sleep(config.hang_seconds)
+            return JSONResponse(_page_response([], 0, 0, 1))
+        threshold += config.http_error_rate
+        if roll < threshold:
+            count_error("http")
+            return Response("Unexpected errors", status_code=rng.choice([500, 502, 503]), media_type="text/plain")
+        threshold += config.xml_error_rate
+        if roll < threshold:
+            count_error("xml")
+            if rng.random() < 0.5:
+                body = _xml_gateway_error(*rng.choice(XML_GATEWAY_ERRORS))
+            else:
+                body = _xml_service_error(*rng.choice(XML_SERVICE_ERRORS))
+            return Response(body, media_type="text/xml")
+        threshold += config.result_error_rate
+        if roll < threshold:
+            count_error("result_code")
+            code, message = rng.choice(RESULT_CODE_ERRORS)
+            return JSONResponse({"response": {"header": {"resultCode": code, "resultMsg": message}}})
+        return None
+
+    def select(area_code: Optional[str], keyword: Optional[str]) -> List[Dict[str, Any]]:
+        pool = by_area.get(area_code, []) if area_code else catalog
+        if not keyword:
+            return pool
+        matched = [item for item in pool if keyword in item["title"] or keyword in item["addr1"]]
+        if matched or config.strict or not pool:
+            return matched
+        # 합성 제목에 없는 키워드도 결과가 나오도록 키워드별로 고정된 일부를 반환
+        start = zlib.crc32(keyword.encode("utf-8")) % len(pool)
+        return (pool[start:] + pool[:start])[:max(len(pool) // 20, 5)]
+
+    async def serve(request: Request, keyword_required: bool) -> Response:
+        stats.requests += 1
+        await asyncio.sleep(latency())
+        failure = await injected_failure()
+        if failure is not None:
+            return failure
+
+        params = request.query_params
+        keyword = params.get("keyword")
+        if keyword_required and not keyword:
+            count_error("result_code")
+            return JSONResponse({"response": {"header": {"resultCode": "10", "resultMsg": "INVALID_REQUEST_PARAMETER_ERROR"}}})
+
+        num_of_rows = int(params.get("numOfRows", 10) or 10)
+        page_no = int(params.get("pageNo", 1) or 1)
+        matched = select(params.get("areaCode"), keyword)
+        start = (page_no - 1) * num_of_rows
+        stats.ok += 1
+        return JSONResponse(_page_response(matched[start:start + num_of_rows], len(matched), num_of_rows, page_no))
+
+    @app.get("/B551011/KorService2/searchKeyword2")
+    async def search_keyword(request: Request):
+        return await serve(request, keyword_required=True)
+
+    @app.get("/B551011/KorService2/areaBasedList2")
+    async def area_based_list(request: Request):
+        return await serve(request, keyword_required=False)
+
+    @app.get("/B551011/KorService2/detailCommon2")
+    async def detail_common(request: Request):
+        stats.requests += 1
+        await asyncio.sleep(latency())
+        failure = await injected_failure()
+        if failure is not None:
+            return failure
+        item = by_id.get(request.query_params.get("contentId", ""))
+        stats.ok += 1
+        return JSONResponse(_page_response([_detail_item(item)] if item else [], 1 if item else 0, 1, 1))
+
+    @app.get("/_stats")
+    async def mock_stats():
+        return stats.as_dict()
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KorService2 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--items", type=int, default=20000, help="합성 여행지 수")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="지연 중앙값 (ms)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="지연 로그정규 분포 폭 (0이면 고정)")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="HTTP 5xx 비율")
+    parser.add_argument("--xml-error-rate", type=float, default=0.0, help="XML 에러 본문 비율")
+    parser.add_argument("--result-error-rate", type=float, default=0.0, help="JSON resultCode 에러 비율")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="응답 지연(타임아웃 유발) 비율")
+    parser.add_argument("--hang-seconds", type=float, default=30.0)
+    parser.add_argument("--strict", action="store_true", help="일치하는 항목이 없으면 빈 결과")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        items=args.items,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        http_error_rate=args.http_error_rate,
+        xml_error_rate=args.xml_error_rate,
+        result_error_rate=args.result_error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        strict=args.strict,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
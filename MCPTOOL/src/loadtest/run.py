@@ -0,0 +1,189 @@
+"""부하 생성기
+
+실행 중인 서버에 동시 요청을 보내고 엔드포인트별 처리량(RPS), 지연 백분위(p50/p95/p99), 오류율을 출력합니다.
+--concurrency에 여러 값을 주면 단계별로 차례대로 측정합니다.
+
+실행:
+    python -m loadtest.run --base-url http://127.0.0.1:8000 --concurrency 4 16 64 --duration 30 \\
+        --mix search=3 recommend=1 stream=1
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
+from benchmarks.corpus import QUERIES
+
+
+SEARCH_REQUESTS = [
+    {"region": "부산", "keyword": "해수욕장"},
+    {"region": "서울", "keyword": "박물관"},
+    {"region": "제주", "keyword": "오름"},
+    {"region": "강릉", "keyword": "카페"},
+    {"region": "경주", "keyword": "사찰"},
+    {"keyword": "전망대"},
+    {"region": "여수", "keyword": "야시장", "max_distance_km": 15.0},
+]
+
+
+@dataclass
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)  # 성공한 요청의 지연 (초)
+    errors: int = 0
+    statuses: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, status: str, elapsed: float, ok: bool):
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if ok:
+            self.latencies.append(elapsed)
+        else:
+            self.errors += 1
+
+
+def percentile(samples: List[float], q: float) -> Optional[float]:
+    """정렬된 표본의 nearest-rank 백분위수"""
+    if not samples:
+        return None
+    idx = min(len(samples) - 1, max(0, int(round(q * (len(samples) - 1)))))
+    return samples[idx]
+
+
+async def call_search(client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, bool]:
+    response = await client.post("/travel/search", json=rng.choice(SEARCH_REQUESTS))
+    return str(response.status_code), response.status_code == 200
+
+
+async def call_recommend(client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, bool]:
+    response = await client.post("/travel/recommend", json={"query": rng.choice(QUERIES)})
+    return str(response.status_code), response.status_code == 200
+
+
+async def call_stream(client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, bool]:
+    """SSE 스트림을 done 이벤트까지 읽어야 성공"""
+    async with client.stream("POST", "/travel/recommend/stream", json={"query": rng.choice(QUERIES)}) as response:
+        if response.status_code != 200:
+            await response.aread()
+            return str(response.status_code), False
+        async for line in response.aiter_lines():
+            if line.startswith("event: done"):
+                return "200", True
+            if line.startswith("event: error"):
+                return "sse_error", False
+    return "sse_incomplete", False
+
+
+ENDPOINTS = {
+    "search": call_search,
+    "recommend": call_recommend,
+    "stream": call_stream,
+}
+
+
+def parse_mix(values: List[str]) -> Dict[str, float]:
+    """["search=3", "recommend=1"] → {"search": 3.0, "recommend": 1.0}"""
+    mix: Dict[str, float] = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        if name not in ENDPOINTS:
+            raise SystemExit(f"알 수 없는 엔드포인트: {name} (가능: {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+async def run_level(
+    base_url: str,
+    concurrency: int,
+    duration: float,
+    mix: Dict[str, float],
+    timeout: float,
+    seed: int
+) -> Dict[str, Any]:
+    """동시성 concurrency로 duration초 동안 요청"""
+    stats = {name: EndpointStats() for name in mix}
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        stop_at = started + duration
+
+        async def worker(worker_id: int):
+            rng = random.Random(seed * 1000 + worker_id)
+            while time.perf_counter() < stop_at:
+                name = rng.choices(names, weights)[0]
+                request_started = time.perf_counter()
+                try:
+                    status, ok = await ENDPOINTS[name](client, rng)
+                except httpx.TimeoutException:
+                    status, ok = "timeout", False
+                except httpx.HTTPError as e:
+                    status, ok = type(e).__name__, False
+                stats[name].record(status, time.perf_counter() - request_started, ok)
+
+        await asyncio.gather(*(worker(idx) for idx in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    report: Dict[str, Any] = {"concurrency": concurrency, "elapsed": round(elapsed, 2), "endpoints": {}}
+    for name, endpoint in stats.items():
+        latencies = sorted(endpoint.latencies)
+        total = len(latencies) + endpoint.errors
+        report["endpoints"][name] = {
+            "requests": total,
+            "rps": round(total / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(endpoint.errors / total, 4) if total else 0.0,
+            "p50_ms": _ms(percentile(latencies, 0.50)),
+            "p95_ms": _ms(percentile(latencies, 0.95)),
+            "p99_ms": _ms(percentile(latencies, 0.99)),
+            "statuses": endpoint.statuses,
+        }
+    return report
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"\n동시성 {report['concurrency']} ({report['elapsed']}초)")
+    print(f"{'엔드포인트':12s} {'요청':>7s} {'RPS':>8s} {'오류율':>7s} {'p50':>9s} {'p95':>9s} {'p99':>9s}  상태")
+    for name, row in report["endpoints"].items():
+        cells = [f"{row[key]:>9.1f}" if row[key] is not None else f"{'-':>9s}" for key in ("p50_ms", "p95_ms", "p99_ms")]
+        statuses = ", ".join(f"{status}:{count}" for status, count in sorted(row["statuses"].items()))
+        print(
+            f"{name:12s} {row['requests']:>7d} {row['rps']:>8.2f} {row['error_rate'] * 100:>6.1f}% "
+            f"{' '.join(cells)}  {statuses}"
+        )
+
+
+async def main_async(args: argparse.Namespace):
+    mix = parse_mix(args.mix)
+    reports = []
+    for concurrency in args.concurrency:
+        report = await run_level(args.base_url, concurrency, args.duration, mix, args.timeout, args.seed)
+        print_report(report)
+        reports.append(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"base_url": args.base_url, "mix": mix, "levels": reports}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TravelGenie 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8], help="동시 요청 수 (여러 개면 단계별 측정)")
+    parser.add_argument("--duration", type=float, default=30.0, help="단계별 측정 시간 (초)")
+    parser.add_argument("--mix", nargs="+", default=["search=3", "recommend=1"], help="엔드포인트=가중치")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="결과 JSON 경로")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
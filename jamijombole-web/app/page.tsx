@@ -136,12 +136,60 @@ interface CourseItem {
 interface RecommendResponse {
   course: CourseItem[];
   summary: string;
+  timings?: Record<string, number>;
+}
+
+// 스트리밍 단계 표시 문구
+const STAGE_LABELS: Record<string, string> = {
+  parse: '요청을 분석하는 중...',
+  search: '여행지를 검색하는 중...',
+  filter: '조건에 맞는 여행지를 고르는 중...',
+  context: '여행지 정보를 정리하는 중...',
+  generate: '코스를 만드는 중...',
+};
+
+// 서버 단계별 처리 시간 표시 이름
+const TIMING_LABELS: Record<string, string> = {
+  parse: '분석',
+  search: '검색',
+  filter: '필터',
+  rank: '랭킹',
+  route: '동선',
+  enrich: '상세정보',
+  rag_upsert: '문서 저장',
+  rag_query: '문서 검색',
+  context: '컨텍스트',
+  llm: '코스 생성',
+};
+
+function formatTimings(timings: Record<string, number>): string {
+  return Object.entries(timings)
+    .map(([name, ms]) => `${TIMING_LABELS[name] ?? name} ${Math.round(ms)}ms`)
+    .join(' · ');
+}
+
+// SSE 프레임 파싱 ("event: ...\ndata: ...")
+function parseSseFrame(frame: string): { event: string; data: any } | null {
+  let event = 'message';
+  const dataLines: string[] = [];
+  for (const line of frame.split('\n')) {
+    if (line.startsWith('event:')) {
+      event = line.slice(6).trim();
+    } else if (line.startsWith('data:')) {
+      dataLines.push(line.slice(5).trim());
+    }
+  }
+  if (dataLines.length === 0) {
+    return null;
+  }
+  return { event, data: JSON.parse(dataLines.join('\n')) };
 }
 
 export default function Home() {
   const [input, setInput] = useState('');
   const [result, setResult] = useState<RecommendResponse | null>(null);
   const [loading, setLoading] = useState(false);
+  const [stage, setStage] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
 
   const handleSubmit = async (e: React.FormEvent) => {
@@ -149,9 +197,10 @@ export default function Home() {
     setLoading(true);
     setError(null);
     setResult(null);
+    setStage(null);
 
     try {
-      const response = await fetch('http://localhost:8000/travel/recommend', {
+      const response = await fetch('http://localhost:8000/travel/recommend/stream', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -159,17 +208,51 @@ export default function Home() {
         body: JSON.stringify({ query: input }),
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         const errorData = await response.json();
         throw new Error(errorData.detail || '코스 추천에 실패했습니다.');
       }
 
-      const data: RecommendResponse = await response.json();
-      setResult(data);
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+          break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary >= 0) {
+          const frame = parseSseFrame(buffer.slice(0, boundary));
+          buffer = buffer.slice(boundary + 2);
+          boundary = buffer.indexOf('\n\n');
+          if (!frame) {
+            continue;
+          }
+
+          if (frame.event === 'stage') {
+            setStage(frame.data.stage);
+          } else if (frame.event === 'item') {
+            // 코스 아이템은 생성되는 즉시 화면에 추가
+            setResult((prev) => ({
+              course: [...(prev?.course ?? []), frame.data as CourseItem],
+              summary: prev?.summary ?? '',
+            }));
+          } else if (frame.event === 'done') {
+            setResult(frame.data as RecommendResponse);
+          } else if (frame.event === 'error') {
+            throw new Error(frame.data.detail || '코스 추천에 실패했습니다.');
+          }
+        }
+      }
     } catch (err: any) {
       setError(err.message);
     } finally {
       setLoading(false);
+      setStage(null);
     }
   };
 
@@ -183,7 +266,7 @@ export default function Home() {
           placeholder="어떤 여행을 원하시나요? 예: '강릉으로 떠나는 힐링 여행'"
         />
         <Button type="submit" disabled={loading || !input}>
-          {loading ? '추천받는 중...' : '코스 추천받기'}
+          {loading ? (stage && STAGE_LABELS[stage]) || '추천받는 중...' : '코스 추천받기'}
         </Button>
       </Form>
 
@@ -193,7 +276,10 @@ export default function Home() {
         <ResultSection>
           <Summary>
             <h2>여행 요약</h2>
-            <p>{result.summary}</p>
+            <p>{result.summary || '요약을 작성하는 중...'}</p>
+            {result.timings && (
+              <p><small>처리 시간: {formatTimings(result.timings)}</small></p>
+            )}
           </Summary>
           
           <h2>추천 코스</h2>